@@ -1,4 +1,4 @@
-class RobotisOP2TTSException(BaseException):
+class RobotisOP2TTSException(Exception):
     """
     Parent class for all available exceptions that may occur in work of Robotis OP2 Text-to-Speech (TTS).
     """
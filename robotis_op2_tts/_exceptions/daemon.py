@@ -0,0 +1,41 @@
+from .base import RobotisOP2TTSException
+
+
+class DaemonNotAvailableException(RobotisOP2TTSException):
+    """
+    TTS daemon not available exception class.
+        - Daemon socket does not exist or daemon does not accept connections.
+    """
+    def __init__(self, str_path_socket):
+        super(DaemonNotAvailableException, self).__init__("TTS daemon is not available. Socket path = %s."
+                                                          % str_path_socket)
+
+
+class DaemonSocketInUseException(RobotisOP2TTSException):
+    """
+    TTS daemon socket in use exception class.
+        - Another daemon already serves socket path.
+    """
+    def __init__(self, str_path_socket):
+        super(DaemonSocketInUseException, self).__init__("TTS daemon socket is already in use. Socket path = %s."
+                                                         % str_path_socket)
+
+
+class DaemonRequestFailedException(RobotisOP2TTSException):
+    """
+    TTS daemon request failed exception class.
+        - Daemon rejected request or failed to process it.
+    """
+    def __init__(self, str_command, str_error):
+        super(DaemonRequestFailedException, self).__init__("TTS daemon request '%s' fails: %s"
+                                                           % (str_command, str_error))
+
+
+class DaemonRequestTimeoutException(RobotisOP2TTSException):
+    """
+    TTS daemon request timeout exception class.
+        - Daemon does not respond in socket timeout, request may still be processed.
+    """
+    def __init__(self, str_command, float_timeout):
+        super(DaemonRequestTimeoutException, self).__init__("TTS daemon request '%s' times out in %s seconds."
+                                                            % (str_command, float_timeout))
@@ -0,0 +1,10 @@
+from .base import RobotisOP2TTSException
+
+
+class AudioPlaybackInterruptedException(RobotisOP2TTSException):
+    """
+    Audio playback interrupted exception class.
+        - Playback is stopped or skipped on purpose, so speech must not be repeated by another TTS engine.
+    """
+    def __init__(self, str_name_audio):
+        super(AudioPlaybackInterruptedException, self).__init__("Playback of %s is interrupted." % str_name_audio)
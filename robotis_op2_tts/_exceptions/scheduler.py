@@ -0,0 +1,18 @@
+from .base import RobotisOP2TTSException
+
+
+class SchedulerQueueFullException(RobotisOP2TTSException):
+    """
+    Scheduler queue is full exception class.
+        - No one queued request has lower priority than submitted one.
+    """
+    def __init__(self, int_size_queue):
+        super(SchedulerQueueFullException, self).__init__("Scheduler queue is full. Queue size = %s." % int_size_queue)
+
+
+class SchedulerClosedException(RobotisOP2TTSException):
+    """
+    Scheduler is closed exception class.
+    """
+    def __init__(self):
+        super(SchedulerClosedException, self).__init__("Scheduler is closed, request can not be submitted.")
@@ -73,3 +73,25 @@ class NetworkSpeedNotApplicableException(TTSGoogleCloudException):
     """
     def __init__(self):
         super(NetworkSpeedNotApplicableException, self).__init__("Network speed is not applicable, so cloud TTS can't work properly.")
+
+
+class VoiceNotFoundException(TTSGoogleCloudException):
+    """
+    Voice not found exception class.
+        - Voice name is absent in voice catalogue.
+    """
+    def __init__(self, str_name_voice):
+        super(VoiceNotFoundException, self)\
+            .__init__("Google Cloud TTS voice '%s' is not available. Use 'voices' command to list available voices."
+                      % str_name_voice)
+
+
+class VoiceLanguageNotSupportedException(TTSGoogleCloudException):
+    """
+    Voice language not supported exception class.
+        - Voice does not support language code.
+    """
+    def __init__(self, str_name_voice, str_language_code, list_language_codes):
+        super(VoiceLanguageNotSupportedException, self)\
+            .__init__("Google Cloud TTS voice '%s' does not support language '%s'. Supported languages: %s."
+                      % (str_name_voice, str_language_code, ", ".join(list_language_codes)))
@@ -25,3 +25,13 @@ class LanguageNotSupportedException(TTSFestivalException):
         super(LanguageNotSupportedException, self)\
             .__init__("Festival TTS does not support %s language."
                       % str_language)
+
+
+class FestivalServerException(TTSFestivalException):
+    """
+    Festival TTS server is not able to process request.
+    """
+    def __init__(self, str_reason):
+        super(FestivalServerException, self)\
+            .__init__("Festival TTS server is not able to process request: %s."
+                      % str_reason)
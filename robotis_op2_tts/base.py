@@ -17,6 +17,31 @@ class InterfaceTTSClient(object):
         """
         pass
 
+    def synthesize_audio_content(self, source_text):
+        """
+        Returns audio with passed source_text spoken without audio file round trip.
+
+        * TTS synthesis method will be chosen by priority.
+        * Audio is cached on disk only as optional side effect.
+
+        :param source_text: string or file with text for synthesize.
+        :return: str - binary audio content (None if synthesis fails).
+        """
+        pass
+
+    def synthesize_audio_batch(self, list_source_texts, max_workers=None):
+        """
+        Creates audio files for several source texts concurrently.
+
+        * Failure of one source text does not abort synthesis of others.
+
+        :param list_source_texts: list of strings or files with text for synthesize.
+        :param max_workers: int - max number of concurrent synthesis jobs (None - TTS client default).
+        :return: list - tuples (bool - indicator of succeeded synthesis, string - path to synthesized file or error)
+            in order of list_source_texts.
+        """
+        pass
+
     def synthesize_speech(self, source_text):
         """
         Speaks passed source_text in real time.
@@ -0,0 +1,356 @@
+"""
+Robotis OP2 Text-to-Speech (TTS) end-to-end latency benchmark.
+
+Drives RobotisOP2TTSClient against local stand-ins of TTS engines (see ./benchmark_stand_ins),
+so neither Google credentials nor installed Festival are required:
+    - fake Google Cloud TTS backend with configurable delay and failure mode;
+    - fake `festival` / `text2wave` scripts with configurable delay;
+    - null audio file player.
+
+Scenarios:
+    - cold_start - client construction and first spoken request;
+    - cache_hit - spoken request which audio file is already cached;
+    - cache_miss - spoken request with unique text;
+    - fallback - spoken request while cloud TTS fails;
+    - long_document - spoken request of long multi-sentence document (pipelined speech);
+    - batch - batch synthesis of unique texts.
+
+Time-to-first-audio (TTFA) is time from request start until first audio file is passed to audio player
+(until request end if speech is played by TTS engine itself).
+
+Usage:
+
+    $ python benchmark.py -h
+    usage: benchmark.py [-h] [-n ITERATIONS] [-o OUTPUT] ...
+
+Report is printed (or written to OUTPUT file) as JSON:
+
+    {
+      "params": {...},
+      "scenarios": {
+        "<scenario>": {
+          "count": <int_value>,                     - number of requests.
+          "failures": <int_value>,                  - number of failed requests.
+          "ttfa_ms": {"p50": .., "p95": .., "p99": .., "mean": ..},
+          "duration_ms": {"p50": .., "p95": .., "p99": .., "mean": ..},
+          "throughput_rps": <float_value>           - requests (texts for batch) per second.
+        }
+      }
+    }
+"""
+import os
+import sys
+import time
+
+STR_PATH_DIR_STAND_INS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_stand_ins")
+
+LIST_SCENARIOS = ["cold_start", "cache_hit", "cache_miss", "fallback", "long_document", "batch"]
+
+
+class TTFARecorder(object):
+    """
+    Time-to-first-audio recorder class.
+        - Wraps AudioFilePlayer.enqueue to record time when first audio file of request is passed to player.
+    """
+    float_time_first_audio = None   # time of first enqueue since last reset, seconds since epoch
+
+    def install(self):
+        """
+        Wraps AudioFilePlayer.enqueue.
+
+        :return: None.
+        """
+        from player import AudioFilePlayer
+
+        recorder = self
+        enqueue = AudioFilePlayer.enqueue
+
+        def _enqueue(player, str_path_file_audio):
+            if recorder.float_time_first_audio is None:
+                recorder.float_time_first_audio = time.time()
+            return enqueue(player, str_path_file_audio)
+
+        AudioFilePlayer.enqueue = _enqueue
+
+    def reset(self):
+        """
+        Resets recorded time before next request.
+
+        :return: None.
+        """
+        self.float_time_first_audio = None
+
+
+def get_percentile(list_values, float_percent):
+    """
+    Returns percentile of values by nearest-rank method.
+
+    :param list_values: list - values.
+    :param float_percent: float - percent in range (0, 100].
+    :return: float - percentile (None if there are no values).
+    """
+    import math
+
+    if not list_values:
+        return None
+    list_values = sorted(list_values)
+    int_rank = int(math.ceil(float_percent / 100.0 * len(list_values)))
+    return list_values[max(0, int_rank - 1)]
+
+
+def get_summary(list_values):
+    """
+    Returns summary of latencies.
+
+    :param list_values: list - latencies, seconds.
+    :return: dict - p50/p95/p99/mean latencies, ms.
+    """
+    dict_summary = {}
+    for str_name, float_percent in (("p50", 50), ("p95", 95), ("p99", 99)):
+        float_value = get_percentile(list_values, float_percent)
+        dict_summary[str_name] = None if float_value is None else round(float_value * 1000.0, 3)
+    dict_summary["mean"] = round(sum(list_values) / len(list_values) * 1000.0, 3) if list_values else None
+    return dict_summary
+
+
+def start_probe_listener():
+    """
+    Starts local TCP listener that is used as network probe destination of cloud TTS.
+
+    :return: int - listener port.
+    """
+    import socket
+    from threading import Thread
+
+    _socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    _socket.bind(("127.0.0.1", 0))
+    _socket.listen(16)
+
+    def _accept():
+        while True:
+            _connection, _ = _socket.accept()
+            _connection.close()
+
+    thread = Thread(target=_accept, name="benchmark-probe-listener")
+    thread.daemon = True
+    thread.start()
+    return _socket.getsockname()[1]
+
+
+def write_configuration(str_path_file_config, int_port_probe):
+    """
+    Writes TTS configuration that points engines to local stand-ins.
+
+    :param str_path_file_config: string path to configuration file.
+    :param int_port_probe: int - port of local network probe listener.
+    :return: None (configuration file will be written).
+    """
+    import json
+
+    dict_config = {
+        "audio_file_format": "mp3",
+        "audio_file_player": {"name": "null_player", "command": "null_player {file}"},
+        "cache": {"size_max": 104857600, "age_max": 2592000},
+        "speech_pipeline": {"enabled": True, "queue_size": 2},
+        "tts_engines": {
+            "cloud": {
+                "priority": 0,
+                "google_cloud_tts": {
+                    "call_params": {
+                        "language_code": "en-GB",
+                        "name": "en-GB-Wavenet-A",
+                        "speaking_rate": 0.85,
+                        "pitch": 4.0,
+                        "effects_profile_id": ["large-home-entertainment-class-device"]
+                    },
+                    "network_params": {
+                        "test_ping_destination": "127.0.0.1",
+                        "test_download_destination": "127.0.0.1",
+                        "probe_port": int_port_probe,
+                        "probe_interval": 1,
+                        "probe_timeout": 1
+                    }
+                }
+            },
+            "onboard": {
+                "priority": 1,
+                "festival": {
+                    "play": {"command": "echo \"{text}\" | festival --tts", "call_params": {"--language": "english"}},
+                    "save": {"command": "echo \"{text}\" | text2wave -o {file}", "expression": "'(voice_rab_diphone)'"}
+                }
+            }
+        }
+    }
+    with open(str_path_file_config, 'w') as file_config:
+        json.dump(dict_config, file_config, indent=2)
+
+
+def prepare_environment(float_delay_onboard):
+    """
+    Prepares process environment for stand-ins.
+        - Puts stand-in programs first in PATH.
+        - Sets fake Google credentials.
+        - Marks Festival language support as validated, since stand-in has no language files.
+
+    :param float_delay_onboard: float - delay of Festival stand-in, seconds.
+    :return: None.
+    """
+    from validation_cache import get_validation_cache
+
+    os.environ['PATH'] = STR_PATH_DIR_STAND_INS + os.pathsep + os.environ.get('PATH', '')
+    os.environ['FAKE_FESTIVAL_DELAY'] = str(float_delay_onboard)
+    os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', os.path.join(STR_PATH_DIR_STAND_INS, "credentials.json"))
+    get_validation_cache().store("festival:language", {'language': 'english'},
+                                 ['/usr/share/festival/languages/', '/usr/share/festival/languages.scm'])
+
+
+def measure(recorder, function, *args):
+    """
+    Measures single request.
+
+    :param recorder: TTFARecorder - time-to-first-audio recorder.
+    :param function: callable - request.
+    :param args: arguments of request.
+    :return: tuple (bool - indicator of succeeded request, float - TTFA, seconds, float - duration, seconds).
+    """
+    recorder.reset()
+    _float_time_start = time.time()
+    result = function(*args)
+    _float_time_end = time.time()
+    float_time_first_audio = recorder.float_time_first_audio or _float_time_end
+    return bool(result), float_time_first_audio - _float_time_start, _float_time_end - _float_time_start
+
+
+def run_scenario(str_name_scenario, str_path_file_config, recorder, int_count_iterations, int_count_sentences):
+    """
+    Runs benchmark scenario.
+
+    :param str_name_scenario: string - scenario name (see LIST_SCENARIOS).
+    :param str_path_file_config: string path to configuration file.
+    :param recorder: TTFARecorder - time-to-first-audio recorder.
+    :param int_count_iterations: int - number of requests.
+    :param int_count_sentences: int - number of sentences of long document.
+    :return: dict - scenario report.
+    """
+    from tts_client import RobotisOP2TTSClient
+    from benchmark_stand_ins import google_cloud
+
+    str_prefix = "%s %s %s" % (str_name_scenario, os.getpid(), time.time())     # unique texts between runs
+    list_ttfa = []
+    list_durations = []
+    int_count_failures = 0
+    int_count_texts = int_count_iterations
+    google_cloud.BOOL_FAIL = str_name_scenario == "fallback"
+
+    def _add(tuple_measure):
+        bool_result, float_ttfa, float_duration = tuple_measure
+        list_ttfa.append(float_ttfa)
+        list_durations.append(float_duration)
+        return 0 if bool_result else 1
+
+    _float_time_start = time.time()
+    if str_name_scenario == "cold_start":
+        for _int_index in range(int_count_iterations):
+            def _cold_start():
+                return RobotisOP2TTSClient(str_path_file_config).synthesize_speech(
+                    "Cold start number %s of %s." % (_int_index, str_prefix))
+            int_count_failures += _add(measure(recorder, _cold_start))
+    else:
+        client_tts = RobotisOP2TTSClient(str_path_file_config)
+        if str_name_scenario == "cache_hit":
+            client_tts.synthesize_audio("Cache hit of %s." % str_prefix)
+            _float_time_start = time.time()
+            for _ in range(int_count_iterations):
+                int_count_failures += _add(measure(recorder, client_tts.synthesize_speech,
+                                                   "Cache hit of %s." % str_prefix))
+        elif str_name_scenario in ("cache_miss", "fallback"):
+            for _int_index in range(int_count_iterations):
+                int_count_failures += _add(measure(recorder, client_tts.synthesize_speech,
+                                                   "Request number %s of %s." % (_int_index, str_prefix)))
+        elif str_name_scenario == "long_document":
+            for _int_index in range(int_count_iterations):
+                str_document = " ".join("Sentence number %s of document %s of %s." % (_int_sentence, _int_index,
+                                                                                      str_prefix)
+                                        for _int_sentence in range(int_count_sentences))
+                int_count_failures += _add(measure(recorder, client_tts.synthesize_speech, str_document))
+        elif str_name_scenario == "batch":
+            list_texts = ["Batch text number %s of %s." % (_int_index, str_prefix)
+                          for _int_index in range(int_count_iterations)]
+            _float_time_start = time.time()
+            list_results = client_tts.synthesize_audio_batch(list_texts)
+            list_durations.append(time.time() - _float_time_start)
+            list_ttfa.append(list_durations[-1])
+            int_count_failures = len([_tuple for _tuple in list_results if not _tuple[0]])
+    float_duration_total = time.time() - _float_time_start
+
+    return {
+        "count": int_count_texts,
+        "failures": int_count_failures,
+        "ttfa_ms": get_summary(list_ttfa),
+        "duration_ms": get_summary(list_durations),
+        "throughput_rps": round(int_count_texts / float_duration_total, 3) if float_duration_total > 0 else None
+    }
+
+
+if __name__ == '__main__':
+    import argparse
+    import json
+    import logging
+    import shutil
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Robotis OP2 Text-to-Speech (TTS) end-to-end latency benchmark.")
+    parser.add_argument('-n', '--iterations', type=int, default=20, help="number of requests per scenario.")
+    parser.add_argument('-s', '--scenarios', type=str, default=",".join(LIST_SCENARIOS),
+                        help="comma separated scenarios to run.")
+    parser.add_argument('--delay-cloud', type=float, default=0.3, help="delay of fake Google backend, seconds.")
+    parser.add_argument('--delay-onboard', type=float, default=0.2, help="delay of fake Festival, seconds.")
+    parser.add_argument('--sentences', type=int, default=10, help="number of sentences of long document.")
+    parser.add_argument('-o', '--output', type=str, help="path to JSON report (stdout by default).")
+    parser.add_argument('-v', '--verbose', action='store_true', help="show TTS client logs.")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    str_path_dir_work = tempfile.mkdtemp(prefix="robotis_op2_tts_benchmark_")
+    str_path_dir_cwd = os.getcwd()
+    os.chdir(str_path_dir_work)     # audio cache and validation cache are relative to working directory
+    try:
+        from benchmark_stand_ins import google_cloud
+
+        google_cloud.install()
+        google_cloud.FLOAT_DELAY = args.delay_cloud
+        prepare_environment(args.delay_onboard)
+        _str_path_file_config = os.path.join(str_path_dir_work, "benchmark.json")
+        write_configuration(_str_path_file_config, start_probe_listener())
+        _recorder = TTFARecorder()
+        _recorder.install()
+
+        dict_report = {
+            "params": {
+                "iterations": args.iterations,
+                "delay_cloud": args.delay_cloud,
+                "delay_onboard": args.delay_onboard,
+                "sentences": args.sentences,
+                "python": sys.version.split()[0]
+            },
+            "scenarios": {}
+        }
+        for str_name_scenario in args.scenarios.split(","):
+            str_name_scenario = str_name_scenario.strip()
+            if str_name_scenario not in LIST_SCENARIOS:
+                parser.error("unknown scenario %s" % str_name_scenario)
+            dict_report["scenarios"][str_name_scenario] = run_scenario(
+                str_name_scenario, _str_path_file_config, _recorder, args.iterations, args.sentences)
+    finally:
+        os.chdir(str_path_dir_cwd)
+        shutil.rmtree(str_path_dir_work, ignore_errors=True)
+
+    str_report = json.dumps(dict_report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as file_report:
+            file_report.write(str_report + "\n")
+    else:
+        print str_report
@@ -0,0 +1,184 @@
+"""
+Local stand-in of Google Cloud TTS backend.
+    - Replaces google.cloud.texttospeech with fake module which client answers after configurable delay.
+    - Replaces gRPC channel creation with fake channel which becomes ready on first call.
+    - Provides google.api_core.exceptions and urllib3 if they are not installed.
+    - Can be switched to failure mode to exercise fallback to onboard TTS.
+    - Can fail next calls transiently (UNAVAILABLE) and honours call deadlines (DEADLINE_EXCEEDED).
+
+* Only surface used by TTSGoogleCloudClient is implemented.
+"""
+import sys
+import time
+import types
+
+FLOAT_DELAY = 0.3       # response delay of fake backend, seconds
+BOOL_FAIL = False       # whether fake backend fails calls
+INT_COUNT_FAILURES_TRANSIENT = 0    # number of next synthesis calls failed with UNAVAILABLE
+LIST_VOICES = [         # voices listed by fake backend: (name, language code)
+    ('en-GB-Wavenet-A', 'en-GB'),
+    ('en-US-Wavenet-D', 'en-US'),
+    ('ru-RU-Wavenet-A', 'ru-RU')
+]
+
+
+class _Message(object):
+    """
+    Fake protobuf message: keeps passed fields as attributes.
+    """
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__, self.__dict__)
+
+
+class _Response(object):
+    """
+    Fake SynthesizeSpeechResponse.
+    """
+    audio_content = None
+
+    def __init__(self, audio_content):
+        self.audio_content = audio_content
+
+
+class _EnumMember(object):
+    """
+    Fake member of grpc enum (ChannelConnectivity, StatusCode).
+    """
+    def __init__(self, name):
+        self.name = name
+
+
+class _Channel(object):
+    """
+    Fake gRPC channel: becomes ready on first call and notifies subscribers about connectivity.
+    """
+    def __init__(self, target, **kwargs):
+        self.target = target
+        self.options = kwargs.get('options')
+        self.list_callbacks = []
+        self.bool_ready = False
+
+    def subscribe(self, callback, try_to_connect=False):
+        self.list_callbacks.append(callback)
+        callback(_EnumMember('IDLE'))
+
+    def set_state(self, str_state):
+        self.bool_ready = str_state == 'READY'
+        for callback in self.list_callbacks:
+            callback(_EnumMember(str_state))
+
+    def connect(self):
+        if not self.bool_ready:
+            self.set_state('CONNECTING')
+            self.set_state('READY')
+
+
+class _TextToSpeechGrpcTransport(object):
+    """
+    Fake TextToSpeechGrpcTransport.
+    """
+    def __init__(self, channel=None, **kwargs):
+        self.channel = channel or _Channel("texttospeech.googleapis.com:443")
+
+
+class _TextToSpeechClient(object):
+    """
+    Fake TextToSpeechClient.
+    """
+    def __init__(self, transport=None, **kwargs):
+        self.transport = transport or _TextToSpeechGrpcTransport()
+
+    def synthesize_speech(self, synthesis_input, voice, audio_config, retry=None, timeout=None):
+        global INT_COUNT_FAILURES_TRANSIENT
+
+        self.transport.channel.connect()
+        module_exceptions = sys.modules['google.api_core.exceptions']
+        if INT_COUNT_FAILURES_TRANSIENT > 0:
+            INT_COUNT_FAILURES_TRANSIENT -= 1
+            raise module_exceptions.ServiceUnavailable("Fake backend is unavailable.")
+        if timeout is not None and FLOAT_DELAY > timeout:
+            time.sleep(timeout)
+            raise module_exceptions.DeadlineExceeded("Fake backend misses deadline.")
+        time.sleep(FLOAT_DELAY)
+        if BOOL_FAIL:
+            raise sys.modules['google.api_core.exceptions'].GoogleAPICallError("Fake backend fails call.")
+        str_text = synthesis_input.__dict__.get('text') or synthesis_input.__dict__.get('ssml') or ''
+        if isinstance(str_text, unicode):
+            str_text = str_text.encode('utf-8')
+        return _Response("ID3fake" + str_text)
+
+    def list_voices(self, language_code=None, **kwargs):
+        self.transport.channel.connect()
+        time.sleep(FLOAT_DELAY)
+        if BOOL_FAIL:
+            raise sys.modules['google.api_core.exceptions'].GoogleAPICallError("Fake backend fails call.")
+        return _Message(voices=[_Message(name=_str_name, language_codes=[_str_language_code], ssml_gender=2,
+                                         natural_sample_rate_hertz=24000)
+                                for _str_name, _str_language_code in LIST_VOICES
+                                if language_code is None or _str_language_code == language_code])
+
+
+def _get_module(str_name):
+    """
+    Returns module from sys.modules, creates empty one if module can not be imported.
+
+    :param str_name: string - full module name.
+    :return: module.
+    """
+    try:
+        __import__(str_name)
+    except ImportError:
+        sys.modules[str_name] = types.ModuleType(str_name)
+        if '.' in str_name:
+            str_name_parent, str_name_child = str_name.rsplit('.', 1)
+            setattr(_get_module(str_name_parent), str_name_child, sys.modules[str_name])
+    return sys.modules[str_name]
+
+
+def install():
+    """
+    Installs fake backend into sys.modules.
+
+    * Must be called before first Google Cloud TTS call.
+
+    :return: None.
+    """
+    module_texttospeech = types.ModuleType('google.cloud.texttospeech')
+    module_texttospeech.TextToSpeechClient = _TextToSpeechClient
+    module_texttospeech.types = types.ModuleType('google.cloud.texttospeech.types')
+    for str_name_type in ('SynthesisInput', 'VoiceSelectionParams', 'AudioConfig'):
+        setattr(module_texttospeech.types, str_name_type, type(str_name_type, (_Message,), {}))
+    module_texttospeech.enums = types.ModuleType('google.cloud.texttospeech.enums')
+    module_texttospeech.enums.AudioEncoding = type('AudioEncoding', (object,), {'MP3': 2, 'OGG_OPUS': 3})
+    module_texttospeech.enums.SsmlVoiceGender = type('SsmlVoiceGender', (object,), {'MALE': 1, 'FEMALE': 2})
+
+    sys.modules['google.cloud.texttospeech'] = module_texttospeech
+    setattr(_get_module('google.cloud'), 'texttospeech', module_texttospeech)
+
+    str_name_transport = 'google.cloud.texttospeech_v1.gapic.transports.text_to_speech_grpc_transport'
+    module_transport = types.ModuleType(str_name_transport)
+    module_transport.TextToSpeechGrpcTransport = _TextToSpeechGrpcTransport
+    sys.modules[str_name_transport] = module_transport
+    setattr(_get_module(str_name_transport.rsplit('.', 1)[0]), 'text_to_speech_grpc_transport', module_transport)
+
+    module_grpc_helpers = types.ModuleType('google.api_core.grpc_helpers')
+    module_grpc_helpers.create_channel = lambda target, **kwargs: _Channel(target, **kwargs)
+    sys.modules['google.api_core.grpc_helpers'] = module_grpc_helpers
+    setattr(_get_module('google.api_core'), 'grpc_helpers', module_grpc_helpers)
+
+    module_exceptions = _get_module('google.api_core.exceptions')
+    if not hasattr(module_exceptions, 'GoogleAPICallError'):
+        module_exceptions.GoogleAPICallError = type('GoogleAPICallError', (Exception,), {'grpc_status_code': None})
+    for str_name_exception, str_code_status in (('ServiceUnavailable', 'UNAVAILABLE'),
+                                                ('DeadlineExceeded', 'DEADLINE_EXCEEDED')):
+        if not hasattr(module_exceptions, str_name_exception):
+            setattr(module_exceptions, str_name_exception,
+                    type(str_name_exception, (module_exceptions.GoogleAPICallError,),
+                         {'grpc_status_code': _EnumMember(str_code_status)}))
+
+    module_urllib3 = _get_module('urllib3')
+    if not hasattr(module_urllib3, 'disable_warnings'):
+        module_urllib3.disable_warnings = lambda *args, **kwargs: None
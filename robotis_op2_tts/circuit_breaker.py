@@ -0,0 +1,163 @@
+from base import LoggableInterface
+from threading import Thread, Event, Lock
+import time
+
+
+class CircuitBreaker(LoggableInterface):
+    """
+    Circuit breaker class.
+        - Guards calls of single TTS client delegate.
+        - Supports logging feature.
+
+    States:
+        - closed - calls are allowed, consecutive failures are counted.
+        - open - calls are rejected until cool-down is over and recovery probe succeeds.
+        - half-open - single trial call is allowed. Success closes breaker, failure opens it again.
+
+    Circuit breaker configuration dictionary keys:
+        - failure_threshold - number of consecutive failures that opens breaker (optional).
+        - cooldown - time while breaker stays open, seconds (optional).
+        - probe_interval - interval between recovery probes of open breaker, seconds (optional).
+
+    * Recovery probe is performed by background thread while breaker is open.
+    """
+    STR_STATE_CLOSED = "closed"
+    STR_STATE_OPEN = "open"
+    STR_STATE_HALF_OPEN = "half-open"
+
+    INT_FAILURE_THRESHOLD_DEFAULT = 3
+    FLOAT_COOLDOWN_DEFAULT = 30.0           # seconds
+    FLOAT_PROBE_INTERVAL_DEFAULT = 5.0      # seconds
+
+    _int_failure_threshold = None   # number of consecutive failures that opens breaker
+    _float_cooldown = None          # time while breaker stays open, seconds
+    _float_probe_interval = None    # interval between recovery probes, seconds
+    _probe = None                   # callable that checks whether guarded client is recovered (None - no check)
+
+    _str_state = None               # current state
+    _int_count_failures = 0         # consecutive failures
+    _float_time_opened = 0.0        # time when breaker is opened, seconds since epoch
+    _bool_trial_in_flight = False   # whether half-open trial call is in progress
+    _lock = None                    # guards state
+    _event_opened = None            # wakes up recovery probe thread
+    _thread = None                  # recovery probe thread
+
+    def __init__(self, str_name, dict_config=None, probe=None):
+        """
+        Constructs instance of CircuitBreaker class.
+
+        :param str_name: string - name of guarded client (used in logs).
+        :param dict_config: dict - circuit breaker configuration (None - defaults).
+        :param probe: callable - returns bool indicator whether guarded client is recovered (None - no check).
+        """
+        super(CircuitBreaker, self).__init__(name="%s[%s]" % (self.__class__.__name__, str_name))
+        dict_config = dict_config or {}
+        self._int_failure_threshold = max(1, int(dict_config.get('failure_threshold',
+                                                                 self.INT_FAILURE_THRESHOLD_DEFAULT)))
+        self._float_cooldown = float(dict_config.get('cooldown', self.FLOAT_COOLDOWN_DEFAULT))
+        self._float_probe_interval = float(dict_config.get('probe_interval', self.FLOAT_PROBE_INTERVAL_DEFAULT))
+        self._probe = probe
+        self._str_state = self.STR_STATE_CLOSED
+        self._lock = Lock()
+        self._event_opened = Event()
+        self._thread = Thread(target=self._run, name=self.logger.name)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def get_state(self):
+        """
+        Returns current state.
+
+        :return: string - one of STR_STATE_* values.
+        """
+        return self._str_state
+
+    def allow_request(self):
+        """
+        Checks whether call of guarded client is allowed.
+
+        * In half-open state only one trial call is allowed at a time.
+
+        :return: bool - True (allowed), False (rejected).
+        """
+        with self._lock:
+            if self._str_state == self.STR_STATE_CLOSED:
+                return True
+            if self._str_state == self.STR_STATE_HALF_OPEN and not self._bool_trial_in_flight:
+                self._bool_trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        """
+        Records succeeded call of guarded client.
+
+        :return: None (breaker will be closed).
+        """
+        with self._lock:
+            if self._str_state != self.STR_STATE_CLOSED:
+                self.logger.info("Trial call succeeds. Breaker is closed.")
+            self._str_state = self.STR_STATE_CLOSED
+            self._int_count_failures = 0
+            self._bool_trial_in_flight = False
+
+    def record_failure(self):
+        """
+        Records failed call of guarded client.
+
+        :return: None (breaker will be opened if failure threshold is reached or trial call fails).
+        """
+        with self._lock:
+            self._int_count_failures += 1
+            if self._str_state == self.STR_STATE_HALF_OPEN or \
+                    self._int_count_failures >= self._int_failure_threshold:
+                self._open()
+
+    def _open(self):
+        """
+        Opens breaker.
+
+        * Caller must hold the lock.
+
+        :return: None (recovery probe thread will be woken up).
+        """
+        if self._str_state != self.STR_STATE_OPEN:
+            self.logger.warn("%s consecutive failures. Breaker is opened for %s seconds.",
+                             self._int_count_failures, self._float_cooldown)
+        self._str_state = self.STR_STATE_OPEN
+        self._float_time_opened = time.time()
+        self._bool_trial_in_flight = False
+        self._event_opened.set()
+
+    def _run(self):
+        """
+        Recovery probe thread loop.
+            - Sleeps until breaker is opened.
+            - After cool-down probes guarded client on interval and half-opens breaker if it is recovered.
+
+        :return: None.
+        """
+        while True:
+            self._event_opened.wait()
+            time.sleep(max(0.0, self._float_time_opened + self._float_cooldown - time.time()))
+            with self._lock:
+                if self._str_state != self.STR_STATE_OPEN:
+                    self._event_opened.clear()
+                    continue        # breaker was closed meanwhile
+                if time.time() - self._float_time_opened < self._float_cooldown:
+                    continue        # breaker was opened again meanwhile
+            try:
+                bool_recovered = self._probe is None or bool(self._probe())
+            except (Exception, SystemExit) as e:
+                self.logger.debug("Recovery probe fails: %s", e)
+                bool_recovered = False
+            with self._lock:
+                if self._str_state != self.STR_STATE_OPEN:
+                    self._event_opened.clear()
+                    continue
+                if bool_recovered:
+                    self._str_state = self.STR_STATE_HALF_OPEN
+                    self._event_opened.clear()
+                    self.logger.info("Recovery probe succeeds. Breaker is half-opened.")
+                    continue
+            time.sleep(self._float_probe_interval)
@@ -9,7 +9,7 @@ class CLI(LoggableInterface):
     CLI parser class.
         - It is responsible for CLI interaction with operator.
     """
-    LIST_COMMANDS = ["say", "save", "exit", "help"]
+    LIST_COMMANDS = ["say", "save", "phrasebook", "voices", "exit", "help"]
 
     def __init__(self):
         super(CLI, self).__init__(name=self.__class__.__name__)
@@ -20,6 +20,8 @@ class CLI(LoggableInterface):
 
         Arguments dictionary keys:
         - config - string path to configuration file.
+        - daemon - bool - whether TTS client is served over Unix domain socket instead of interactive session.
+        - socket - string path to Unix domain socket of daemon (None - path from configuration).
 
         * argparse module is responsible for parsing input arguments.
         * All passed params will be validated.
@@ -32,6 +34,9 @@ class CLI(LoggableInterface):
         parser = argparse.ArgumentParser(description="Robotis OP2 Text-to-Speech (TTS) client. "
                                                      "To learn more visit: https://github.com/valera0798/Robotis-OP2-TTS")
         parser.add_argument('-c', '--config', type=str, help="path to TTS configuration file.")
+        parser.add_argument('-d', '--daemon', action='store_true',
+                            help="serve TTS client to other processes over Unix domain socket.")
+        parser.add_argument('-s', '--socket', type=str, help="path to Unix domain socket of daemon.")
         args = parser.parse_args()
 
         try:
@@ -171,4 +176,6 @@ class CLI(LoggableInterface):
               "\thelp                     - show this help message.\n" \
               "\tsay [source string/file path]   - speaks passed text from source.\n" \
               "\tsave [source string/file path]  - saves synthesized from source text to file.\n" \
+              "\tphrasebook               - shows progress of phrasebook pre-warming.\n" \
+              "\tvoices [language code]   - lists voices of cloud TTS engine.\n" \
               "\texit                     - ends current session.\n"
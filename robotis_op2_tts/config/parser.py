@@ -8,9 +8,72 @@ def parse_configuration(str_path_file_config):
           "audio_file_format": "<value>",                   - generated audio file format
           "audio_file_player": {                            - system program what can play generated audio.
             "name": "<value>",                              - name of program
-            "command": "<value>"                            - command that will be used to play audio file.
+            "command": "<value>",                           - command that will be used to play audio file.
                                                                 Mark place were audio file should be passed as "{file}"
-          },,
+            "remote_command": "<value>",                    - command that starts long-lived player in mpg123 remote
+                                                                control mode (optional). Files are played one after another
+                                                                by single player process (next file is loaded when
+                                                                previous one finishes, playback is not gapless).
+            "stream_command": "<value>",                    - command that plays audio from stdin (optional).
+                                                                Used to play in-memory audio without audio file.
+            "watchdog_timeout": <float_value>,              - max time without remote player output before restart, seconds (optional).
+            "timeout": <float_value>                        - max time of audio file playback by command, seconds (optional).
+          },
+          "cache": {                                        - synthesized audio cache limits (optional, each TTS engine has own cache).
+            "size_max": <int_value>,                        - max total size of cached audio files, bytes.
+            "age_max": <int_value>,                         - max age of cached audio file, seconds.
+            "verify": <bool_value>                          - whether size of cached audio file is verified on lookup
+                                                                (optional, false by default).
+          },
+          "speech_pipeline": {                              - pipelined speech synthesis (optional).
+            "enabled": <bool_value>,                        - whether text is spoken sentence by sentence
+                                                                while next sentences are synthesized.
+            "queue_size": <int_value>                       - number of sentences synthesized ahead of playback.
+          },
+          "text_normalization": {                           - canonicalization of source text before synthesis (optional).
+                                                                Equivalent inputs map to the same cached audio.
+            "enabled": <bool_value>,                        - whether quotes, dashes, whitespaces and punctuation are unified.
+            "abbreviations": <bool_value>,                  - whether abbreviations are expanded (en, ru).
+            "dates": <bool_value>,                          - whether numeric dates are expanded to words (en, ru).
+            "numbers": <bool_value>,                        - whether integers are expanded to words (en, ru).
+            "lowercase": <bool_value>                       - whether letter case is lowered.
+          },
+          "audio_in_memory": {                              - in-memory audio mode (optional).
+            "enabled": <bool_value>,                        - whether not cached speech is streamed to audio player
+                                                                without audio file round trip.
+            "cache": <bool_value>                           - whether in-memory audio is also written to cache (optional).
+          },
+          "hedging": {                                      - hedged requests (optional, both TTS engines are required).
+            "enabled": <bool_value>,                        - whether another TTS engine is raced if preferable one
+                                                                does not return in time.
+            "delay": <float_value>                          - hedge delay, seconds.
+          },
+          "circuit_breaker": {                              - circuit breaker of each TTS engine (optional).
+            "failure_threshold": <int_value>,               - number of consecutive failures that stops calls of TTS engine.
+            "cooldown": <float_value>,                      - time while calls of TTS engine are stopped, seconds.
+            "probe_interval": <float_value>                 - interval between recovery probes after cool-down, seconds.
+          },
+          "phrasebook": {                                   - phrases pre-warmed in synthesis cache at startup (optional).
+            "enabled": <bool_value>,                        - whether phrases are pre-warmed (optional).
+                                                                Pre-warming creates TTS engines at startup in background,
+                                                                so they are not created lazily on first demand.
+            "phrases": [                                    - phrases in free order.
+              {"text": "<value>", "priority": <int_value>}, - single phrase. Bigger priority - earlier pre-warming.
+              {"file": "<value>", "priority": <int_value>}  - file with phrase per line.
+                                                                Relative path is resolved against configuration file directory.
+            ]
+          },
+          "scheduler": {                                    - priority speech scheduler, see TTSScheduler (optional).
+            "queue_size": <int_value>,                      - max number of queued requests.
+            "synthesis_workers": <int_value>                - number of threads synthesizing ahead of playback.
+          },
+          "daemon": {                                       - TTS daemon mode, see TTSDaemon (optional).
+            "socket": "<value>"                             - path to Unix domain socket.
+          },
+          "tracing": {                                      - per-stage timing spans of requests (optional).
+            "enabled": <bool_value>,                        - whether spans are recorded.
+            "path": "<value>"                               - path to JSON lines output file (optional).
+          },
           "tts_engines": {                                  - TTS engines description.
                                                                 There are 2 options (at least 1 must be provided):
                                                                     cloud - requires Internet access.
@@ -23,6 +86,8 @@ def parse_configuration(str_path_file_config):
             },
             "onboard": {                                    - description of onboard TTS.
               "priority" : <int_value>                      - priority number of synthesis method. Bigger value - more preferable to use.
+              "audio_file_player": {...}                    - audio file player of TTS engine output (optional).
+                                                                Same format as general one, overrides it.
               "<engine_name>": {                            - name of service.
                 ...                                         - free format. just remember to validate and parse it correctly.
               }
@@ -36,9 +101,14 @@ def parse_configuration(str_path_file_config):
     :return: dict - parsed configuration.
     """
     import json
+    from os.path import dirname, isabs, join, abspath
 
     file_config = open(str_path_file_config, 'r')
     dict_config_tts = json.load(file_config)
     file_config.close()
 
+    for dict_entry in (dict_config_tts.get('phrasebook') or {}).get('phrases') or []:
+        if 'file' in dict_entry and not isabs(dict_entry['file']):     # phrase file is relative to configuration file
+            dict_entry['file'] = abspath(join(dirname(abspath(str_path_file_config)), dict_entry['file']))
+
     return dict_config_tts
@@ -0,0 +1,247 @@
+from base import LoggableInterface
+from _exceptions.daemon import DaemonSocketInUseException
+from daemon_client import STR_PATH_SOCKET_DEFAULT
+from threading import Lock
+import SocketServer
+import json
+
+
+class _TTSDaemonServer(SocketServer.ThreadingMixIn, SocketServer.UnixStreamServer):
+    """
+    Unix domain socket server of TTS daemon.
+        - Serves every connection in separate thread.
+    """
+    daemon_threads = True
+    daemon_tts = None               # TTSDaemon that processes requests
+
+
+class _TTSDaemonRequestHandler(SocketServer.StreamRequestHandler):
+    """
+    Connection handler of TTS daemon.
+        - Reads requests as JSON lines, writes response line per request.
+        - Connection may carry any number of requests.
+    """
+    def handle(self):
+        for str_line in iter(self.rfile.readline, ''):
+            if not str_line.strip():
+                continue
+            dict_response = self.server.daemon_tts.process_request(str_line)
+            self.wfile.write(json.dumps(dict_response) + "\n")
+            self.wfile.flush()
+
+
+class TTSDaemon(LoggableInterface):
+    """
+    TTS daemon class.
+        - Shares one warmed RobotisOP2TTSClient (engines, cache, audio file players) between processes.
+        - Accepts requests over Unix domain socket, see TTSDaemonClient for client side.
+        - Speech requests are queued in priority scheduler, so speech of processes is not interleaved.
+        - Supports logging feature.
+
+    Protocol: request and response are JSON objects, one per line.
+        Requests:
+            - {"command": "say", "text": "<value>", "priority": <int_value>, "wait": <bool_value>}
+            - {"command": "save", "text": "<value>"}
+            - {"command": "cancel", "id": <int_value>}
+            - {"command": "status"}
+            * "file": "<absolute path>" may be passed instead of "text".
+            * "priority" (TTSScheduler.INT_PRIORITY_NORMAL by default) and "wait" (true by default) are optional.
+        Responses:
+            - {"ok": true, "result": <value>} - succeeded request.
+            - {"ok": false, "error": "<value>"} - failed request.
+    """
+    LIST_COMMANDS = ["say", "save", "cancel", "status"]
+
+    _client_tts = None              # shared TTS client
+    _scheduler = None               # speech scheduler of shared TTS client
+    _str_path_socket = None         # path to Unix domain socket
+    _server = None                  # socket server
+    _dict_requests = None           # not finished speech requests by ID (for cancellation)
+    _lock = None                    # guards speech requests
+
+    def __init__(self, client_tts, str_path_socket=STR_PATH_SOCKET_DEFAULT):
+        """
+        Constructs instance of TTSDaemon class.
+
+        * Stale socket file left by crashed daemon is removed.
+
+        :raises:
+            * DaemonSocketInUseException - if another daemon serves socket path.
+        :param client_tts: RobotisOP2TTSClient - TTS client to share.
+        :param str_path_socket: string path to Unix domain socket.
+        """
+        super(TTSDaemon, self).__init__(name=self.__class__.__name__)
+        from os.path import abspath
+
+        self._client_tts = client_tts
+        self._str_path_socket = abspath(str_path_socket)
+        self._dict_requests = {}
+        self._lock = Lock()
+
+        self._remove_socket_stale()
+        self._server = _TTSDaemonServer(self._str_path_socket, _TTSDaemonRequestHandler)
+        self._server.daemon_tts = self
+        self._scheduler = self._client_tts.create_scheduler()
+        self.logger.info("TTS daemon listens on %s.", self._str_path_socket)
+
+    def _remove_socket_stale(self):
+        """
+        Removes socket file if no daemon accepts connections on it.
+
+        :raises:
+            * DaemonSocketInUseException - if another daemon serves socket path.
+        :return: None (socket file will be deleted).
+        """
+        import socket
+        from os import remove, makedirs
+        from os.path import exists, dirname
+
+        if not exists(dirname(self._str_path_socket)):
+            makedirs(dirname(self._str_path_socket))
+        if not exists(self._str_path_socket):
+            return
+        _socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            _socket.connect(self._str_path_socket)
+        except socket.error:        # nobody listens
+            remove(self._str_path_socket)
+            self.logger.debug("Stale socket file is removed.")
+            return
+        finally:
+            _socket.close()
+        raise DaemonSocketInUseException(self._str_path_socket)
+
+    def serve_forever(self):
+        """
+        Serves requests until shutdown is called.
+
+        :return: None.
+        """
+        try:
+            self._server.serve_forever()
+        finally:
+            self._close()
+
+    def shutdown(self):
+        """
+        Stops serving requests.
+            - Is called from another thread (e.g. signal handler thread).
+
+        :return: None (serve_forever will return).
+        """
+        self._server.shutdown()
+
+    def _close(self):
+        """
+        Closes socket and scheduler.
+
+        :return: None (socket file will be deleted).
+        """
+        from os import remove
+
+        self._server.server_close()
+        self._scheduler.close()
+        try:
+            remove(self._str_path_socket)
+        except OSError:     # socket file is already deleted
+            pass
+        self.logger.info("TTS daemon is stopped.")
+
+    def process_request(self, str_request):
+        """
+        Processes single request line.
+
+        :param str_request: string - JSON request.
+        :return: dict - response.
+        """
+        try:
+            dict_request = json.loads(str_request)
+            str_command = dict_request.get('command')
+            if str_command not in self.LIST_COMMANDS:
+                return {'ok': False, 'error': "Unknown command '%s'." % str_command}
+            self.logger.debug("Request '%s' is received.", str_command)
+            return {'ok': True, 'result': getattr(self, '_process_' + str_command)(dict_request)}
+        except ValueError as e:     # malformed JSON or argument
+            return {'ok': False, 'error': str(e)}
+        except Exception as e:
+            self.logger.error(msg=str(e), exc_info=True)
+            return {'ok': False, 'error': str(e)}
+
+    def _get_source_text(self, dict_request):
+        """
+        Returns source text of request.
+
+        :param dict_request: dict - request.
+        :return: string or file with text.
+        """
+        if dict_request.get('file'):
+            return open(dict_request['file'])
+        if not dict_request.get('text'):
+            raise ValueError("No text or file is passed.")
+        str_text = dict_request['text']
+        if isinstance(str_text, unicode):       # json decodes to unicode, engines expect utf-8 strings
+            str_text = str_text.encode('utf-8')
+        return str_text
+
+    def _process_say(self, dict_request):
+        """
+        Queues speech request.
+
+        :param dict_request: dict - request.
+        :return: dict - request ID, and result of speech if request waits for it.
+        """
+        from scheduler import TTSScheduler
+
+        source_text = self._get_source_text(dict_request)
+        try:
+            request = self._scheduler.submit(source_text,
+                                             int(dict_request.get('priority', TTSScheduler.INT_PRIORITY_NORMAL)))
+        finally:
+            if hasattr(source_text, 'close'):
+                source_text.close()
+        if not dict_request.get('wait', True):
+            with self._lock:
+                self._dict_requests[request.int_id] = request
+                for _int_id in [_int_id for _int_id, _request in self._dict_requests.items() if _request.is_finished()]:
+                    del self._dict_requests[_int_id]
+            return {'id': request.int_id}
+        return {'id': request.int_id, 'succeeded': request.wait(), 'state': request.str_state}
+
+    def _process_save(self, dict_request):
+        """
+        Synthesizes audio file.
+
+        :param dict_request: dict - request.
+        :return: string - path to synthesized file (None if synthesis fails).
+        """
+        source_text = self._get_source_text(dict_request)
+        try:
+            return self._client_tts.synthesize_audio(source_text)
+        finally:
+            if hasattr(source_text, 'close'):
+                source_text.close()
+
+    def _process_cancel(self, dict_request):
+        """
+        Cancels speech request that was queued without waiting.
+
+        :param dict_request: dict - request.
+        :return: bool - True (cancelled), False (unknown or already finished).
+        """
+        with self._lock:
+            request = self._dict_requests.pop(int(dict_request.get('id', 0)), None)
+        if request is None:
+            return False
+        return request.cancel()
+
+    def _process_status(self, dict_request):
+        """
+        Reports state of shared TTS client.
+
+        :param dict_request: dict - request.
+        :return: dict - scheduler statistics, TTS engine states, cloud channel statistics and phrasebook progress.
+        """
+        return {'scheduler': self._scheduler.get_stats(),
+                'engines': self._client_tts.get_engine_states(),
+                'channel': self._client_tts.get_channel_stats(),
+                'phrasebook': self._client_tts.get_phrasebook_progress()}
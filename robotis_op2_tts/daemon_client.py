@@ -0,0 +1,159 @@
+from _exceptions.daemon import DaemonNotAvailableException, DaemonRequestFailedException, \
+    DaemonRequestTimeoutException
+from threading import Lock
+import json
+
+STR_PATH_SOCKET_DEFAULT = "./data/tts.sock"
+
+
+class TTSDaemonClient(object):
+    """
+    TTS daemon client class.
+        - Talks to TTSDaemon over Unix domain socket.
+        - Does not import TTS engines, so it is cheap to use from any process.
+
+    * Connection is opened on first request and reused, instance is safe to use from several threads.
+    """
+    _str_path_socket = None         # path to Unix domain socket of daemon
+    _float_timeout = None           # socket timeout, seconds (None - no limit)
+    _socket = None                  # connection to daemon (None - not connected)
+    _file_socket = None             # buffered reader of connection
+    _lock = None                    # serializes requests on connection
+
+    def __init__(self, str_path_socket=STR_PATH_SOCKET_DEFAULT, float_timeout=None):
+        """
+        Constructs instance of TTSDaemonClient class.
+
+        :param str_path_socket: string path to Unix domain socket of daemon.
+        :param float_timeout: float - socket timeout, seconds (None - no limit, speech requests may take long).
+        """
+        from os.path import abspath
+
+        self._str_path_socket = abspath(str_path_socket)
+        self._float_timeout = float_timeout
+        self._lock = Lock()
+
+    def say(self, str_text, int_priority=None, bool_wait=True):
+        """
+        Speaks text by daemon.
+
+        :param str_text: string - text to speak.
+        :param int_priority: int - priority, see TTSScheduler.INT_PRIORITY_* (None - normal).
+        :param bool_wait: bool - whether call returns after speech is finished.
+        :return: dict - request ID, and indicator of succeeded speech and final state if bool_wait.
+        """
+        dict_request = {'command': 'say', 'text': str_text, 'wait': bool_wait}
+        if int_priority is not None:
+            dict_request['priority'] = int_priority
+        return self._request(dict_request)
+
+    def save(self, str_text):
+        """
+        Synthesizes audio file by daemon.
+
+        :param str_text: string - text to synthesize.
+        :return: string - path to synthesized file (None if synthesis fails).
+        """
+        return self._request({'command': 'save', 'text': str_text})
+
+    def cancel(self, int_id):
+        """
+        Cancels speech request that was sent without waiting.
+
+        :param int_id: int - request ID returned by say.
+        :return: bool - True (cancelled), False (unknown or already finished).
+        """
+        return self._request({'command': 'cancel', 'id': int_id})
+
+    def status(self):
+        """
+        Returns state of daemon.
+
+        :return: dict - scheduler statistics, TTS engine states, cloud channel statistics and phrasebook progress.
+        """
+        return self._request({'command': 'status'})
+
+    def close(self):
+        """
+        Closes connection to daemon.
+
+        :return: None.
+        """
+        with self._lock:
+            self._disconnect()
+
+    def _connect(self):
+        """
+        Opens connection to daemon.
+
+        * Caller must hold the lock.
+
+        :raises:
+            * DaemonNotAvailableException - if daemon does not accept connections.
+        :return: None.
+        """
+        import socket
+
+        _socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        _socket.settimeout(self._float_timeout)
+        try:
+            _socket.connect(self._str_path_socket)
+        except socket.error:
+            _socket.close()
+            raise DaemonNotAvailableException(self._str_path_socket)
+        self._socket = _socket
+        self._file_socket = _socket.makefile('rb')
+
+    def _disconnect(self):
+        """
+        Closes connection to daemon.
+
+        * Caller must hold the lock.
+
+        :return: None.
+        """
+        if self._socket is not None:
+            self._file_socket.close()
+            self._socket.close()
+            self._socket, self._file_socket = None, None
+
+    def _request(self, dict_request):
+        """
+        Sends request and reads response.
+
+        * Broken connection (e.g. daemon is restarted) is reopened and request is resent once,
+          only if request is not sent or daemon closes connection without response.
+        * Timed out request is not resent, since daemon may still process it (e.g. speak text).
+
+        :raises:
+            * DaemonNotAvailableException - if daemon does not accept connections.
+            * DaemonRequestTimeoutException - if daemon does not respond in socket timeout.
+            * DaemonRequestFailedException - if daemon fails request.
+        :param dict_request: dict - request.
+        :return: result of request.
+        """
+        import socket
+
+        str_request = json.dumps(dict_request) + "\n"
+        with self._lock:
+            for _int_attempt in range(2):
+                if self._socket is None:
+                    self._connect()
+                try:
+                    self._socket.sendall(str_request)
+                    str_response = self._file_socket.readline()
+                except socket.timeout:
+                    self._disconnect()      # late response must not be read as response to next request
+                    raise DaemonRequestTimeoutException(dict_request['command'], self._float_timeout)
+                except socket.error:        # request is not sent or connection is closed by daemon
+                    str_response = ''
+                if str_response:
+                    break
+                self._disconnect()
+            else:
+                raise DaemonNotAvailableException(self._str_path_socket)
+
+        dict_response = json.loads(str_response)
+        if not dict_response.get('ok'):
+            raise DaemonRequestFailedException(dict_request['command'], dict_response.get('error'))
+        return dict_response.get('result')
@@ -0,0 +1,123 @@
+from base import LoggableInterface
+from threading import Thread, Lock
+
+
+class Phrasebook(LoggableInterface):
+    """
+    Phrasebook class.
+        - Keeps phrases that are spoken often (greetings, error messages, status lines).
+        - Pre-warms synthesis cache with phrases in background thread, higher priority first.
+        - Reports pre-warming progress.
+        - Supports logging feature.
+
+    Phrasebook configuration dictionary keys:
+        - enabled - whether phrases are pre-warmed at startup (optional, True by default).
+        - phrases - list of entries:
+            - {"text": "<value>", "priority": <int_value>} - single phrase;
+            - {"file": "<value>", "priority": <int_value>} - file with phrase per line.
+          Priority is optional (0 by default), bigger value - earlier pre-warming.
+
+    * Phrases are split into sentences if speech pipeline is enabled, since pipelined speech
+      synthesizes (and caches) sentence by sentence.
+    """
+    _list_phrases = None            # phrases to pre-warm in order of priority
+    _int_count_done = 0             # number of pre-warmed phrases
+    _int_count_failed = 0           # number of phrases failed to pre-warm
+    _lock = None                    # guards progress counters
+    _thread = None                  # pre-warming thread
+
+    def __init__(self, dict_config, bool_split_sentences=False):
+        """
+        Constructs instance of Phrasebook class.
+
+        :param dict_config: dict - phrasebook configuration.
+        :param bool_split_sentences: bool - whether phrases are split into sentences.
+        """
+        super(Phrasebook, self).__init__(name=self.__class__.__name__)
+        self._lock = Lock()
+        self._list_phrases = self._load_phrases(dict_config.get('phrases') or [], bool_split_sentences)
+        self.logger.debug("%s phrases are loaded.", len(self._list_phrases))
+
+    def _load_phrases(self, list_entries, bool_split_sentences):
+        """
+        Loads phrases of phrasebook entries.
+
+        * Duplicated phrases are kept once with the highest priority.
+        * Unreadable phrase files are skipped.
+
+        :param list_entries: list - phrasebook entries.
+        :param bool_split_sentences: bool - whether phrases are split into sentences.
+        :return: list - phrases in order of priority.
+        """
+        from text_processing import split_sentences
+
+        dict_priorities = {}
+        list_phrases = []
+        for dict_entry in list_entries:
+            int_priority = int(dict_entry.get('priority', 0))
+            if 'file' in dict_entry:
+                try:
+                    with open(dict_entry['file'], 'r') as file_phrases:
+                        list_texts = [_str_line.strip() for _str_line in file_phrases]
+                except IOError as e:
+                    self.logger.error(msg=str(e))
+                    continue
+            else:
+                list_texts = [dict_entry.get('text', '')]
+            for str_text in list_texts:
+                if isinstance(str_text, unicode):
+                    str_text = str_text.encode('utf-8')
+                if not str_text.strip():
+                    continue
+                for str_phrase in (split_sentences(str_text) if bool_split_sentences else [str_text]):
+                    if str_phrase not in dict_priorities:
+                        list_phrases.append(str_phrase)
+                        dict_priorities[str_phrase] = int_priority
+                    else:
+                        dict_priorities[str_phrase] = max(dict_priorities[str_phrase], int_priority)
+        list_phrases.sort(key=lambda str_phrase: -dict_priorities[str_phrase])     # stable, keeps config order
+        return list_phrases
+
+    def start(self, client_tts):
+        """
+        Starts pre-warming of synthesis cache in background thread.
+
+        :param client_tts: InterfaceTTSClient - client that synthesizes phrases.
+        :return: None (thread will be started).
+        """
+        if not self._list_phrases or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._thread = Thread(target=self._run, args=(client_tts,), name=self.__class__.__name__)
+        self._thread.daemon = True
+        self._thread.start()
+        self.logger.info("Phrasebook pre-warming of %s phrases starts.", len(self._list_phrases))
+
+    def _run(self, client_tts):
+        """
+        Pre-warming thread loop.
+
+        :param client_tts: InterfaceTTSClient - client that synthesizes phrases.
+        :return: None.
+        """
+        for str_phrase in self._list_phrases:
+            try:
+                bool_result = client_tts.synthesize_audio(str_phrase) is not None
+            except (Exception, SystemExit) as e:
+                self.logger.error(msg=str(e), exc_info=True)
+                bool_result = False
+            with self._lock:
+                self._int_count_done += 1
+                if not bool_result:
+                    self._int_count_failed += 1
+            self.logger.info("Phrasebook pre-warming progress: %s/%s.", *self.get_progress()[:2])
+        self.logger.info("Phrasebook pre-warming is finished. Failed = %s.", self._int_count_failed)
+
+    def get_progress(self):
+        """
+        Returns pre-warming progress.
+
+        :return: tuple (int - number of processed phrases, int - total number of phrases,
+            int - number of phrases failed to pre-warm).
+        """
+        with self._lock:
+            return self._int_count_done, len(self._list_phrases), self._int_count_failed
@@ -0,0 +1,453 @@
+from base import LoggableInterface
+import tracing
+from threading import Thread, Event, Lock
+from Queue import Queue, Empty
+import subprocess
+import shlex
+import tempfile
+import time
+
+
+class AudioFilePlayerItem(object):
+    """
+    Audio file player queue item class.
+        - Describes audio file (or in-memory audio) queued for playback and its result.
+    """
+    str_path_file_audio = None      # audio file to play
+    str_content_audio = None        # binary audio content to play instead of audio file
+    bool_result = None              # indicator of succeeded playback (None - not played yet)
+    bool_interrupted = False        # whether playback is interrupted by skip or stop (result is False then)
+    bool_skipped = False            # whether skip is requested (queued item is not played, playback is interrupted)
+    event_done = None               # set when playback is finished, skipped or failed
+    span_context = None             # trace span of request that queued item
+
+    def __init__(self, str_path_file_audio, str_content_audio=None):
+        self.str_path_file_audio = str_path_file_audio
+        self.str_content_audio = str_content_audio
+        self.event_done = Event()
+        self.span_context = tracing.get_context()
+
+    def get_name(self):
+        """
+        Returns item name for logging.
+
+        :return: str - audio file path or size of in-memory audio.
+        """
+        if self.str_content_audio is not None:
+            return "<in-memory audio, %s bytes>" % len(self.str_content_audio)
+        return self.str_path_file_audio
+
+    def finish(self, bool_result, bool_interrupted=False):
+        """
+        Marks item as finished.
+
+        :param bool_result: bool - indicator of succeeded playback.
+        :param bool_interrupted: bool - whether playback is interrupted by skip or stop.
+        :return: None (waiters will be woken up).
+        """
+        self.bool_result = bool_result and not bool_interrupted
+        self.bool_interrupted = bool_interrupted
+        self.event_done.set()
+
+    def wait(self, float_timeout=None):
+        """
+        Waits until item is finished.
+
+        :param float_timeout: float - max time to wait, seconds (None - no limit).
+        :return: bool - indicator of succeeded playback.
+        """
+        self.event_done.wait(float_timeout)
+        return bool(self.bool_result)
+
+
+class AudioFilePlayer(LoggableInterface):
+    """
+    Audio file player class.
+        - Plays queued audio files one after another by single worker thread.
+        - Keeps single long-lived player process in remote control mode (e.g. `mpg123 -R`),
+          otherwise spawns player command per audio file.
+        - Streams in-memory audio to stdin of player spawned by stream command (e.g. `mpg123 -q -`).
+        - Supports stop and skip of playback, interrupted item is reported as not played.
+        - Watchdog restarts player process if it hangs.
+        - Supports logging feature.
+
+    Audio file player configuration dictionary keys:
+        - name - name of program.
+        - command - command to play audio file. Mark place were audio file should be passed as "{file}".
+        - remote_command - command to start player in mpg123 remote control mode (optional).
+        - stream_command - command to play audio from stdin (optional, in-memory audio is played
+          from temporary file by command otherwise).
+        - watchdog_timeout - max time without player output in remote mode, seconds (optional).
+        - timeout - max time of audio file playback by command, seconds (optional, no limit by default).
+    """
+    FLOAT_WATCHDOG_TIMEOUT_DEFAULT = 5.0    # seconds
+
+    _str_command = None             # command to play audio file
+    _str_command_remote = None      # command to start player in remote control mode
+    _str_command_stream = None      # command to play audio from stdin
+    _float_watchdog_timeout = None  # max time without player output in remote mode, seconds
+    _float_timeout = None           # max time of audio file playback by command, seconds
+
+    _queue_items = None             # queued items
+    _item_current = None            # item that is played now
+    _process = None                 # player process
+    _process_stream = None          # player process that reads in-memory audio from stdin
+    _lock = None                    # guards player process and current item
+    _float_time_output_last = 0.0   # time of last output of remote player
+    _event_finished = None          # set by remote player output reader when playback is finished
+    _bool_error_remote = False      # whether remote player reports playback error
+    _thread = None                  # playback thread
+
+    def __init__(self, dict_config):
+        """
+        Constructs instance of AudioFilePlayer class.
+
+        :param dict_config: dict - audio file player configuration.
+        """
+        super(AudioFilePlayer, self).__init__(name=self.__class__.__name__)
+        self._str_command = dict_config['command'].encode('ascii', 'ignore')
+        if dict_config.get('remote_command'):
+            self._str_command_remote = dict_config['remote_command'].encode('ascii', 'ignore')
+        if dict_config.get('stream_command'):
+            self._str_command_stream = dict_config['stream_command'].encode('ascii', 'ignore')
+        self._float_watchdog_timeout = float(dict_config.get('watchdog_timeout', self.FLOAT_WATCHDOG_TIMEOUT_DEFAULT))
+        if dict_config.get('timeout'):
+            self._float_timeout = float(dict_config['timeout'])
+        self._queue_items = Queue()
+        self._lock = Lock()
+        self._thread = Thread(target=self._run, name=self.__class__.__name__)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def enqueue(self, str_path_file_audio):
+        """
+        Queues audio file for playback after already queued ones.
+
+        :param str_path_file_audio: string path to audio file.
+        :return: AudioFilePlayerItem - queued item.
+        """
+        item = AudioFilePlayerItem(str_path_file_audio)
+        self._queue_items.put(item)
+        self.logger.debug("%s is queued for playback.", str_path_file_audio)
+        return item
+
+    def play(self, str_path_file_audio):
+        """
+        Plays audio file and waits until playback is finished.
+
+        :param str_path_file_audio: string path to audio file.
+        :return: bool - indicator of succeeded playback.
+        """
+        return self.enqueue(str_path_file_audio).wait()
+
+    def enqueue_content(self, str_content_audio):
+        """
+        Queues in-memory audio for playback after already queued items.
+
+        :param str_content_audio: string - binary audio content.
+        :return: AudioFilePlayerItem - queued item.
+        """
+        item = AudioFilePlayerItem(None, str_content_audio)
+        self._queue_items.put(item)
+        self.logger.debug("%s is queued for playback.", item.get_name())
+        return item
+
+    def play_content(self, str_content_audio):
+        """
+        Plays in-memory audio and waits until playback is finished.
+
+        :param str_content_audio: string - binary audio content.
+        :return: bool - indicator of succeeded playback.
+        """
+        return self.enqueue_content(str_content_audio).wait()
+
+    def skip(self, item=None):
+        """
+        Skips audio file that is played now or passed queued one.
+
+        * Queued item is finished as interrupted without playback when its turn comes,
+          so skip is not lost if it is requested before playback thread takes item.
+
+        :param item: AudioFilePlayerItem - item to skip (None - item that is played now).
+        :return: None (next queued audio file will be played).
+        """
+        with self._lock:
+            if item is None:
+                item = self._item_current
+            if item is None or item.event_done.is_set():
+                return
+            item.bool_skipped = True
+            self.logger.debug("%s playback is skipped.", item.get_name())
+            if item is self._item_current:
+                self._interrupt()
+
+    def stop(self):
+        """
+        Stops playback and drops all queued audio files.
+
+        :return: None (player will be idle).
+        """
+        while True:
+            try:
+                self._queue_items.get_nowait().finish(False, bool_interrupted=True)
+            except Empty:
+                break
+        self.skip()
+        self.logger.debug("Playback is stopped.")
+
+    def is_playing(self):
+        """
+        Checks whether audio file is played now.
+
+        :return: bool - True (playing), False (idle).
+        """
+        return self._item_current is not None
+
+    def _run(self):
+        """
+        Playback thread loop.
+
+        :return: None.
+        """
+        while True:
+            item = self._queue_items.get()
+            with self._lock:
+                if item.bool_skipped:       # skipped while it is queued
+                    item.finish(False, bool_interrupted=True)
+                    continue
+                self._item_current = item
+            try:
+                with tracing.attach(item.span_context), \
+                        tracing.span("player.playback", remote=bool(self._str_command_remote)):
+                    if item.str_content_audio is not None:
+                        bool_result = self._play_content(item)
+                    elif self._str_command_remote:
+                        bool_result = self._play_remote(item)
+                    else:
+                        bool_result = self._play_command(item)
+            except (OSError, IOError) as e:
+                self.logger.error(msg=str(e), exc_info=True)
+                bool_result = False
+            with self._lock:
+                self._item_current = None
+            item.finish(bool_result, item.bool_skipped)
+
+    def _interrupt(self):
+        """
+        Interrupts current playback.
+
+        * Caller must hold the lock.
+        * Player process which is not started yet checks skip of its item itself.
+
+        :return: None.
+        """
+        if self._process_stream is not None and self._process_stream.poll() is None:
+            self._process_stream.kill()
+            return
+        if self._process is None or self._process.poll() is not None:
+            return
+        if self._str_command_remote:
+            try:
+                self._process.stdin.write("STOP\n")
+                self._process.stdin.flush()
+            except IOError:
+                self._process.kill()
+        else:
+            self._process.kill()
+
+    def _play_command(self, item):
+        """
+        Plays audio file by player process spawned for it.
+
+        :param item: AudioFilePlayerItem - item to play.
+        :return: bool - indicator of succeeded playback.
+        """
+        str_command = self._str_command.replace("{file}", item.str_path_file_audio)
+        self.logger.debug("It calls audio player to play audio.")
+        _file_output = tempfile.TemporaryFile()     # pipe could overflow while player is polled
+        with self._lock:
+            if item.bool_skipped:
+                _file_output.close()
+                return False
+            self._process = subprocess.Popen(str_command.split(' '), stdout=_file_output, stderr=subprocess.STDOUT)
+        return self._wait_process(self._process, _file_output)
+
+    def _wait_process(self, process, file_output):
+        """
+        Waits until player process is finished, kills it on playback timeout.
+
+        :param process: player process.
+        :param file_output: temporary file with player output (it will be closed).
+        :return: bool - indicator of succeeded playback.
+        """
+        _float_time_start = time.time()
+        while process.poll() is None:
+            if self._float_timeout is not None and time.time() - _float_time_start > self._float_timeout:
+                self.logger.warn("Audio player does not finish in %s seconds. It kills player.", self._float_timeout)
+                with self._lock:
+                    process.kill()
+                process.wait()
+                file_output.close()
+                return False
+            time.sleep(0.05)
+        file_output.seek(0)
+        self.logger.debug("\n" + file_output.read().decode('utf-8', 'ignore'))
+        file_output.close()
+        return process.returncode == 0
+
+    def _play_content(self, item):
+        """
+        Plays in-memory audio by player process that reads it from stdin.
+
+        * If stream command is not configured, audio is written to temporary file and played as audio file.
+
+        :param item: AudioFilePlayerItem - item to play.
+        :return: bool - indicator of succeeded playback.
+        """
+        if not self._str_command_stream:
+            return self._play_content_file(item)
+
+        self.logger.debug("It streams audio to audio player.")
+        _file_output = tempfile.TemporaryFile()     # pipe could overflow while player is polled
+        with self._lock:
+            if item.bool_skipped:
+                _file_output.close()
+                return False
+            self._process_stream = subprocess.Popen(shlex.split(self._str_command_stream), stdin=subprocess.PIPE,
+                                                    stdout=_file_output, stderr=subprocess.STDOUT)
+            process = self._process_stream
+        _thread_writer = Thread(target=self._write_stream, args=(process, item.str_content_audio),
+                                name="%s-writer" % self.__class__.__name__)
+        _thread_writer.daemon = True
+        _thread_writer.start()
+        try:
+            return self._wait_process(process, _file_output)
+        finally:
+            with self._lock:
+                self._process_stream = None
+
+    def _write_stream(self, process, str_content_audio):
+        """
+        Writes in-memory audio to stdin of player process.
+
+        :param process: player process.
+        :param str_content_audio: string - binary audio content.
+        :return: None (stdin will be closed).
+        """
+        try:
+            process.stdin.write(str_content_audio)
+            process.stdin.close()
+        except IOError:     # player process is killed
+            pass
+
+    def _play_content_file(self, item):
+        """
+        Plays in-memory audio from temporary file.
+
+        :param item: AudioFilePlayerItem - item to play.
+        :return: bool - indicator of succeeded playback.
+        """
+        import os
+
+        _int_descriptor, item.str_path_file_audio = tempfile.mkstemp(prefix="robotis_op2_tts.")
+        try:
+            with os.fdopen(_int_descriptor, 'wb') as _file_audio:
+                _file_audio.write(item.str_content_audio)
+            if self._str_command_remote:
+                return self._play_remote(item)
+            return self._play_command(item)
+        finally:
+            os.remove(item.str_path_file_audio)
+
+    def _start_remote(self):
+        """
+        Starts player process in remote control mode and its output reader thread.
+
+        * Caller must hold the lock.
+
+        :return: None (player process will be started).
+        """
+        if self._process is not None and self._process.poll() is None:
+            self._process.kill()
+        self._process = subprocess.Popen(shlex.split(self._str_command_remote), stdin=subprocess.PIPE,
+                                         stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        self._float_time_output_last = time.time()
+        self._event_finished = Event()
+        _thread_reader = Thread(target=self._read_remote, args=(self._process, self._event_finished),
+                                name="%s-reader" % self.__class__.__name__)
+        _thread_reader.daemon = True
+        _thread_reader.start()
+        self.logger.debug("Remote audio player is started. PID = %s", self._process.pid)
+
+    def _read_remote(self, process, event_finished):
+        """
+        Reads output of remote player process.
+            - "@P 0" - playback is finished.
+            - "@E <message>" - playback error.
+
+        :param process: player process.
+        :param event_finished: Event - set when playback is finished.
+        :return: None.
+        """
+        for _str_line in iter(process.stdout.readline, ''):
+            self._float_time_output_last = time.time()
+            if _str_line.startswith("@P 0"):
+                event_finished.set()
+            elif _str_line.startswith("@E"):
+                self.logger.error("Audio player error: %s", _str_line[3:].strip())
+                self._bool_error_remote = True
+                event_finished.set()
+        event_finished.set()    # player process is dead
+
+    def _play_remote(self, item):
+        """
+        Plays audio file by long-lived player process in remote control mode.
+
+        * Watchdog restarts player process if it produces no output for watchdog timeout.
+        * mpg123 remote mode has no queue: LOAD replaces current file, so next file is loaded
+          only after "@P 0" of previous one and playback is not gapless.
+
+        :param item: AudioFilePlayerItem - item to play.
+        :return: bool - indicator of succeeded playback (False if playback is skipped or stopped).
+        """
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._start_remote()
+            self._event_finished.clear()
+            if item.bool_skipped:
+                return False
+            self._bool_error_remote = False
+            self._float_time_output_last = time.time()
+            self._process.stdin.write("LOAD %s\n" % item.str_path_file_audio)
+            self._process.stdin.flush()
+        self.logger.debug("%s is loaded to remote audio player.", item.str_path_file_audio)
+
+        while not self._event_finished.wait(0.1):
+            if time.time() - self._float_time_output_last > self._float_watchdog_timeout:
+                self.logger.warn("Audio player hangs for %s seconds. It restarts player.",
+                                 self._float_watchdog_timeout)
+                with self._lock:
+                    self._start_remote()
+                return False
+        with self._lock:       # remote player reports stopped playback as finished one
+            return self._process.poll() is None and not self._bool_error_remote and not item.bool_skipped
+
+
+_dict_players = {}          # audio file players shared by TTS clients
+_lock_players = Lock()
+
+
+def get_audio_file_player(dict_config):
+    """
+    Returns audio file player shared by all TTS clients with the same player configuration.
+
+    :param dict_config: dict - audio file player configuration.
+    :return: AudioFilePlayer - player instance.
+    """
+    import json
+
+    str_key = json.dumps(dict_config, sort_keys=True)
+    with _lock_players:
+        if str_key not in _dict_players:
+            _dict_players[str_key] = AudioFilePlayer(dict_config)
+        return _dict_players[str_key]
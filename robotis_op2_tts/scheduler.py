@@ -0,0 +1,425 @@
+from base import LoggableInterface
+from _exceptions.scheduler import SchedulerQueueFullException, SchedulerClosedException
+from threading import Thread, Condition, Event
+import itertools
+import time
+
+_PENDING = object()         # marks segment which synthesis is in progress
+
+
+class ScheduledRequest(object):
+    """
+    Scheduled speech request class.
+        - Describes source text queued for speech, its priority and progress.
+        - Source text is split into sentence segments, so preempted request resumes from interrupted sentence.
+    """
+    STR_STATE_QUEUED = "queued"
+    STR_STATE_PLAYING = "playing"
+    STR_STATE_DONE = "done"
+    STR_STATE_CANCELLED = "cancelled"
+    STR_STATE_FAILED = "failed"
+
+    int_id = None                   # request ID
+    int_priority = None             # priority. Bigger value - more urgent
+    str_state = None                # request state
+    float_time_enqueued = None      # time of submission
+    float_time_started = None       # time of first playback start (None - not started yet)
+    int_count_preemptions = 0       # number of times playback was preempted
+    bool_result = None              # indicator of succeeded speech (None - not finished yet)
+
+    _scheduler = None               # scheduler that owns request
+    _list_segments = None           # sentences to speak
+    _list_results_synthesis = None  # per segment: None (not synthesized), _PENDING, (path, TTS type) or False (failed)
+    _int_index_segment = 0          # index of next segment to play
+    _bool_preempted = False         # whether current playback is interrupted by more urgent request
+    _bool_failed_segment = False    # whether any segment is not synthesized or played
+    _event_done = None              # set when request is finished
+
+    def __init__(self, scheduler, int_id, int_priority, list_segments):
+        self._scheduler = scheduler
+        self.int_id = int_id
+        self.int_priority = int_priority
+        self._list_segments = list_segments
+        self._list_results_synthesis = [None] * len(list_segments)
+        self.str_state = self.STR_STATE_QUEUED
+        self.float_time_enqueued = time.time()
+        self._event_done = Event()
+
+    def cancel(self):
+        """
+        Cancels request.
+            - Queued request is dropped, playing request is interrupted.
+
+        :return: bool - True (cancelled), False (already finished).
+        """
+        return self._scheduler.cancel(self)
+
+    def wait(self, float_timeout=None):
+        """
+        Waits until request is finished.
+
+        :param float_timeout: float - max time to wait, seconds (None - no limit).
+        :return: bool - indicator of succeeded speech.
+        """
+        self._event_done.wait(float_timeout)
+        return bool(self.bool_result)
+
+    def is_finished(self):
+        """
+        Checks whether request is finished (done, cancelled or failed).
+
+        :return: bool - True (finished), False (queued or playing).
+        """
+        return self._event_done.is_set()
+
+    def get_time_wait(self):
+        """
+        Returns time request waited in queue before playback start.
+
+        :return: float - wait time, seconds (up to now if playback is not started yet).
+        """
+        if self.float_time_started is None:
+            return time.time() - self.float_time_enqueued
+        return self.float_time_started - self.float_time_enqueued
+
+    def _finish(self, str_state, bool_result):
+        """
+        Marks request as finished.
+
+        * Caller must hold scheduler lock.
+
+        :param str_state: string - final state.
+        :param bool_result: bool - indicator of succeeded speech.
+        :return: None (waiters will be woken up).
+        """
+        self.str_state = str_state
+        self.bool_result = bool_result
+        self._event_done.set()
+
+
+class TTSScheduler(LoggableInterface):
+    """
+    Priority speech scheduler class.
+        - Queues speech requests of RobotisOP2TTSClient by priority (FIFO within the same priority).
+        - Synthesis workers synthesize segments of queued requests ahead of playback in priority order.
+        - Playback thread speaks the most urgent request, segment by segment.
+        - More urgent request preempts playback of less urgent one, which is resumed from interrupted segment later.
+        - Supports per-request cancellation, exposes queue depth and wait times.
+        - Supports logging feature.
+
+    Scheduler configuration dictionary keys (all are optional):
+        - queue_size - max number of queued requests.
+        - synthesis_workers - number of synthesis worker threads.
+
+    * If queue is full, the least urgent queued request is dropped in favor of more urgent one,
+      otherwise SchedulerQueueFullException is raised.
+    """
+    INT_PRIORITY_LOW = 0
+    INT_PRIORITY_NORMAL = 1
+    INT_PRIORITY_HIGH = 2
+    INT_PRIORITY_CRITICAL = 3           # e.g. safety announcements
+
+    INT_SIZE_QUEUE_DEFAULT = 16
+    INT_COUNT_WORKERS_DEFAULT = 2
+
+    _client_tts = None                  # RobotisOP2TTSClient
+    _int_size_queue = None              # max number of queued requests
+    _list_requests = None               # not finished requests sorted by urgency (including playing one)
+    _request_playing = None             # request which segment is played now
+    _player_playing = None              # audio file player of segment played now
+    _item_playing = None                # player queue item of segment played now
+    _condition = None                   # guards queue state, notified on every change
+    _iterator_ids = None                # request ID generator
+    _bool_closed = False                # whether scheduler is closed
+    _list_threads = None                # playback and synthesis threads
+    _dict_stats = None                  # counters of finished requests and wait times
+
+    def __init__(self, client_tts, dict_config=None):
+        """
+        Constructs instance of TTSScheduler class.
+
+        :param client_tts: RobotisOP2TTSClient - TTS client to synthesize speech.
+        :param dict_config: dict - scheduler configuration.
+        """
+        super(TTSScheduler, self).__init__(name=self.__class__.__name__)
+        if dict_config is None:
+            dict_config = {}
+        self._client_tts = client_tts
+        self._int_size_queue = int(dict_config.get('queue_size', self.INT_SIZE_QUEUE_DEFAULT))
+        self._list_requests = []
+        self._condition = Condition()
+        self._iterator_ids = itertools.count(1)
+        self._dict_stats = {'submitted': 0, 'done': 0, 'failed': 0, 'cancelled': 0, 'dropped': 0, 'preempted': 0,
+                            'started': 0, 'time_wait_total': 0.0, 'time_wait_max': 0.0}
+
+        self._list_threads = [Thread(target=self._run_playback, name="%s-playback" % self.__class__.__name__)]
+        for _int_index in range(int(dict_config.get('synthesis_workers', self.INT_COUNT_WORKERS_DEFAULT))):
+            self._list_threads.append(Thread(target=self._run_synthesis,
+                                             name="%s-synthesis-%s" % (self.__class__.__name__, _int_index)))
+        for _thread in self._list_threads:
+            _thread.daemon = True
+            _thread.start()
+        self.logger.debug("Instance initialization succeeds.")
+
+    def submit(self, source_text, int_priority=INT_PRIORITY_NORMAL):
+        """
+        Queues source text for speech.
+
+        :raises:
+            * SchedulerQueueFullException - if queue is full of not less urgent requests.
+            * SchedulerClosedException - if scheduler is closed.
+        :param source_text: string or file with text to speak.
+        :param int_priority: int - priority. Bigger value - more urgent.
+        :return: ScheduledRequest - queued request.
+        """
+        from text_processing import read_source_text, split_sentences
+
+        str_text = read_source_text(source_text)
+        list_segments = split_sentences(str_text) or [str_text]
+        with self._condition:
+            if self._bool_closed:
+                raise SchedulerClosedException()
+            list_requests_queued = [_request for _request in self._list_requests if _request is not self._request_playing]
+            if len(list_requests_queued) >= self._int_size_queue:
+                request_least = list_requests_queued[-1]
+                if request_least.int_priority >= int_priority:
+                    raise SchedulerQueueFullException(self._int_size_queue)
+                self._list_requests.remove(request_least)
+                request_least._finish(ScheduledRequest.STR_STATE_CANCELLED, False)
+                self._dict_stats['dropped'] += 1
+                self.logger.warn("Queue is full. Request %s (priority %s) is dropped.",
+                                 request_least.int_id, request_least.int_priority)
+
+            request = ScheduledRequest(self, next(self._iterator_ids), int(int_priority), list_segments)
+            self._list_requests.append(request)
+            self._sort_requests()
+            self._dict_stats['submitted'] += 1
+            self.logger.debug("Request %s (priority %s, %s segments) is queued.",
+                              request.int_id, request.int_priority, len(list_segments))
+
+            if self._request_playing is not None and not self._request_playing._bool_preempted and \
+                    self._request_playing.int_priority < request.int_priority:
+                self.logger.info("Request %s preempts playback of request %s.",
+                                 request.int_id, self._request_playing.int_id)
+                self._request_playing._bool_preempted = True
+                self._request_playing.int_count_preemptions += 1
+                self._dict_stats['preempted'] += 1
+                self._player_playing.skip(self._item_playing)
+            self._condition.notify_all()
+        return request
+
+    def cancel(self, request):
+        """
+        Cancels request.
+
+        :param request: ScheduledRequest - request to cancel.
+        :return: bool - True (cancelled), False (already finished).
+        """
+        with self._condition:
+            if request not in self._list_requests:
+                return False
+            self._list_requests.remove(request)
+            if request is self._request_playing:
+                self._player_playing.skip(self._item_playing)
+            request._finish(ScheduledRequest.STR_STATE_CANCELLED, False)
+            self._dict_stats['cancelled'] += 1
+            self._condition.notify_all()
+        self.logger.debug("Request %s is cancelled.", request.int_id)
+        return True
+
+    def get_queue_depth(self):
+        """
+        Returns number of requests waiting for playback.
+
+        * Preempted request is counted as waiting.
+
+        :return: int - queue depth.
+        """
+        with self._condition:
+            return len([_request for _request in self._list_requests if _request is not self._request_playing])
+
+    def get_stats(self):
+        """
+        Returns scheduler statistics.
+
+        Statistics dictionary keys:
+            - depth - number of requests waiting for playback.
+            - depth_by_priority - dict: priority -> number of waiting requests.
+            - time_wait_oldest - wait time of the oldest waiting request, seconds.
+            - time_wait_mean - mean wait time of started requests, seconds.
+            - time_wait_max - max wait time of started requests, seconds.
+            - submitted, done, failed, cancelled, dropped, preempted - request counters.
+
+        :return: dict - statistics.
+        """
+        with self._condition:
+            list_requests_queued = [_request for _request in self._list_requests if _request is not self._request_playing]
+            dict_depth_by_priority = {}
+            for _request in list_requests_queued:
+                dict_depth_by_priority[_request.int_priority] = dict_depth_by_priority.get(_request.int_priority, 0) + 1
+            dict_stats = dict((_str_key, _value) for _str_key, _value in self._dict_stats.items()
+                              if _str_key not in ('started', 'time_wait_total'))
+            dict_stats['depth'] = len(list_requests_queued)
+            dict_stats['depth_by_priority'] = dict_depth_by_priority
+            dict_stats['time_wait_oldest'] = max([_request.get_time_wait() for _request in list_requests_queued
+                                                  if _request.float_time_started is None] or [0.0])
+            dict_stats['time_wait_mean'] = (self._dict_stats['time_wait_total'] / self._dict_stats['started']
+                                            if self._dict_stats['started'] else 0.0)
+        return dict_stats
+
+    def close(self):
+        """
+        Cancels all requests and stops scheduler threads.
+
+        :return: None.
+        """
+        with self._condition:
+            self._bool_closed = True
+            for _request in list(self._list_requests):
+                if _request is self._request_playing:
+                    self._player_playing.skip(self._item_playing)
+                _request._finish(ScheduledRequest.STR_STATE_CANCELLED, False)
+                self._dict_stats['cancelled'] += 1
+            self._list_requests = []
+            self._condition.notify_all()
+        for _thread in self._list_threads:
+            _thread.join()
+        self.logger.debug("Scheduler is closed.")
+
+    def _sort_requests(self):
+        """
+        Sorts requests by urgency: priority descending, then submission order.
+
+        * Caller must hold the lock.
+
+        :return: None.
+        """
+        self._list_requests.sort(key=lambda _request: (-_request.int_priority, _request.int_id))
+
+    def _get_segment_to_synthesize(self):
+        """
+        Returns the most urgent segment which is not synthesized yet and marks it as pending.
+
+        * Caller must hold the lock.
+
+        :return: tuple (ScheduledRequest, int segment index) or None if there is nothing to synthesize.
+        """
+        for _request in self._list_requests:
+            for _int_index in range(_request._int_index_segment, len(_request._list_segments)):
+                if _request._list_results_synthesis[_int_index] is None:
+                    _request._list_results_synthesis[_int_index] = _PENDING
+                    return _request, _int_index
+        return None
+
+    def _run_synthesis(self):
+        """
+        Synthesis worker loop.
+
+        :return: None.
+        """
+        import tracing
+
+        while True:
+            with self._condition:
+                tuple_segment = self._get_segment_to_synthesize()
+                while tuple_segment is None:
+                    if self._bool_closed:
+                        return
+                    self._condition.wait()
+                    tuple_segment = self._get_segment_to_synthesize()
+            request, int_index = tuple_segment
+
+            with tracing.span("scheduler.synthesize", request=request.int_id, segment=int_index):
+                try:
+                    str_path_file_audio, str_type_tts = self._client_tts.synthesize_audio_by_engine(
+                        request._list_segments[int_index])
+                except SystemExit:      # TTS clients exit on failure
+                    str_path_file_audio, str_type_tts = None, None
+                except Exception as e:
+                    self.logger.error(msg=str(e), exc_info=True)
+                    str_path_file_audio, str_type_tts = None, None
+
+            with self._condition:
+                if str_path_file_audio is None:
+                    request._list_results_synthesis[int_index] = False
+                else:
+                    request._list_results_synthesis[int_index] = (str_path_file_audio, str_type_tts)
+                self._condition.notify_all()
+
+    def _run_playback(self):
+        """
+        Playback thread loop.
+            - Plays next segment of the most urgent request as soon as it is synthesized.
+
+        :return: None.
+        """
+        while True:
+            with self._condition:
+                while True:
+                    if self._bool_closed:
+                        return
+                    if self._list_requests:
+                        request = self._list_requests[0]
+                        result_synthesis = request._list_results_synthesis[request._int_index_segment]
+                        if result_synthesis is not None and result_synthesis is not _PENDING:
+                            break
+                    self._condition.wait()
+
+                if result_synthesis is False:       # segment is not synthesized, it is skipped
+                    self._advance(request, False)
+                    continue
+                str_path_file_audio, str_type_tts = result_synthesis
+                player = self._client_tts.get_audio_file_player(str_type_tts)
+                if player is None:
+                    self._advance(request, False)
+                    continue
+                if request.float_time_started is None:
+                    request.float_time_started = time.time()
+                    self._dict_stats['started'] += 1
+                    self._dict_stats['time_wait_total'] += request.get_time_wait()
+                    self._dict_stats['time_wait_max'] = max(self._dict_stats['time_wait_max'], request.get_time_wait())
+                request.str_state = ScheduledRequest.STR_STATE_PLAYING
+                request._bool_preempted = False
+                self._request_playing = request
+                self._player_playing = player
+                item = player.enqueue(str_path_file_audio)
+                self._item_playing = item
+
+            bool_result = item.wait()
+
+            with self._condition:
+                self._request_playing = None
+                self._player_playing = None
+                self._item_playing = None
+                if request.is_finished():           # cancelled while playing
+                    continue
+                if request._bool_preempted and item.bool_interrupted:   # segment will be played again
+                    request.str_state = ScheduledRequest.STR_STATE_QUEUED
+                    continue
+                self._advance(request, bool_result)
+
+    def _advance(self, request, bool_result_segment):
+        """
+        Moves request to next segment, finishes request after the last one.
+
+        * Caller must hold the lock.
+
+        :param request: ScheduledRequest - request which segment is finished.
+        :param bool_result_segment: bool - indicator of succeeded segment playback.
+        :return: None.
+        """
+        if not bool_result_segment:
+            request._bool_failed_segment = True
+        request._int_index_segment += 1
+        if request._int_index_segment < len(request._list_segments):
+            self._condition.notify_all()
+            return
+        self._list_requests.remove(request)
+        if request._bool_failed_segment:
+            request._finish(ScheduledRequest.STR_STATE_FAILED, False)
+            self._dict_stats['failed'] += 1
+        else:
+            request._finish(ScheduledRequest.STR_STATE_DONE, True)
+            self._dict_stats['done'] += 1
+        self.logger.debug("Request %s is %s.", request.int_id, request.str_state)
+        self._condition.notify_all()
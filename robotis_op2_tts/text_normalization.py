@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+from base import LoggableInterface
+import re
+
+REGEX_WHITESPACE = re.compile(u'[\\s\u200b\ufeff]+', re.UNICODE)     # whitespaces and zero width characters
+REGEX_SPACE_BEFORE_PUNCTUATION = re.compile(u'\\s+([,.;:!?])', re.UNICODE)
+REGEX_PUNCTUATION_REPEATED = re.compile(u'([!?,;:])\\1+', re.UNICODE)
+REGEX_DATE_ISO = re.compile(u'(?<!\\d)(\\d{4})-(\\d{1,2})-(\\d{1,2})(?!\\d)', re.UNICODE)
+REGEX_DATE_DAY_FIRST = re.compile(u'(?<![\\d.])(\\d{1,2})[./](\\d{1,2})[./](\\d{4})(?![\\d]|\\.\\d)', re.UNICODE)
+REGEX_INTEGER = re.compile(u'(?<![\\d.,])(?:\\d{1,3}(?:[ \u00a0\u2009\u202f]\\d{3})+|\\d+)(?![.,]?\\d)',
+                           re.UNICODE)     # digit groups may be separated by regular, no-break or thin space
+REGEX_SEPARATOR_DIGITS = re.compile(u'[ \u00a0\u2009\u202f]', re.UNICODE)
+
+DICT_CHARACTERS = {     # typographic character -> canonical one
+    u'“': u'"', u'”': u'"', u'„': u'"', u'‟': u'"', u'«': u'"', u'»': u'"',
+    u'″': u'"', u'‘': u"'", u'’': u"'", u'‚': u"'", u'‛': u"'", u'′': u"'",
+    u'`': u"'", u'‐': u'-', u'‑': u'-', u'‒': u'-', u'–': u'-', u'—': u'-',
+    u'―': u'-', u'−': u'-', u'…': u'...'
+}
+STR_CHARACTERS_END = u'.!?'                 # sentence terminal punctuation
+STR_CHARACTERS_CLOSING = u'"\')]'           # characters which may follow terminal punctuation
+
+# English rules
+LIST_EN_ONES = [u"zero", u"one", u"two", u"three", u"four", u"five", u"six", u"seven", u"eight", u"nine", u"ten",
+                u"eleven", u"twelve", u"thirteen", u"fourteen", u"fifteen", u"sixteen", u"seventeen", u"eighteen",
+                u"nineteen"]
+LIST_EN_TENS = [u"", u"", u"twenty", u"thirty", u"forty", u"fifty", u"sixty", u"seventy", u"eighty", u"ninety"]
+LIST_EN_SCALES = [(10 ** 9, u"billion"), (10 ** 6, u"million"), (1000, u"thousand")]
+DICT_EN_ORDINALS = {u"one": u"first", u"two": u"second", u"three": u"third", u"five": u"fifth", u"eight": u"eighth",
+                    u"nine": u"ninth", u"twelve": u"twelfth"}
+LIST_EN_MONTHS = [u"January", u"February", u"March", u"April", u"May", u"June", u"July", u"August", u"September",
+                  u"October", u"November", u"December"]
+LIST_EN_ABBREVIATIONS = [(u"Dr.", u"Doctor"), (u"Mr.", u"Mister"), (u"Mrs.", u"Missis"), (u"e.g.", u"for example"),
+                         (u"i.e.", u"that is"), (u"etc.", u"et cetera"), (u"vs.", u"versus")]
+
+# Russian rules
+LIST_RU_UNITS = [u"ноль", u"один", u"два", u"три", u"четыре", u"пять", u"шесть", u"семь", u"восемь", u"девять"]
+LIST_RU_UNITS_FEMININE = [u"ноль", u"одна", u"две"]
+LIST_RU_TEENS = [u"десять", u"одиннадцать", u"двенадцать", u"тринадцать", u"четырнадцать", u"пятнадцать",
+                 u"шестнадцать", u"семнадцать", u"восемнадцать", u"девятнадцать"]
+LIST_RU_TENS = [u"", u"", u"двадцать", u"тридцать", u"сорок", u"пятьдесят", u"шестьдесят", u"семьдесят",
+                u"восемьдесят", u"девяносто"]
+LIST_RU_HUNDREDS = [u"", u"сто", u"двести", u"триста", u"четыреста", u"пятьсот", u"шестьсот", u"семьсот",
+                    u"восемьсот", u"девятьсот"]
+LIST_RU_SCALES = [(10 ** 9, (u"миллиард", u"миллиарда", u"миллиардов"), False),     # (scale, forms, feminine)
+                  (10 ** 6, (u"миллион", u"миллиона", u"миллионов"), False),
+                  (1000, (u"тысяча", u"тысячи", u"тысяч"), True)]
+DICT_RU_ORDINAL_STEMS = {
+    1: u"перв", 2: u"втор", 3: u"трет", 4: u"четвёрт", 5: u"пят", 6: u"шест", 7: u"седьм", 8: u"восьм", 9: u"девят",
+    10: u"десят", 11: u"одиннадцат", 12: u"двенадцат", 13: u"тринадцат", 14: u"четырнадцат", 15: u"пятнадцат",
+    16: u"шестнадцат", 17: u"семнадцат", 18: u"восемнадцат", 19: u"девятнадцат",
+    20: u"двадцат", 30: u"тридцат", 40: u"сороков", 50: u"пятидесят", 60: u"шестидесят", 70: u"семидесят",
+    80: u"восьмидесят", 90: u"девяност",
+    100: u"сот", 200: u"двухсот", 300: u"трёхсот", 400: u"четырёхсот", 500: u"пятисот", 600: u"шестисот",
+    700: u"семисот", 800: u"восьмисот", 900: u"девятисот",
+    1000: u"тысячн", 2000: u"двухтысячн"
+}
+LIST_RU_MONTHS_GENITIVE = [u"января", u"февраля", u"марта", u"апреля", u"мая", u"июня", u"июля", u"августа",
+                           u"сентября", u"октября", u"ноября", u"декабря"]
+LIST_RU_ABBREVIATIONS = [(u"т.е.", u"то есть"), (u"т.к.", u"так как"), (u"т.д.", u"так далее"),
+                         (u"т.п.", u"тому подобное")]
+
+INT_NUMBER_MAX = 10 ** 12 - 1       # bigger numbers are left as digits
+
+
+def get_words_number_en(int_number):
+    """
+    Returns British English cardinal number words.
+
+    :param int_number: int - number from 0 to INT_NUMBER_MAX.
+    :return: unicode - number words.
+    """
+    def _get_words_below_thousand(_int_number):
+        _list_words = []
+        _int_hundreds, _int_rest = divmod(_int_number, 100)
+        if _int_hundreds:
+            _list_words.append(u"%s hundred" % LIST_EN_ONES[_int_hundreds])
+        if _int_rest:
+            if _int_hundreds:
+                _list_words.append(u"and")
+            if _int_rest < 20:
+                _list_words.append(LIST_EN_ONES[_int_rest])
+            elif _int_rest % 10:
+                _list_words.append(u"%s-%s" % (LIST_EN_TENS[_int_rest // 10], LIST_EN_ONES[_int_rest % 10]))
+            else:
+                _list_words.append(LIST_EN_TENS[_int_rest // 10])
+        return _list_words
+
+    if int_number == 0:
+        return LIST_EN_ONES[0]
+    list_words = []
+    for _int_scale, _str_scale in LIST_EN_SCALES:
+        _int_count, int_number = divmod(int_number, _int_scale)
+        if _int_count:
+            list_words.extend(_get_words_below_thousand(_int_count) + [_str_scale])
+    if int_number:
+        if list_words and int_number < 100:
+            list_words.append(u"and")
+        list_words.extend(_get_words_below_thousand(int_number))
+    return u" ".join(list_words)
+
+
+def get_words_ordinal_en(int_number):
+    """
+    Returns English ordinal number words.
+
+    :param int_number: int - number from 1 to INT_NUMBER_MAX.
+    :return: unicode - ordinal number words.
+    """
+    str_words = get_words_number_en(int_number)
+    _int_index = max(str_words.rfind(u" "), str_words.rfind(u"-")) + 1
+    str_word_last = str_words[_int_index:]
+    if str_word_last in DICT_EN_ORDINALS:
+        str_word_last = DICT_EN_ORDINALS[str_word_last]
+    elif str_word_last.endswith(u"y"):
+        str_word_last = str_word_last[:-1] + u"ieth"
+    else:
+        str_word_last += u"th"
+    return str_words[:_int_index] + str_word_last
+
+
+def get_words_year_en(int_year):
+    """
+    Returns British English year words (e.g. "nineteen ninety-nine", "two thousand and five").
+
+    :param int_year: int - year from 1 to 9999.
+    :return: unicode - year words.
+    """
+    _int_century, _int_rest = divmod(int_year, 100)
+    if int_year < 1000 or 2000 <= int_year < 2010 or _int_century % 10 == 0:
+        return get_words_number_en(int_year)
+    if _int_rest == 0:
+        return u"%s hundred" % get_words_number_en(_int_century)
+    if _int_rest < 10:
+        return u"%s oh %s" % (get_words_number_en(_int_century), get_words_number_en(_int_rest))
+    return u"%s %s" % (get_words_number_en(_int_century), get_words_number_en(_int_rest))
+
+
+def get_words_date_en(int_year, int_month, int_day):
+    """
+    Returns British English date words (e.g. "the seventeenth of May twenty twenty-four").
+
+    :param int_year: int - year from 1 to 9999.
+    :param int_month: int - month from 1 to 12.
+    :param int_day: int - day from 1 to 31.
+    :return: unicode - date words.
+    """
+    return u"the %s of %s %s" % (get_words_ordinal_en(int_day), LIST_EN_MONTHS[int_month - 1],
+                                 get_words_year_en(int_year))
+
+
+def get_words_number_ru(int_number):
+    """
+    Returns Russian cardinal number words (masculine nominative).
+
+    :param int_number: int - number from 0 to INT_NUMBER_MAX.
+    :return: unicode - number words.
+    """
+    def _get_words_below_thousand(_int_number, _bool_feminine):
+        _list_words = []
+        _int_hundreds, _int_rest = divmod(_int_number, 100)
+        if _int_hundreds:
+            _list_words.append(LIST_RU_HUNDREDS[_int_hundreds])
+        if 10 <= _int_rest < 20:
+            _list_words.append(LIST_RU_TEENS[_int_rest - 10])
+        else:
+            _int_tens, _int_units = divmod(_int_rest, 10)
+            if _int_tens:
+                _list_words.append(LIST_RU_TENS[_int_tens])
+            if _int_units:
+                if _bool_feminine and _int_units < 3:
+                    _list_words.append(LIST_RU_UNITS_FEMININE[_int_units])
+                else:
+                    _list_words.append(LIST_RU_UNITS[_int_units])
+        return _list_words
+
+    def _get_form_plural(_int_number, _tuple_forms):
+        if 11 <= _int_number % 100 <= 14:
+            return _tuple_forms[2]
+        if _int_number % 10 == 1:
+            return _tuple_forms[0]
+        if 2 <= _int_number % 10 <= 4:
+            return _tuple_forms[1]
+        return _tuple_forms[2]
+
+    if int_number == 0:
+        return LIST_RU_UNITS[0]
+    list_words = []
+    for _int_scale, _tuple_forms, _bool_feminine in LIST_RU_SCALES:
+        _int_count, int_number = divmod(int_number, _int_scale)
+        if _int_count == 1 and _int_scale == 1000:      # "тысяча", not "одна тысяча"
+            list_words.append(_tuple_forms[0])
+        elif _int_count:
+            list_words.extend(_get_words_below_thousand(_int_count, _bool_feminine) +
+                              [_get_form_plural(_int_count, _tuple_forms)])
+    list_words.extend(_get_words_below_thousand(int_number, False))
+    return u" ".join(list_words)
+
+
+def get_words_ordinal_ru(int_number, str_ending):
+    """
+    Returns Russian ordinal number words.
+        - Only last component of number is ordinal (e.g. "две тысячи двадцать четвёртого").
+
+    :param int_number: int - number from 1 to 9999.
+    :param str_ending: unicode - ending of case and gender (e.g. u"ое" - neuter nominative, u"ого" - genitive).
+    :return: unicode - ordinal number words.
+    """
+    if int_number % 1000 == 0:
+        int_last = int_number if int_number in DICT_RU_ORDINAL_STEMS else None
+    elif int_number % 100 == 0:
+        int_last = int_number % 1000
+    elif 10 <= int_number % 100 < 20 or int_number % 10 == 0:
+        int_last = int_number % 100
+    else:
+        int_last = int_number % 10
+    if int_last is None:
+        return get_words_number_ru(int_number)
+
+    str_stem = DICT_RU_ORDINAL_STEMS[int_last]
+    if int_last == 3:       # "третье", "третьего"
+        str_word_last = str_stem + {u"ое": u"ье", u"ого": u"ьего"}.get(str_ending, str_ending)
+    else:
+        str_word_last = str_stem + str_ending
+    if int_number == int_last:
+        return str_word_last
+    return u"%s %s" % (get_words_number_ru(int_number - int_last), str_word_last)
+
+
+def get_words_date_ru(int_year, int_month, int_day):
+    """
+    Returns Russian date words (e.g. "семнадцатое мая две тысячи двадцать четвёртого года").
+
+    :param int_year: int - year from 1 to 9999.
+    :param int_month: int - month from 1 to 12.
+    :param int_day: int - day from 1 to 31.
+    :return: unicode - date words.
+    """
+    return u"%s %s %s года" % (get_words_ordinal_ru(int_day, u"ое"), LIST_RU_MONTHS_GENITIVE[int_month - 1],
+                               get_words_ordinal_ru(int_year, u"ого"))
+
+
+DICT_RULES_LANGUAGES = {        # language -> rules of number, date and abbreviation expansion
+    'en': {'number': get_words_number_en, 'date': get_words_date_en, 'abbreviations': LIST_EN_ABBREVIATIONS},
+    'ru': {'number': get_words_number_ru, 'date': get_words_date_ru, 'abbreviations': LIST_RU_ABBREVIATIONS}
+}
+DICT_LANGUAGES = {'en': 'en', 'english': 'en', 'ru': 'ru', 'russian': 'ru'}     # TTS engine language -> rules language
+
+
+def get_language_rules(str_language):
+    """
+    Returns rules language of TTS engine language.
+
+    :param str_language: string - TTS engine language (e.g. "en-GB", "ru-RU", "english", "russian").
+    :return: str - rules language (None if there are no rules of language).
+    """
+    if not str_language:
+        return None
+    str_language = str(str_language).lower()
+    return DICT_LANGUAGES.get(str_language, DICT_LANGUAGES.get(str_language.split('-')[0]))
+
+
+class TextNormalizer(LoggableInterface):
+    """
+    Text normalizer class.
+        - Canonicalizes text before synthesis cache key is computed and TTS engine is called,
+          so inputs that differ only in typography map to the same cached audio.
+        - Supports logging feature.
+
+    Canonicalization steps:
+        - typographic quotes, dashes and ellipsis are replaced by ASCII ones;
+        - whitespaces are collapsed, spaces before punctuation are removed;
+        - repeated punctuation is collapsed, terminal punctuation is added if it is missing;
+        - abbreviations, dates and numbers are expanded to words by rules of language (optional);
+        - letter case is lowered (optional).
+
+    Text normalization configuration dictionary keys (all are optional):
+        - enabled - whether text is canonicalized (True by default).
+        - abbreviations - whether abbreviations are expanded (False by default).
+        - dates - whether numeric dates are expanded (False by default).
+        - numbers - whether integers are expanded (False by default).
+        - lowercase - whether letter case is lowered (False by default, acronyms could be read as words).
+
+    * Text marked up with SSML is only stripped.
+    * Expansion is performed only for languages with rules (en, ru).
+    """
+    _bool_enabled = True            # whether text is canonicalized
+    _bool_lowercase = False         # whether letter case is lowered
+    _dict_rules = None              # expansion rules of language (None - no rules)
+    _bool_numbers = False           # whether integers are expanded
+    _bool_dates = False             # whether dates are expanded
+    _list_abbreviations = None      # tuples (compiled abbreviation regex, expansion)
+
+    def __init__(self, dict_config=None, str_language=None):
+        """
+        Constructs instance of TextNormalizer class.
+
+        :param dict_config: dict - text normalization configuration.
+        :param str_language: string - TTS engine language (e.g. "en-GB", "russian").
+        """
+        super(TextNormalizer, self).__init__(name=self.__class__.__name__)
+        if dict_config is None:
+            dict_config = {}
+        self._bool_enabled = bool(dict_config.get('enabled', True))
+        self._bool_lowercase = bool(dict_config.get('lowercase', False))
+        self._dict_rules = DICT_RULES_LANGUAGES.get(get_language_rules(str_language))
+        self._list_abbreviations = []
+        if self._dict_rules is not None:
+            self._bool_numbers = bool(dict_config.get('numbers', False))
+            self._bool_dates = bool(dict_config.get('dates', False))
+            if dict_config.get('abbreviations', False):
+                for _unicode_abbreviation, _unicode_expansion in self._dict_rules['abbreviations']:
+                    _str_pattern = u"\\.\\s*".join(re.escape(_str_part) for _str_part in _unicode_abbreviation.split(u"."))
+                    self._list_abbreviations.append(
+                        (re.compile(u"(?<!\\w)%s(?!\\w)" % _str_pattern, re.UNICODE), _unicode_expansion))
+        elif str_language and (dict_config.get('numbers') or dict_config.get('dates') or dict_config.get('abbreviations')):
+            self.logger.warn("There are no text expansion rules of %s language.", str_language)
+
+    def normalize(self, str_text):
+        """
+        Returns canonical form of text.
+
+        :param str_text: string - text to normalize.
+        :return: str - normalized text of the same type as str_text (str or unicode).
+        """
+        if not self._bool_enabled or str_text.strip().startswith("<speak>"):
+            return str_text.strip()
+
+        bool_is_encoded = not isinstance(str_text, unicode)
+        _unicode_text = str_text.decode('utf-8') if bool_is_encoded else str_text
+
+        _unicode_text = u"".join(DICT_CHARACTERS.get(_char, _char) for _char in _unicode_text)
+        for _regex_abbreviation, _unicode_expansion in self._list_abbreviations:
+            _unicode_text = _regex_abbreviation.sub(_unicode_expansion, _unicode_text)
+        if self._bool_dates:
+            _unicode_text = REGEX_DATE_ISO.sub(lambda _match: self._get_words_date(
+                _match.group(1), _match.group(2), _match.group(3), _match.group(0)), _unicode_text)
+            _unicode_text = REGEX_DATE_DAY_FIRST.sub(lambda _match: self._get_words_date(
+                _match.group(3), _match.group(2), _match.group(1), _match.group(0)), _unicode_text)
+        if self._bool_numbers:
+            _unicode_text = REGEX_INTEGER.sub(self._get_words_number, _unicode_text)
+        if self._bool_lowercase:
+            _unicode_text = _unicode_text.lower()
+
+        _unicode_text = REGEX_WHITESPACE.sub(u" ", _unicode_text).strip()
+        _unicode_text = REGEX_SPACE_BEFORE_PUNCTUATION.sub(u"\\1", _unicode_text)
+        _unicode_text = REGEX_PUNCTUATION_REPEATED.sub(u"\\1", _unicode_text)
+        _unicode_text_tail = _unicode_text.rstrip(STR_CHARACTERS_CLOSING)
+        if _unicode_text_tail and _unicode_text_tail[-1] not in STR_CHARACTERS_END:
+            _unicode_text += u"."
+
+        return _unicode_text.encode('utf-8') if bool_is_encoded else _unicode_text
+
+    def _get_words_date(self, str_year, str_month, str_day, str_date):
+        """
+        Returns words of date or date itself if it is not valid.
+
+        :param str_year: string - year digits.
+        :param str_month: string - month digits.
+        :param str_day: string - day digits.
+        :param str_date: string - matched date.
+        :return: unicode - date words.
+        """
+        int_year, int_month, int_day = int(str_year), int(str_month), int(str_day)
+        if not (1 <= int_month <= 12 and 1 <= int_day <= 31 and 1 <= int_year <= 9999):
+            return str_date
+        return self._dict_rules['date'](int_year, int_month, int_day)
+
+    def _get_words_number(self, match):
+        """
+        Returns words of matched integer or integer itself if it is too big.
+            - Digit groups separated by spaces (e.g. "1 000 000") are joined into single integer.
+
+        :param match: regex match of integer.
+        :return: unicode - number words.
+        """
+        int_number = int(REGEX_SEPARATOR_DIGITS.sub(u"", match.group(0)))
+        if int_number > INT_NUMBER_MAX:
+            return match.group(0)
+        return self._dict_rules['number'](int_number)
@@ -0,0 +1,297 @@
+import re
+
+REGEX_SENTENCE_END = re.compile(u'(?<=[.!?\u2026])\\s+|\\n\\s*\\n', re.UNICODE)     # sentence or paragraph boundary
+REGEX_PARAGRAPH_END = re.compile(u'\\n\\s*\\n', re.UNICODE)                              # paragraph boundary
+REGEX_WHITESPACE = re.compile(u'\\s+', re.UNICODE)                                        # word boundary
+
+REGEX_SSML_TAG = re.compile(u'(<[^>]+>)', re.UNICODE)                                   # SSML tag
+REGEX_SSML_ELEMENT = re.compile(u'^\\s*(<([\\w:-]+)[^>]*>)(.*)(</\\2\\s*>)\\s*$', re.UNICODE | re.DOTALL)  # single element
+REGEX_SSML_SPEAK = re.compile(u'^\\s*(<speak[^>]*>)(.*)(</speak\\s*>)\\s*$', re.UNICODE | re.DOTALL)  # root element
+
+INT_SIZE_CHUNK_READ = 4096      # size of chunk source file is read by, characters (bytes for binary file)
+
+
+def read_source_text(source_text):
+    """
+    Returns text of source.
+
+    :param source_text: string or file with text.
+    :return: str - text (content of file if source_text is represented as file).
+    """
+    if hasattr(source_text, 'read'):    # if source_text is represented as file
+        return source_text.read().strip()
+    return source_text
+
+
+def split_sentences(str_text):
+    """
+    Splits text into sentences.
+
+    * Text marked up with SSML is not split.
+    * Empty sentences are skipped.
+
+    :param str_text: string - text to split.
+    :return: list - sentences of the same type as str_text (str or unicode).
+    """
+    if str_text.strip().startswith("<speak>"):
+        return [str_text]
+
+    bool_is_encoded = not isinstance(str_text, unicode)
+    _unicode_text = str_text.decode('utf-8') if bool_is_encoded else str_text
+    list_sentences = []
+    for _unicode_sentence in REGEX_SENTENCE_END.split(_unicode_text):
+        _unicode_sentence = _unicode_sentence.strip()
+        if _unicode_sentence:
+            list_sentences.append(_unicode_sentence.encode('utf-8') if bool_is_encoded else _unicode_sentence)
+    return list_sentences
+
+
+def _get_index_cut(unicode_text, int_size_max):
+    """
+    Returns index text should be cut at to get segment not longer than int_size_max.
+        - Paragraph boundary is preferred, then sentence boundary, then word boundary.
+        - Text is cut at int_size_max if there is no boundary.
+
+    :param unicode_text: unicode - text longer than int_size_max.
+    :param int_size_max: int - max length of segment, characters.
+    :return: int - index of the first character of rest of text.
+    """
+    _unicode_window = unicode_text[:int_size_max + 1]     # boundary may start right after max length
+    for _regex in (REGEX_PARAGRAPH_END, REGEX_SENTENCE_END, REGEX_WHITESPACE):
+        list_int_indexes = [_match.start() for _match in _regex.finditer(_unicode_window)
+                            if 0 < _match.start() <= int_size_max]
+        if list_int_indexes:
+            return list_int_indexes[-1]
+    return int_size_max
+
+
+def iter_segments(source_text, int_size_max):
+    """
+    Yields segments of source text not longer than int_size_max.
+        - File is read by chunks, so memory usage does not depend on file size.
+        - Text is split on paragraph and sentence boundaries (see _get_index_cut).
+
+    * Text marked up with SSML is not split.
+    * Empty segments are skipped.
+
+    :param source_text: string or file with text.
+    :param int_size_max: int - max length of segment, characters.
+    :return: generator - segments of the same type as source text (str or unicode).
+    """
+    import codecs
+
+    if hasattr(source_text, 'read'):    # if source_text is represented as file
+        iter_chunks = iter(lambda: source_text.read(INT_SIZE_CHUNK_READ), '')
+    else:
+        iter_chunks = iter([source_text])
+
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    bool_is_encoded = None
+    bool_is_ssml = None
+    _unicode_buffer = u''
+    for _chunk in iter_chunks:
+        if bool_is_encoded is None:
+            bool_is_encoded = not isinstance(_chunk, unicode)
+        _unicode_buffer += decoder.decode(_chunk) if bool_is_encoded else _chunk
+        if bool_is_ssml is None and _unicode_buffer.strip():
+            bool_is_ssml = _unicode_buffer.strip().startswith(u"<speak>")
+        while not bool_is_ssml and len(_unicode_buffer) > int_size_max:
+            _int_index_cut = _get_index_cut(_unicode_buffer, int_size_max)
+            _unicode_segment = _unicode_buffer[:_int_index_cut].strip()
+            _unicode_buffer = _unicode_buffer[_int_index_cut:]
+            if _unicode_segment:
+                yield _unicode_segment.encode('utf-8') if bool_is_encoded else _unicode_segment
+
+    if bool_is_encoded:
+        _unicode_buffer += decoder.decode('', final=True)
+    _unicode_segment = _unicode_buffer.strip()
+    if _unicode_segment:
+        yield _unicode_segment.encode('utf-8') if bool_is_encoded else _unicode_segment
+
+
+def iter_sentences(source_text, int_size_max):
+    """
+    Yields sentences of source text.
+        - Source text is split into bounded segments first (see iter_segments), so file is read lazily.
+
+    * Sentence longer than int_size_max is split on word boundaries.
+
+    :param source_text: string or file with text.
+    :param int_size_max: int - max length of segment, characters.
+    :return: generator - sentences of the same type as source text (str or unicode).
+    """
+    for str_segment in iter_segments(source_text, int_size_max):
+        for str_sentence in split_sentences(str_segment):
+            yield str_sentence
+
+
+def _get_size(unicode_text):
+    """
+    Returns size of text encoded to UTF-8.
+
+    :param unicode_text: unicode - text.
+    :return: int - size, bytes.
+    """
+    return len(unicode_text.encode('utf-8'))
+
+
+def _pack_units(list_units, int_size_max):
+    """
+    Joins consecutive units by space into chunks not larger than int_size_max.
+
+    * Unit larger than int_size_max becomes chunk on its own.
+
+    :param list_units: list - unicode units in order.
+    :param int_size_max: int - max size of chunk, bytes in UTF-8.
+    :return: list - unicode chunks in order.
+    """
+    list_chunks = []
+    _unicode_chunk = u''
+    for _unicode_unit in list_units:
+        if _unicode_chunk and _get_size(_unicode_chunk) + 1 + _get_size(_unicode_unit) > int_size_max:
+            list_chunks.append(_unicode_chunk)
+            _unicode_chunk = u''
+        _unicode_chunk = _unicode_chunk + u' ' + _unicode_unit if _unicode_chunk else _unicode_unit
+    if _unicode_chunk:
+        list_chunks.append(_unicode_chunk)
+    return list_chunks
+
+
+def _split_hard(unicode_text, int_size_max):
+    """
+    Splits text into pieces not larger than int_size_max regardless of boundaries.
+        - Characters are never broken.
+
+    :param unicode_text: unicode - text without word boundaries (e.g. very long word).
+    :param int_size_max: int - max size of piece, bytes in UTF-8.
+    :return: list - unicode pieces in order.
+    """
+    list_pieces = []
+    _unicode_piece = u''
+    for _unicode_char in unicode_text:
+        if _unicode_piece and _get_size(_unicode_piece + _unicode_char) > int_size_max:
+            list_pieces.append(_unicode_piece)
+            _unicode_piece = u''
+        _unicode_piece += _unicode_char
+    if _unicode_piece:
+        list_pieces.append(_unicode_piece)
+    return list_pieces
+
+
+def split_chunks(str_text, int_size_max):
+    """
+    Splits plain text into chunks not larger than int_size_max in UTF-8.
+        - Text is split on sentence boundaries, sentences are packed into chunks.
+        - Sentence larger than int_size_max is split on word boundaries, then regardless of boundaries.
+
+    :param str_text: string - text to split.
+    :param int_size_max: int - max size of chunk, bytes in UTF-8.
+    :return: list - chunks of the same type as str_text (str or unicode).
+    """
+    bool_is_encoded = not isinstance(str_text, unicode)
+    _unicode_text = str_text.decode('utf-8') if bool_is_encoded else str_text
+    list_units = []
+    for _unicode_sentence in REGEX_SENTENCE_END.split(_unicode_text):
+        _unicode_sentence = _unicode_sentence.strip()
+        if _get_size(_unicode_sentence) <= int_size_max:
+            list_units.append(_unicode_sentence)
+            continue
+        for _unicode_word in _unicode_sentence.split():
+            list_units.extend(_split_hard(_unicode_word, int_size_max))
+    list_chunks = _pack_units([_unicode_unit for _unicode_unit in list_units if _unicode_unit], int_size_max)
+    return [_unicode_chunk.encode('utf-8') if bool_is_encoded else _unicode_chunk for _unicode_chunk in list_chunks]
+
+
+def _split_ssml_top(unicode_ssml, regex_boundary):
+    """
+    Splits SSML fragment into units on boundaries outside of elements.
+        - Text boundary (see regex_boundary) is used only if it is not inside of any element.
+        - Top-level element end is boundary as well.
+
+    :param unicode_ssml: unicode - SSML fragment (content of element).
+    :param regex_boundary: compiled regex - text boundary.
+    :return: list - not empty unicode units in order.
+    """
+    list_units = []
+    _unicode_unit = u''
+    _int_depth = 0
+    for _unicode_token in REGEX_SSML_TAG.split(unicode_ssml):
+        if not _unicode_token:
+            continue
+        if REGEX_SSML_TAG.match(_unicode_token):
+            _unicode_unit += _unicode_token
+            if _unicode_token.startswith(u'</'):
+                _int_depth = max(0, _int_depth - 1)
+                if not _int_depth:
+                    list_units.append(_unicode_unit)
+                    _unicode_unit = u''
+            elif not _unicode_token.endswith(u'/>') and not _unicode_token.startswith((u'<!', u'<?')):
+                _int_depth += 1
+        elif _int_depth:
+            _unicode_unit += _unicode_token
+        else:
+            for _int_index, _unicode_part in enumerate(regex_boundary.split(_unicode_token)):
+                if _int_index:
+                    list_units.append(_unicode_unit)
+                    _unicode_unit = u''
+                _unicode_unit += _unicode_part
+    list_units.append(_unicode_unit)
+    return [_unicode_unit.strip() for _unicode_unit in list_units if _unicode_unit.strip()]
+
+
+def _split_ssml(unicode_ssml, int_size_max, regex_boundary=REGEX_SENTENCE_END):
+    """
+    Splits SSML fragment into well-formed units not larger than int_size_max.
+        - Fragment is split on sentence boundaries outside of elements first.
+        - Too large element is split inside, each piece is wrapped by element tags.
+        - Too large text is split on word boundaries, then regardless of boundaries.
+
+    :param unicode_ssml: unicode - SSML fragment.
+    :param int_size_max: int - max size of unit, bytes in UTF-8.
+    :param regex_boundary: compiled regex - text boundary.
+    :return: list - unicode units in order.
+    """
+    list_units = []
+    for _unicode_unit in _split_ssml_top(unicode_ssml, regex_boundary):
+        if _get_size(_unicode_unit) <= int_size_max:
+            list_units.append(_unicode_unit)
+            continue
+        match = REGEX_SSML_ELEMENT.match(_unicode_unit)
+        if match:       # unit is single element, since top-level element end is boundary
+            _unicode_tag_open, _unicode_content, _unicode_tag_close = match.group(1), match.group(3), match.group(4)
+            _int_size_content_max = int_size_max - _get_size(_unicode_tag_open + _unicode_tag_close)
+            for _unicode_chunk in _pack_units(_split_ssml(_unicode_content, _int_size_content_max),
+                                              _int_size_content_max):
+                list_units.append(_unicode_tag_open + _unicode_chunk + _unicode_tag_close)
+        elif regex_boundary is not REGEX_WHITESPACE:
+            list_units.extend(_split_ssml(_unicode_unit, int_size_max, REGEX_WHITESPACE))
+        else:
+            list_units.extend(_split_hard(_unicode_unit, int_size_max))
+    return list_units
+
+
+def split_chunks_ssml(str_ssml, int_size_max):
+    """
+    Splits text marked up with SSML into well-formed SSML documents not larger than int_size_max in UTF-8.
+        - Content of root <speak> element is split on sentence boundaries outside of elements (see _split_ssml).
+        - Each chunk is wrapped by root element tags.
+
+    * Element which content can not be split (e.g. <say-as>) is never broken if it fits int_size_max.
+
+    :param str_ssml: string - SSML document.
+    :param int_size_max: int - max size of chunk, bytes in UTF-8.
+    :return: list - SSML documents of the same type as str_ssml (str or unicode).
+    """
+    bool_is_encoded = not isinstance(str_ssml, unicode)
+    _unicode_ssml = str_ssml.decode('utf-8') if bool_is_encoded else str_ssml
+    if _get_size(_unicode_ssml) <= int_size_max:
+        return [str_ssml]
+
+    match = REGEX_SSML_SPEAK.match(_unicode_ssml)
+    if match is None:   # not SSML document
+        return split_chunks(str_ssml, int_size_max)
+    _unicode_tag_open, _unicode_content, _unicode_tag_close = match.group(1), match.group(2), match.group(3)
+    _int_size_content_max = int_size_max - _get_size(_unicode_tag_open + _unicode_tag_close)
+    list_chunks = [_unicode_tag_open + _unicode_chunk + _unicode_tag_close for _unicode_chunk in
+                   _pack_units(_split_ssml(_unicode_content, _int_size_content_max), _int_size_content_max)]
+    return [_unicode_chunk.encode('utf-8') if bool_is_encoded else _unicode_chunk for _unicode_chunk in list_chunks]
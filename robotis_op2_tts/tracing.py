@@ -0,0 +1,301 @@
+"""
+Lightweight tracing of synthesis hot path.
+    - Each request gets trace ID, its stages are recorded as nested spans with monotonic timestamps.
+    - Finished spans are passed to pluggable exporter (any object with export(dict_span) method).
+    - When tracing is disabled span() returns shared no-op span, so overhead is single flag check.
+
+Span dictionary keys:
+    - trace_id - request ID.
+    - span_id - span ID.
+    - parent_id - parent span ID (None for root span).
+    - name - stage name.
+    - time_start - wall clock start time, seconds since epoch.
+    - duration_ms - monotonic duration, ms.
+    - attributes - dict of stage attributes (e.g. engine, error).
+
+* Spans are nested per thread. Worker threads continue request trace with attach(get_context()).
+"""
+from threading import Lock, local
+import time
+import os
+
+_bool_enabled = False       # whether tracing is enabled
+_exporter = None            # exporter of finished spans
+_local = local()            # stack of active spans of thread
+
+
+def _get_clock_monotonic():
+    """
+    Returns monotonic clock function.
+
+    * Python 2.7 has no time.monotonic, so clock_gettime(CLOCK_MONOTONIC) is called via ctypes if possible.
+
+    :return: callable - returns monotonic time, seconds.
+    """
+    if hasattr(time, 'monotonic'):
+        return time.monotonic
+    try:
+        import ctypes
+        import ctypes.util
+
+        INT_CLOCK_MONOTONIC = 1
+
+        class _TimeSpec(ctypes.Structure):
+            _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+        _librt = ctypes.CDLL(ctypes.util.find_library('rt') or ctypes.util.find_library('c'), use_errno=True)
+        _clock_gettime = _librt.clock_gettime
+
+        def _monotonic():
+            _time_spec = _TimeSpec()
+            if _clock_gettime(INT_CLOCK_MONOTONIC, ctypes.byref(_time_spec)) != 0:
+                raise OSError(ctypes.get_errno(), "clock_gettime fails")
+            return _time_spec.tv_sec + _time_spec.tv_nsec * 1e-9
+
+        _monotonic()
+        return _monotonic
+    except (OSError, AttributeError, TypeError):
+        return time.time
+
+
+get_time_monotonic = _get_clock_monotonic()
+
+
+def _get_id():
+    """
+    Returns new random ID.
+
+    :return: str - 16 hex digits.
+    """
+    return os.urandom(8).encode('hex')
+
+
+def _get_stack():
+    """
+    Returns stack of active spans of current thread.
+
+    :return: list - spans.
+    """
+    try:
+        return _local.list_spans
+    except AttributeError:
+        _local.list_spans = []
+        return _local.list_spans
+
+
+class _NoopSpan(object):
+    """
+    No-op span class.
+        - Is returned when tracing is disabled.
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def set_attribute(self, str_key, value):
+        pass
+
+
+_SPAN_NOOP = _NoopSpan()
+
+
+class Span(object):
+    """
+    Span class.
+        - Records single stage of request between __enter__ and __exit__.
+        - Becomes child of active span of current thread, otherwise starts new trace.
+    """
+    str_name = None             # stage name
+    str_trace_id = None         # request ID
+    str_span_id = None          # span ID
+    str_parent_id = None        # parent span ID
+    dict_attributes = None      # stage attributes
+    _float_time_start = None    # wall clock start time, seconds since epoch
+    _float_monotonic_start = None   # monotonic start time, seconds
+
+    def __init__(self, str_name, dict_attributes):
+        self.str_name = str_name
+        self.dict_attributes = dict_attributes
+        self.str_span_id = _get_id()
+
+    def __enter__(self):
+        list_spans = _get_stack()
+        if list_spans:
+            self.str_trace_id = list_spans[-1].str_trace_id
+            self.str_parent_id = list_spans[-1].str_span_id
+        else:
+            self.str_trace_id = _get_id()
+        list_spans.append(self)
+        self._float_time_start = time.time()
+        self._float_monotonic_start = get_time_monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        float_duration = get_time_monotonic() - self._float_monotonic_start
+        list_spans = _get_stack()
+        if list_spans and list_spans[-1] is self:
+            list_spans.pop()
+        if exc_type is not None:
+            self.dict_attributes['error'] = exc_type.__name__
+        exporter = _exporter
+        if exporter is not None:
+            exporter.export({
+                'trace_id': self.str_trace_id,
+                'span_id': self.str_span_id,
+                'parent_id': self.str_parent_id,
+                'name': self.str_name,
+                'time_start': self._float_time_start,
+                'duration_ms': round(float_duration * 1000.0, 3),
+                'attributes': self.dict_attributes
+            })
+        return False
+
+    def set_attribute(self, str_key, value):
+        """
+        Sets stage attribute.
+
+        :param str_key: string - attribute name.
+        :param value: attribute value (JSON serializable).
+        :return: None.
+        """
+        self.dict_attributes[str_key] = value
+
+
+def span(str_name, **kwargs):
+    """
+    Returns span of stage.
+
+    Usage:
+        with tracing.span("google.rpc", engine="google_cloud_tts"):
+            ...
+
+    :param str_name: string - stage name.
+    :param kwargs: stage attributes.
+    :return: Span (or no-op span if tracing is disabled).
+    """
+    if not _bool_enabled:
+        return _SPAN_NOOP
+    return Span(str_name, kwargs)
+
+
+def traced(str_name):
+    """
+    Returns decorator that records each call of decorated function as span.
+
+    * When tracing is disabled decorated function is called directly.
+
+    :param str_name: string - stage name.
+    :return: callable - decorator.
+    """
+    from functools import wraps
+
+    def _decorator(function):
+        @wraps(function)
+        def _wrapper(*args, **kwargs):
+            if not _bool_enabled:
+                return function(*args, **kwargs)
+            with Span(str_name, {}):
+                return function(*args, **kwargs)
+        return _wrapper
+    return _decorator
+
+
+def get_context():
+    """
+    Returns active span of current thread to continue trace in another thread.
+
+    :return: Span or None.
+    """
+    if not _bool_enabled:
+        return None
+    list_spans = _get_stack()
+    return list_spans[-1] if list_spans else None
+
+
+class attach(object):
+    """
+    Context manager that continues trace of passed context in current thread.
+    """
+    _span_context = None        # span to continue
+    _list_spans_saved = None    # stack of spans before attach
+
+    def __init__(self, span_context):
+        self._span_context = span_context
+
+    def __enter__(self):
+        if self._span_context is not None:
+            self._list_spans_saved = _get_stack()
+            _local.list_spans = [self._span_context]
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._span_context is not None:
+            _local.list_spans = self._list_spans_saved
+        return False
+
+
+class JSONLinesExporter(object):
+    """
+    Exporter class that appends finished spans to file as JSON lines.
+    """
+    _file = None                # output file
+    _lock = None                # serializes writes
+
+    def __init__(self, str_path_file):
+        """
+        Constructs instance of JSONLinesExporter class.
+
+        :param str_path_file: string path to output file.
+        """
+        str_path_dir = os.path.dirname(os.path.abspath(str_path_file))
+        if not os.path.isdir(str_path_dir):
+            os.makedirs(str_path_dir)
+        self._file = open(str_path_file, 'a')
+        self._lock = Lock()
+
+    def export(self, dict_span):
+        """
+        Writes span.
+
+        :param dict_span: dict - finished span.
+        :return: None.
+        """
+        import json
+
+        str_line = json.dumps(dict_span, sort_keys=True) + "\n"
+        with self._lock:
+            self._file.write(str_line)
+            self._file.flush()
+
+
+def configure(dict_config):
+    """
+    Configures tracing.
+
+    Tracing configuration dictionary keys:
+        - enabled - whether spans are recorded.
+        - path - path to JSON lines output file (optional, "./data/trace.jsonl" by default).
+
+    :param dict_config: dict - tracing configuration (None - tracing is disabled).
+    :return: None.
+    """
+    dict_config = dict_config or {}
+    if dict_config.get('enabled', False):
+        set_exporter(JSONLinesExporter(dict_config.get('path', "./data/trace.jsonl")))
+    else:
+        set_exporter(None)
+
+
+def set_exporter(exporter):
+    """
+    Sets exporter of finished spans and enables tracing.
+
+    :param exporter: object with export(dict_span) method (None - tracing is disabled).
+    :return: None.
+    """
+    global _bool_enabled, _exporter
+
+    _exporter = exporter
+    _bool_enabled = exporter is not None
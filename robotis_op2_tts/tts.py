@@ -7,15 +7,23 @@ if __name__ == '__main__':
         You can get support:
 
             $ python tts.py -h
-            usage: tts.py [-h] [-c CONFIG]
+            usage: tts.py [-h] [-c CONFIG] [-d] [-s SOCKET]
 
             Robotis OP2 Text-to-Speech (TTS) client. To learn more visit:
             https://github.com/valera0798/Robotis-OP2-TTS
 
             optional arguments:
               -h, --help            show this help message and exit
-              -t TEXT, --text TEXT  text to synthesize speech.
-    
+              -c CONFIG, --config CONFIG
+                                    path to TTS configuration file.
+              -d, --daemon          serve TTS client to other processes over Unix
+                                    domain socket.
+              -s SOCKET, --socket SOCKET
+                                    path to Unix domain socket of daemon.
+
+        In daemon mode steps 3-4 are replaced by serving say/save/cancel/status requests of other processes
+        (see daemon_client.TTSDaemonClient) until SIGINT or SIGTERM.
+
     3. In the start of session 
         3.1. Create RobotisOP2TTS object;
     4. Input commands in CLI to call specific methods of RobotisOP2TTS instance.
@@ -28,8 +36,13 @@ if __name__ == '__main__':
                 help                     - show this help message.
                 say [string/file path]   - speaks passed text from source.
                 save [string/file path]  - saves synthesized text to file.
+                phrasebook               - shows progress of phrasebook pre-warming.
+                voices [language code]   - lists voices of cloud TTS engine.
                 exit                     - ends current session.
     """
+    import time
+    _float_time_start = time.time()
+
     from tts_client import RobotisOP2TTSClient
     from cli import CLI
     import re
@@ -40,6 +53,23 @@ if __name__ == '__main__':
     str_path_file_config = dict_args["config"]
 
     tts = RobotisOP2TTSClient(str_path_file_config)
+    cli.logger.info("Startup time = %.3f seconds." % (time.time() - _float_time_start))
+
+    if dict_args["daemon"]:
+        from _exceptions.base import RobotisOP2TTSException
+        from threading import Thread
+        import signal
+
+        try:
+            daemon = tts.create_daemon(dict_args["socket"])
+        except RobotisOP2TTSException as e:
+            cli.logger.error(msg=str(e))
+            exit()
+        # shutdown waits for serving loop, so it is called outside of the main thread
+        signal.signal(signal.SIGTERM, lambda _int_signal, _frame: Thread(target=daemon.shutdown).start())
+        signal.signal(signal.SIGINT, lambda _int_signal, _frame: Thread(target=daemon.shutdown).start())
+        daemon.serve_forever()
+        exit()
 
     regex_file = re.compile(r'\.?(\/[\w]+)*\/[\w]+\.[\w]+')
     source_text = None
@@ -54,6 +84,21 @@ if __name__ == '__main__':
                 bool_is_session_opened = False
             elif str_command == 'help':
                 cli.print_prompt()
+            elif str_command == 'phrasebook':
+                tuple_progress = tts.get_phrasebook_progress()
+                if tuple_progress is None:
+                    cli.logger.info("Phrasebook is not configured.")
+                else:
+                    cli.logger.info("Phrasebook pre-warming progress: %s/%s. Failed = %s." % tuple_progress)
+            elif str_command == 'voices':
+                list_voices = tts.get_voices(list_args[0] if list_args else None)
+                if list_voices is None:
+                    cli.logger.info("Voices are not available.")
+                else:
+                    for dict_voice in list_voices:
+                        print "\t%-28s %-20s %s" % (dict_voice['name'], ", ".join(dict_voice['language_codes']),
+                                                     dict_voice['ssml_gender'])
+                    cli.logger.info("Voices = %s." % len(list_voices))
             else:
                 try:
                     if regex_file.match(list_args[0]):
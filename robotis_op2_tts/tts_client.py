@@ -1,10 +1,12 @@
 from base import InterfaceTTSClient, LoggableInterface
+from circuit_breaker import CircuitBreaker
+from phrasebook import Phrasebook
+import tracing
 from _exceptions.base import RobotisOP2TTSException
 from _exceptions.config import AudioFileFormatException, AudioFilePlayerException, \
             TTSEnginesNotProvidedException, \
             TTSEnginePriorityNotNumberException, TTSEnginePriorityNotProvidedException
-from tts_engines.cloud.tts_delegate import TTSCloudClientDelegate
-from tts_engines.onboard.tts_delegate import TTSOnboardClientDelegate
+from _exceptions.player import AudioPlaybackInterruptedException
 
 
 class RobotisOP2TTSClient(InterfaceTTSClient, LoggableInterface):
@@ -13,10 +15,18 @@ class RobotisOP2TTSClient(InterfaceTTSClient, LoggableInterface):
         - Behaves like InterfaceTTSClient.
         - Supports logging feature.
     """
+    STR_TYPE_CLOUD = 'cloud'        # TTS cloud client type
+    STR_TYPE_ONBOARD = 'onboard'    # TTS onboard client type
+
     _config_tts = None              # general configuration of Robotis OP2 TTS.
-    _client_tts_cloud = None        # TTS cloud client
-    _client_tts_onboard = None      # TTS onboard client
-    _client_tts_preferable = None   # preferable TTS client
+    _dict_config_clients_tts = None # configurations of TTS clients by type
+    _dict_locks_clients_tts = None  # guard creation of TTS clients by type
+    _client_tts_cloud = None        # TTS cloud client (created on first demand)
+    _client_tts_onboard = None      # TTS onboard client (created on first demand)
+    _str_type_tts_preferable = None # type of preferable TTS client
+    _dict_config_hedging = None     # configuration of hedged requests
+    _dict_breakers = None           # circuit breakers of TTS clients
+    _phrasebook = None              # phrases pre-warmed in synthesis cache
 
     def __init__(self, str_path_file_config):
         """
@@ -26,9 +36,12 @@ class RobotisOP2TTSClient(InterfaceTTSClient, LoggableInterface):
         2. Processes passed configuration.
         3. Interacts .
         """
+        import time
+
+        _float_time_start = time.time()
         super(RobotisOP2TTSClient, self).__init__(name=self.__class__.__name__)
         self.set_configuration(str_path_file_config)
-        self.logger.info("Instance initialization succeeds.")
+        self.logger.info("Instance initialization succeeds in %.3f seconds.", time.time() - _float_time_start)
 
     def set_configuration(self, str_path_file_config):
         """
@@ -36,134 +49,507 @@ class RobotisOP2TTSClient(InterfaceTTSClient, LoggableInterface):
 
         * Configuration file will be parsed to dictionary.
         * Configuration dictionary will be validated superficially before set.
-        * Corresponding TTS clients will be created as fields of RobotisOP2Client instance.
+        * Configurations of corresponding TTS clients are prepared, TTS clients are created on first demand.
             - Actually, it is mediator to specific TTS client.
 
         :param str_path_file_config: path to TTS configuration file.
         :return: None (object field _config_tts will be set).
         """
         from config.parser import parse_configuration
+        from threading import Lock
 
         dict_config_tts = parse_configuration(str_path_file_config)
         self.logger.debug("Configuration is parsed.")
         if self.validate_configuration(dict_config_tts):
             self._config_tts = dict_config_tts
+            self._dict_config_hedging = self._config_tts.get('hedging') or {}
+            tracing.configure(self._config_tts.get('tracing'))
+            self._dict_config_clients_tts = {}
+            self._dict_locks_clients_tts = {self.STR_TYPE_CLOUD: Lock(), self.STR_TYPE_ONBOARD: Lock()}
+            self._dict_breakers = {}
+            dict_config_breaker = self._config_tts.get('circuit_breaker')
+
+            for str_type_tts in (self.STR_TYPE_CLOUD, self.STR_TYPE_ONBOARD):
+                try:
+                    dict_config_client_tts = self._config_tts['tts_engines'][str_type_tts].copy()
+                except KeyError:
+                    continue
+                dict_config_client_tts.pop('priority', None)    # information about priority is not valuable for TTS client
+                dict_config_client_tts['audio_file_format'] = self._config_tts['audio_file_format']
+                if 'audio_file_player' not in dict_config_client_tts:  # TTS engine may override audio file player
+                    dict_config_client_tts['audio_file_player'] = self._config_tts['audio_file_player']
+                dict_config_client_tts['cache'] = self._config_tts.get('cache')
+                dict_config_client_tts['text_normalization'] = self._config_tts.get('text_normalization')
+                dict_config_client_tts['speech_pipeline'] = self._config_tts.get('speech_pipeline')
+                dict_config_client_tts['audio_in_memory'] = self._config_tts.get('audio_in_memory')
+                self._dict_config_clients_tts[str_type_tts] = dict_config_client_tts
+
+            if self.STR_TYPE_CLOUD in self._dict_config_clients_tts:
+                self._dict_breakers[self.STR_TYPE_CLOUD] = CircuitBreaker(
+                    self.STR_TYPE_CLOUD, dict_config_breaker,
+                    probe=lambda: self._get_tts_client(self.STR_TYPE_CLOUD).validate_network())
+            if self.STR_TYPE_ONBOARD in self._dict_config_clients_tts:
+                self._dict_breakers[self.STR_TYPE_ONBOARD] = CircuitBreaker(self.STR_TYPE_ONBOARD, dict_config_breaker)
+            self.logger.debug("Available TTS client delegates are prepared.")
+
+            dict_config_phrasebook = self._config_tts.get('phrasebook')
+            if dict_config_phrasebook and dict_config_phrasebook.get('enabled', True):
+                self._phrasebook = Phrasebook(dict_config_phrasebook,
+                                              bool((self._config_tts.get('speech_pipeline') or {}).get('enabled')))
+                self._phrasebook.start(self)
+
+            if self._is_warm_up_cloud_enabled():
+                from threading import Thread
+
+                thread_warm_up = Thread(target=self._get_tts_client, args=(self.STR_TYPE_CLOUD,),
+                                        name="TTSCloudClientWarmUp")
+                thread_warm_up.daemon = True
+                thread_warm_up.start()
+
+    def _is_warm_up_cloud_enabled(self):
+        """
+        Checks whether TTS cloud engine asks to warm its connection up at startup ("channel": {"warm_up": true}).
 
-            dict_engines_tts = self._config_tts['tts_engines']
-            dict_config_cloud_tts = None
-            dict_config_onboard_tts = None
-            try:
-                dict_config_cloud_tts = dict_engines_tts['cloud'].copy()
-            except KeyError:
-                pass
-            try:
-                dict_config_onboard_tts = dict_engines_tts['onboard'].copy()
-            except KeyError:
-                pass
+        * TTS cloud client is created in background then, so first request does not pay connection setup.
 
-            if dict_config_cloud_tts:
-                dict_config_cloud_tts.pop('priority', None) # information about priority is not valuable for TTS client
-                dict_config_cloud_tts['audio_file_format'] = self._config_tts['audio_file_format']
-                dict_config_cloud_tts['audio_file_player'] = self._config_tts['audio_file_player']
-                self._client_tts_cloud = TTSCloudClientDelegate(dict_config_cloud_tts)
-            if dict_config_onboard_tts:
-                dict_config_onboard_tts.pop('priority', None) # information about priority is not valuable for TTS client
-                dict_config_onboard_tts['audio_file_format'] = self._config_tts['audio_file_format']
-                dict_config_onboard_tts['audio_file_player'] = self._config_tts['audio_file_player']
-                self._client_tts_onboard = TTSOnboardClientDelegate(dict_config_onboard_tts)
-            self.logger.debug("Available TTS client delegates are initialized.")
+        :return: bool - True (enabled), False (disabled or TTS cloud client is not configured).
+        """
+        for _config_engine in self._dict_config_clients_tts.get(self.STR_TYPE_CLOUD, {}).values():
+            if isinstance(_config_engine, dict) and (_config_engine.get('channel') or {}).get('warm_up'):
+                return True
+        return False
 
-    def _get_preferable_tts_client(self):
+    def _get_tts_client(self, str_type_tts):
         """
-        Returns TTS client with highest priority.
+        Returns TTS client delegate of passed type.
+
+        * TTS client delegate (and heavy modules of its engine) is created on first demand.
+        * Failed creation is retried on next demand.
 
-        :return: Implementation of InterfaceTTSClient (actually, child of AbstractTTSClientDelegate).
+        :param str_type_tts: string - TTS client type (STR_TYPE_CLOUD or STR_TYPE_ONBOARD).
+        :return: Implementation of InterfaceTTSClient (actually, child of AbstractTTSClientDelegate)
+            or None if TTS client is not configured or can not be created.
         """
-        if self._client_tts_preferable is None:
-            bool_one_tts = False
-            try:
-                self._config_tts['tts_engines']['cloud']
-            except KeyError:
-                self._client_tts_preferable = self._client_tts_onboard
-                bool_one_tts = True
+        import time
+
+        if str_type_tts not in self._dict_config_clients_tts:
+            return None
+        with self._dict_locks_clients_tts[str_type_tts]:
+            if str_type_tts == self.STR_TYPE_CLOUD and self._client_tts_cloud is not None:
+                return self._client_tts_cloud
+            if str_type_tts == self.STR_TYPE_ONBOARD and self._client_tts_onboard is not None:
+                return self._client_tts_onboard
+
+            _float_time_start = time.time()
             try:
-                self._config_tts['tts_engines']['onboard']
-            except KeyError:
-                self._client_tts_preferable = self._client_tts_cloud
-                bool_one_tts = True
-
-            if bool_one_tts:
-                self.logger.debug("%s is chosen as preferable.", self._client_tts_preferable)
-                return self._client_tts_preferable
-
-            if self._config_tts['tts_engines']['cloud']['priority'] < \
-                    self._config_tts['tts_engines']['onboard']['priority']:
-                self._client_tts_preferable = self._client_tts_cloud
-            elif self._config_tts['tts_engines']['cloud']['priority'] > \
-                    self._config_tts['tts_engines']['onboard']['priority']:
-                self._client_tts_preferable = self._client_tts_onboard
+                if str_type_tts == self.STR_TYPE_CLOUD:
+                    from tts_engines.cloud.tts_delegate import TTSCloudClientDelegate
+
+                    self._client_tts_cloud = TTSCloudClientDelegate(
+                        self._dict_config_clients_tts[str_type_tts].copy())
+                    client_tts = self._client_tts_cloud
+                else:
+                    from tts_engines.onboard.tts_delegate import TTSOnboardClientDelegate
+
+                    self._client_tts_onboard = TTSOnboardClientDelegate(
+                        self._dict_config_clients_tts[str_type_tts].copy())
+                    client_tts = self._client_tts_onboard
+            except SystemExit:      # TTS clients exit on failure
+                self.logger.error("%s TTS client can not be created.", str_type_tts)
+                return None
+            except Exception as e:
+                self.logger.error(msg=str(e), exc_info=True)
+                return None
+            self.logger.info("%s is created in %.3f seconds.", client_tts.__class__.__name__,
+                             time.time() - _float_time_start)
+            return client_tts
+
+    def get_phrasebook_progress(self):
+        """
+        Returns progress of phrasebook pre-warming.
+
+        :return: tuple (int - number of processed phrases, int - total number of phrases,
+            int - number of phrases failed to pre-warm) or None if phrasebook is not configured.
+        """
+        if self._phrasebook is None:
+            return None
+        return self._phrasebook.get_progress()
+
+    def get_voices(self, str_language_code=None):
+        """
+        Returns voices of TTS cloud client.
+
+        :param str_language_code: string - language code voices should support (None - all voices).
+        :return: list - voice dictionaries sorted by name (None if TTS cloud client is not available
+            or does not provide voices).
+        """
+        client_tts_cloud = self._get_tts_client(self.STR_TYPE_CLOUD)
+        if client_tts_cloud is None:
+            return None
+        return client_tts_cloud.get_voices(str_language_code)
+
+    def get_channel_stats(self):
+        """
+        Returns statistics of connection of TTS cloud client to its service.
+
+        * TTS cloud client is not created by call, so status requests do not pay its startup.
+
+        :return: dict - connection statistics (None if TTS cloud client is not created yet
+            or does not track connection).
+        """
+        if self._client_tts_cloud is None:
+            return None
+        return self._client_tts_cloud.get_channel_stats()
+
+    def get_engine_states(self):
+        """
+        Returns circuit breaker states of TTS clients.
+
+        :return: dict - TTS client type -> CircuitBreaker.STR_STATE_* value.
+        """
+        return dict((_str_type_tts, _breaker.get_state()) for _str_type_tts, _breaker in self._dict_breakers.items())
+
+    def create_scheduler(self):
+        """
+        Creates priority speech scheduler over TTS client.
+            - Scheduler is configured by "scheduler" section of configuration.
+
+        :return: TTSScheduler - started scheduler (should be closed by caller).
+        """
+        from scheduler import TTSScheduler
+
+        return TTSScheduler(self, self._config_tts.get('scheduler'))
+
+    def create_daemon(self, str_path_socket=None):
+        """
+        Creates TTS daemon that shares TTS client with other processes.
+            - Daemon is configured by "daemon" section of configuration.
+
+        :raises:
+            * DaemonSocketInUseException - if another daemon serves socket path.
+        :param str_path_socket: string path to Unix domain socket (None - path from configuration).
+        :return: TTSDaemon - daemon ready to serve_forever.
+        """
+        from daemon import TTSDaemon, STR_PATH_SOCKET_DEFAULT
+
+        if str_path_socket is None:
+            str_path_socket = (self._config_tts.get('daemon') or {}).get('socket', STR_PATH_SOCKET_DEFAULT)
+        return TTSDaemon(self, str_path_socket)
+
+    def _get_preferable_type_tts(self):
+        """
+        Returns type of TTS client with highest priority.
+
+        :return: string - TTS client type (STR_TYPE_CLOUD or STR_TYPE_ONBOARD).
+        """
+        if self._str_type_tts_preferable is None:
+            dict_engines_tts = self._config_tts['tts_engines']
+            if self.STR_TYPE_CLOUD not in dict_engines_tts:
+                self._str_type_tts_preferable = self.STR_TYPE_ONBOARD
+            elif self.STR_TYPE_ONBOARD not in dict_engines_tts:
+                self._str_type_tts_preferable = self.STR_TYPE_CLOUD
+            elif dict_engines_tts['cloud']['priority'] < dict_engines_tts['onboard']['priority']:
+                self._str_type_tts_preferable = self.STR_TYPE_CLOUD
+            elif dict_engines_tts['cloud']['priority'] > dict_engines_tts['onboard']['priority']:
+                self._str_type_tts_preferable = self.STR_TYPE_ONBOARD
             else:  # for equal priorities prefer cloud method
-                self._client_tts_preferable = self._client_tts_cloud
-        self.logger.debug("%s is chosen as preferable.", self._client_tts_preferable)
-        return self._client_tts_preferable
+                self._str_type_tts_preferable = self.STR_TYPE_CLOUD
+            self.logger.debug("%s TTS is chosen as preferable.", self._str_type_tts_preferable)
+        return self._str_type_tts_preferable
 
-    def _get_unpreferable_tts_client(self):
+    def _get_unpreferable_type_tts(self):
         """
-        Returns TTS client opposite to client with highest priority.
+        Returns type of TTS client opposite to client with highest priority.
 
-        :return: Implementation of InterfaceTTSClient (actually, child of AbstractTTSClientDelegate).
+        :return: string - TTS client type (STR_TYPE_CLOUD or STR_TYPE_ONBOARD).
         """
-        if self._client_tts_preferable is None:
-            self._get_preferable_tts_client()
+        if self._get_preferable_type_tts() == self.STR_TYPE_CLOUD:
+            return self.STR_TYPE_ONBOARD
+        return self.STR_TYPE_CLOUD
 
-        if isinstance(self._client_tts_preferable, TTSCloudClientDelegate):
-            self.logger.debug("%s is chosen as unpreferable.", self._client_tts_onboard)
-            return self._client_tts_onboard
-        elif isinstance(self._client_tts_preferable, TTSOnboardClientDelegate):
-            self.logger.debug("%s is chosen as unpreferable.", self._client_tts_cloud)
-            return self._client_tts_cloud
+    def _get_routed_types_tts(self):
+        """
+        Returns types of configured TTS clients in order of routing (preferable TTS client goes first).
+
+        :return: list - TTS client types.
+        """
+        return [str_type_tts for str_type_tts in (self._get_preferable_type_tts(), self._get_unpreferable_type_tts())
+                if str_type_tts in self._dict_config_clients_tts]
 
+    def _is_tts_client_allowed(self, str_type_tts):
+        """
+        Asks circuit breaker of TTS client whether call is allowed.
+
+        * Allowed call must be followed by recording of its result.
+
+        :param str_type_tts: string - TTS client type.
+        :return: bool - True (allowed), False (rejected).
+        """
+        if self._dict_breakers[str_type_tts].allow_request():
+            return True
+        self.logger.info("Circuit breaker of %s TTS is %s, it is skipped.", str_type_tts,
+                         self._dict_breakers[str_type_tts].get_state())
+        return False
+
+    def _record_result(self, str_type_tts, bool_result):
+        """
+        Records result of TTS client call in its circuit breaker.
+
+        :param str_type_tts: string - TTS client type.
+        :param bool_result: bool - indicator of succeeded call.
+        :return: None.
+        """
+        if bool_result:
+            self._dict_breakers[str_type_tts].record_success()
+        else:
+            self._dict_breakers[str_type_tts].record_failure()
+
+    def _call_tts_client(self, str_type_tts, str_name_method, *args, **kwargs):
+        """
+        Calls method of TTS client if its circuit breaker allows and records result.
+
+        * Failure of TTS client (including exit and failed creation) is turned into None result.
+        * Interrupted playback is not failure of TTS client, it is recorded as success and raised further.
+
+        :param str_type_tts: string - TTS client type.
+        :param str_name_method: string - name of method to call.
+        :param args: arguments of method.
+        :param kwargs: is_succeeded - callable that takes result of method and returns bool whether call
+            succeeds (truth of result by default).
+        :return: result of method (None if call fails or is rejected by circuit breaker).
+        """
+        is_succeeded = kwargs.get('is_succeeded', bool)
+        if not self._is_tts_client_allowed(str_type_tts):
+            return None
+        client_tts = self._get_tts_client(str_type_tts)
+        result = None
+        if client_tts is not None:
+            self.logger.debug("It redirects call to %s", client_tts)
+            with tracing.span("engine.%s" % str_name_method, engine=str_type_tts) as span:
+                try:
+                    result = getattr(client_tts, str_name_method)(*args)
+                except SystemExit:      # TTS clients exit on failure
+                    result = None
+                except AudioPlaybackInterruptedException:
+                    span.set_attribute('interrupted', True)
+                    self._record_result(str_type_tts, True)
+                    raise
+                except Exception as e:
+                    self.logger.error(msg=str(e), exc_info=True)
+                    result = None
+                span.set_attribute('succeeded', result is not None and is_succeeded(result))
+        self._record_result(str_type_tts, result is not None and is_succeeded(result))
+        return result
+
+    def _is_hedging_enabled(self):
+        """
+        Checks whether hedged requests are enabled in configuration and both TTS clients are configured.
+
+        :return: bool - True (enabled), False (disabled).
+        """
+        return bool(self._dict_config_hedging.get('enabled', False)) and len(self._dict_config_clients_tts) > 1
+
+    def _is_source_hedged(self, source_text, list_types_tts):
+        """
+        Checks whether TTS clients can be raced on source text.
+            - Large file is not hedged: it is read lazily segment by segment by single TTS client,
+              while race requires whole text in memory to pass it to both TTS clients.
+
+        :param source_text: string or file with text for synthesize.
+        :param list_types_tts: list - TTS client types in order of routing.
+        :return: bool - True (TTS clients are raced), False (TTS clients are tried one after another).
+        """
+        if not self._is_hedging_enabled() or not list_types_tts:
+            return False
+        client_tts = self._get_tts_client(list_types_tts[0])
+        if client_tts is not None and client_tts.is_source_streamed(source_text):
+            self.logger.debug("Source file is too large to be hedged, it is streamed by single TTS.")
+            return False
+        return True
+
+    def _synthesize_audio_hedged(self, source_text, list_types_tts):
+        """
+        Creates audio file by racing TTS clients.
+            - First TTS client starts immediately.
+            - Second TTS client starts if first one does not return in hedge delay or fails.
+            - First succeeded result is used, late result is discarded (its audio file stays in cache).
+
+        * Source file must not be streamed (see _is_source_hedged), it is read at once.
+
+        :param source_text: string or file with text for synthesize.
+        :param list_types_tts: list - TTS client types in order of routing (at most 2).
+        :return: tuple (string - path to synthesized file or None, string - type of TTS client that synthesized it).
+        """
+        from text_processing import read_source_text
+        from threading import Thread
+        from Queue import Queue, Empty
+
+        str_text = read_source_text(source_text)    # file can not be read by both TTS clients
+        float_delay = float(self._dict_config_hedging.get('delay', 1.0))
+        queue_results = Queue()
+
+        span_context = tracing.get_context()
+
+        def _synthesize(str_type_tts):
+            with tracing.attach(span_context):
+                queue_results.put((self._call_tts_client(str_type_tts, 'synthesize_audio', str_text), str_type_tts))
+
+        def _start(str_type_tts):
+            thread = Thread(target=_synthesize, args=(str_type_tts,),
+                            name="%s-hedge-%s" % (self.__class__.__name__, str_type_tts))
+            thread.daemon = True
+            thread.start()
+
+        _start(list_types_tts[0])
+        int_count_started = 1
+        int_count_finished = 0
+        if len(list_types_tts) > 1:
+            try:
+                str_path_file_audio, str_type_tts = queue_results.get(timeout=float_delay)
+                if str_path_file_audio is not None:
+                    return str_path_file_audio, str_type_tts
+                int_count_finished = 1
+            except Empty:
+                self.logger.info("%s TTS does not return in %s seconds, now it races another TTS.",
+                                 list_types_tts[0], float_delay)
+            _start(list_types_tts[1])
+            int_count_started += 1
+
+        while int_count_finished < int_count_started:
+            str_path_file_audio, str_type_tts = queue_results.get()
+            int_count_finished += 1
+            if str_path_file_audio is not None:
+                self.logger.debug("%s TTS wins the race.", str_type_tts)
+                return str_path_file_audio, str_type_tts
+        return None, None
+
+    @tracing.traced("synthesize_audio")
     def synthesize_audio(self, source_text):
         """
         Implements corresponding method of interface parent class.
+
+        * TTS clients are tried in order of priority, skipping ones which circuit breakers reject calls.
+        * If hedged requests are enabled then TTS clients are raced under hedge delay
+          (except large source file, see _is_source_hedged).
         """
-        _client_tts_preferable = self._get_preferable_tts_client()
-        self.logger.debug("It redirects call to %s", _client_tts_preferable)
-        str_path_file_audio = _client_tts_preferable.synthesize_audio(source_text)
-        if str_path_file_audio is None:      # preferable TTS has not done job
-            self.logger.info("%s does not succeed audio synthesis, now it tries another TTS.",
-                             self._client_tts_preferable.__class__.__name__)
-            self._client_tts_preferable = self._get_unpreferable_tts_client()   # switch to unpreferable
+        return self.synthesize_audio_by_engine(source_text)[0]
 
-            if self._client_tts_preferable is None:     # no one engine is not able to process request
-                self.logger.warn("No one TTS is not able to synthesize audio. Please, check configuration.")
-                return None
+    def synthesize_audio_by_engine(self, source_text):
+        """
+        Creates audio file with passed source_text spoken and reports TTS client that synthesized it.
+            - Routing is the same as in synthesize_audio.
 
-            self.logger.debug("It redirects call to %s", self._client_tts_preferable)
-            return self.synthesize_audio(source_text)    # ! loop
+        :param source_text: string or file with text for synthesize.
+        :return: tuple (string path to synthesized file, string TTS client type), (None, None) if synthesis fails.
+        """
+        list_types_tts = self._get_routed_types_tts()
+        str_path_file_audio, str_type_tts = None, None
+        if self._is_source_hedged(source_text, list_types_tts):
+            str_path_file_audio, str_type_tts = self._synthesize_audio_hedged(source_text, list_types_tts)
+        else:
+            for str_type_tts in list_types_tts:
+                str_path_file_audio = self._call_tts_client(str_type_tts, 'synthesize_audio', source_text)
+                if str_path_file_audio is not None:
+                    break
+                self.logger.info("%s TTS does not succeed audio synthesis, now it tries another TTS.", str_type_tts)
+
+        if str_path_file_audio is None:     # no one engine is not able to process request
+            self.logger.warn("No one TTS is not able to synthesize audio. Please, check configuration.")
+            return None, None
         self.logger.info("Audio synthesis succeeds. Output file path = %s", str_path_file_audio)
-        return str_path_file_audio
+        return str_path_file_audio, str_type_tts
 
-    def synthesize_speech(self, source_text):
+    def get_audio_file_player(self, str_type_tts):
+        """
+        Returns audio file player of TTS client.
+            - Audio file synthesized by TTS client should be played by its player.
+
+        :param str_type_tts: string - TTS client type (STR_TYPE_CLOUD or STR_TYPE_ONBOARD).
+        :return: AudioFilePlayer - player instance (None if TTS client is not available).
+        """
+        client_tts = self._get_tts_client(str_type_tts)
+        if client_tts is None:
+            return None
+        return client_tts.get_audio_file_player()
+
+    @tracing.traced("synthesize_audio_content")
+    def synthesize_audio_content(self, source_text):
         """
         Implements corresponding method of interface parent class.
+
+        * TTS clients are tried in order of priority, skipping ones which circuit breakers reject calls.
         """
-        _client_tts_preferable = self._get_preferable_tts_client()
-        self.logger.debug("It redirects call to %s", _client_tts_preferable)
-        if _client_tts_preferable.synthesize_speech(source_text):
-            self.logger.info("Speech synthesis succeeds. You can hear it.")
-            return True
-        else:       # preferable TTS has not done job
-            self.logger.info("%s does not succeed speech synthesis, now it tries another TTS.",
-                             self._client_tts_preferable.__class__.__name__)
-            self._client_tts_preferable = self._get_unpreferable_tts_client()   # switch to unpreferable
+        for str_type_tts in self._get_routed_types_tts():
+            str_content_audio = self._call_tts_client(str_type_tts, 'synthesize_audio_content', source_text)
+            if str_content_audio:
+                self.logger.info("Audio synthesis succeeds. Audio size = %s bytes.", len(str_content_audio))
+                return str_content_audio
+            self.logger.info("%s TTS does not succeed audio synthesis, now it tries another TTS.", str_type_tts)
+
+        # no one engine is not able to process request
+        self.logger.warn("No one TTS is not able to synthesize audio. Please, check configuration.")
+        return None
+
+    @tracing.traced("synthesize_audio_batch")
+    def synthesize_audio_batch(self, list_source_texts, max_workers=None):
+        """
+        Implements corresponding method of interface parent class.
 
-            if self._client_tts_preferable is None:     # no one engine is not able to process request
-                self.logger.warn("No one TTS is not able to synthesize speech. Please, check configuration.")
-                return None
+        * Source texts failed by one TTS are synthesized by the next one.
+        * Circuit breaker records failure if TTS client fails all its source texts.
+        """
+        list_results = [(False, "No one TTS is available.")] * len(list_source_texts)
+        list_int_indexes_failed = range(len(list_source_texts))
+        for str_type_tts in self._get_routed_types_tts():
+            if not list_int_indexes_failed:
+                break
+            list_results_client = self._call_tts_client(
+                str_type_tts, 'synthesize_audio_batch',
+                [list_source_texts[_int_index] for _int_index in list_int_indexes_failed], max_workers,
+                is_succeeded=lambda list_results_batch: any(_tuple[0] for _tuple in list_results_batch)) or []
+            for _int_index, _tuple in zip(list_int_indexes_failed, list_results_client):
+                list_results[_int_index] = _tuple
+            list_int_indexes_failed = [_int_index for _int_index in list_int_indexes_failed
+                                       if not list_results[_int_index][0]]
+            if list_int_indexes_failed:
+                self.logger.info("%s TTS does not succeed synthesis of %s source texts, now it tries another TTS.",
+                                 str_type_tts, len(list_int_indexes_failed))
+        self.logger.info("Batch audio synthesis is finished.")
+        return list_results
+
+    @tracing.traced("synthesize_speech")
+    def synthesize_speech(self, source_text):
+        """
+        Implements corresponding method of interface parent class.
 
-            self.logger.debug("It redirects call to %s", self._client_tts_preferable)
-            return self.synthesize_speech(source_text)
+        * TTS clients are tried in order of priority, skipping ones which circuit breakers reject calls.
+        * If hedged requests are enabled then audio file is synthesized by the race of TTS clients
+          and played by audio player of the winner (except large source file, see _is_source_hedged).
+        * Playback interrupted by skip or stop is final: False is returned, another TTS is not tried.
+        """
+        list_types_tts = self._get_routed_types_tts()
+        try:
+            if self._is_source_hedged(source_text, list_types_tts):
+                str_path_file_audio, str_type_tts = self._synthesize_audio_hedged(source_text, list_types_tts)
+                if str_path_file_audio is not None:
+                    if self._get_tts_client(str_type_tts)._play_audio_file(str_path_file_audio):
+                        self.logger.info("Speech synthesis succeeds. You can hear it.")
+                        return True
+                    return False
+            else:
+                for str_type_tts in list_types_tts:
+                    if self._call_tts_client(str_type_tts, 'synthesize_speech', source_text):
+                        self.logger.info("Speech synthesis succeeds. You can hear it.")
+                        return True
+                    self.logger.info("%s TTS does not succeed speech synthesis, now it tries another TTS.",
+                                     str_type_tts)
+        except AudioPlaybackInterruptedException as e:
+            self.logger.info(str(e))
+            return False
+
+        # no one engine is not able to process request
+        self.logger.warn("No one TTS is not able to synthesize speech. Please, check configuration.")
+        return None
 
     def _validate_audio_file_format(self, str_format_file_audio):
         """
@@ -193,6 +579,7 @@ class RobotisOP2TTSClient(InterfaceTTSClient, LoggableInterface):
 
         * Audio player program should be pre-installed.
         * which command is used to check player installation.
+        * Succeeded check is cached until PATH, player binary or player name is changed.
 
         :raises
             * AudioFilePlayerException - audio player is not available.
@@ -200,11 +587,21 @@ class RobotisOP2TTSClient(InterfaceTTSClient, LoggableInterface):
         :return: bool - validation result. (True - valid, False - invalid).
         """
         import subprocess
+        from validation_cache import get_validation_cache, ValidationCache
 
         str_name_audio_file_player = dict_audio_file_player_config["name"]
+        str_name_validation = "audio_file_player:%s" % str_name_audio_file_player
+        dict_params = {'name': str_name_audio_file_player}
+        validation_cache = get_validation_cache()
+        if validation_cache.lookup(str_name_validation, dict_params):
+            self.logger.debug("%s audio file player is available (cached).", str_name_audio_file_player)
+            return True
         try:
-            if len(subprocess.check_output(["which", str_name_audio_file_player])) > 0:
+            _str_path_file_player = subprocess.check_output(["which", str_name_audio_file_player]).strip()
+            if len(_str_path_file_player) > 0:
                 self.logger.debug("%s audio file player is available.", str_name_audio_file_player)
+                validation_cache.store(str_name_validation, dict_params,
+                                       ValidationCache.get_paths_dirs_path() + [_str_path_file_player])
                 return True
         except subprocess.CalledProcessError as e:
             pass
@@ -271,9 +668,25 @@ class RobotisOP2TTSClient(InterfaceTTSClient, LoggableInterface):
         :return: bool - validation result. (True - valid, False - invalid).
         """
         if self._validate_tts_engines_presence(dict_engines_tts) and \
-                self._validate_tts_engines_priority(dict_engines_tts):
+                self._validate_tts_engines_priority(dict_engines_tts) and \
+                self._validate_tts_engines_audio_file_players(dict_engines_tts):
             return True
 
+    def _validate_tts_engines_audio_file_players(self, dict_engines_tts):
+        """
+        Validates availability of audio players which override general one for particular TTS engines.
+
+        :raises
+            * AudioFilePlayerException - audio player of TTS engine is not available.
+        :param dict_engines_tts: dictionary with TTS engines descriptions.
+        :return: bool - validation result. (True - valid, False - invalid).
+        """
+        for str_type_tts in (self.STR_TYPE_CLOUD, self.STR_TYPE_ONBOARD):
+            dict_config_engine = dict_engines_tts.get(str_type_tts)
+            if isinstance(dict_config_engine, dict) and 'audio_file_player' in dict_config_engine:
+                self._validate_audio_file_player(dict_config_engine['audio_file_player'])
+        return True
+
     def validate_configuration(self, dict_config):
         """
         Implements corresponding method of interface parent class.
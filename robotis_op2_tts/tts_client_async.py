@@ -0,0 +1,182 @@
+from base import LoggableInterface
+from _exceptions.base import RobotisOP2TTSException
+from tts_client import RobotisOP2TTSClient
+from threading import Event, Lock
+
+
+class AsyncTTSResult(object):
+    """
+    Asynchronous TTS call result class.
+        - Is returned immediately by AsyncRobotisOP2TTSClient methods.
+        - Is resolved by worker thread when TTS call is finished.
+        - Notifies done callbacks, so it can be bridged to event loop
+          (e.g. callback calls `loop.call_soon_threadsafe`).
+    """
+    _event_done = None          # set when TTS call is finished
+    _value = None               # result of TTS call
+    _exception = None           # exception raised by TTS call
+    _list_callbacks = None      # callbacks to call when TTS call is finished
+    _lock = None                # guards callbacks
+
+    def __init__(self):
+        self._event_done = Event()
+        self._list_callbacks = []
+        self._lock = Lock()
+
+    def ready(self):
+        """
+        Checks whether TTS call is finished.
+
+        :return: bool - True (finished), False (in progress).
+        """
+        return self._event_done.is_set()
+
+    def get(self, float_timeout=None):
+        """
+        Waits for TTS call result.
+
+        :raises
+            * Exception raised by TTS call.
+        :param float_timeout: float - max time to wait, seconds (None - no limit).
+        :return: result of TTS call (None if it is not finished in float_timeout).
+        """
+        self._event_done.wait(float_timeout)
+        if self._exception is not None:
+            raise self._exception
+        return self._value
+
+    def add_done_callback(self, callback):
+        """
+        Adds callback to call when TTS call is finished.
+
+        * Callback is called by worker thread (or immediately if TTS call is already finished).
+
+        :param callback: callable - takes this result as single argument.
+        :return: None.
+        """
+        with self._lock:
+            if not self._event_done.is_set():
+                self._list_callbacks.append(callback)
+                return
+        callback(self)
+
+    def _finish(self, value=None, exception=None):
+        """
+        Resolves result and calls done callbacks.
+
+        :param value: result of TTS call.
+        :param exception: exception raised by TTS call.
+        :return: None.
+        """
+        with self._lock:
+            self._value = value
+            self._exception = exception
+            self._event_done.set()
+            list_callbacks, self._list_callbacks = self._list_callbacks, []
+        for callback in list_callbacks:
+            callback(self)
+
+
+class AsyncRobotisOP2TTSClient(LoggableInterface):
+    """
+    Asynchronous Robotis OP 2 Text-to-Speech (TTS) client class.
+        - Mirrors RobotisOP2TTSClient methods, but returns AsyncTTSResult immediately.
+        - TTS calls are executed by single bounded worker pool, so many concurrent requests
+          do not spawn thread per call.
+        - Supports logging feature.
+
+    * Target interpreter (Python 2.7) has no asyncio, so results are bridged to event loop by done callbacks.
+    """
+    INT_COUNT_WORKERS = 4           # default number of worker threads
+
+    _client_tts = None              # blocking TTS client
+    _pool = None                    # worker pool
+
+    def __init__(self, str_path_file_config, max_workers=None):
+        """
+        Constructor of asynchronous TTS client object.
+
+        :param str_path_file_config: path to TTS configuration file.
+        :param max_workers: int - max number of concurrent TTS calls (None - default).
+        """
+        from multiprocessing.pool import ThreadPool
+
+        super(AsyncRobotisOP2TTSClient, self).__init__(name=self.__class__.__name__)
+        self._client_tts = RobotisOP2TTSClient(str_path_file_config)
+        self._pool = ThreadPool(max(1, int(max_workers or self.INT_COUNT_WORKERS)))
+        self.logger.info("Instance initialization succeeds.")
+
+    def synthesize_audio(self, source_text):
+        """
+        Creates audio file with passed source_text spoken asynchronously.
+
+        :param source_text: string or file with text for synthesize.
+        :return: AsyncTTSResult - resolved with string path to synthesized file.
+        """
+        return self._submit(self._client_tts.synthesize_audio, source_text)
+
+    def synthesize_audio_content(self, source_text):
+        """
+        Returns audio with passed source_text spoken asynchronously without audio file round trip.
+
+        :param source_text: string or file with text for synthesize.
+        :return: AsyncTTSResult - resolved with string binary audio content.
+        """
+        return self._submit(self._client_tts.synthesize_audio_content, source_text)
+
+    def synthesize_audio_batch(self, list_source_texts, max_workers=None):
+        """
+        Creates audio files for several source texts asynchronously.
+
+        :param list_source_texts: list of strings or files with text for synthesize.
+        :param max_workers: int - max number of concurrent synthesis jobs (None - TTS client default).
+        :return: AsyncTTSResult - resolved with list of tuples as RobotisOP2TTSClient.synthesize_audio_batch.
+        """
+        return self._submit(self._client_tts.synthesize_audio_batch, list_source_texts, max_workers)
+
+    def synthesize_speech(self, source_text):
+        """
+        Speaks passed source_text asynchronously.
+
+        * Concurrent calls are played one after another by shared audio file player.
+
+        :param source_text: string or file with text for synthesize.
+        :return: AsyncTTSResult - resolved with bool indicator of succeeded synthesis.
+        """
+        return self._submit(self._client_tts.synthesize_speech, source_text)
+
+    def close(self):
+        """
+        Stops accepting TTS calls and waits for submitted ones.
+
+        :return: None (worker pool will be terminated).
+        """
+        self._pool.close()
+        self._pool.join()
+        self.logger.debug("Worker pool is closed.")
+
+    def _submit(self, function, *args):
+        """
+        Submits TTS call to worker pool.
+
+        * SystemExit raised by TTS clients on failure is turned to RobotisOP2TTSException,
+          so it does not stop worker.
+
+        :param function: callable - blocking TTS call.
+        :param args: arguments of TTS call.
+        :return: AsyncTTSResult - result of TTS call.
+        """
+        result = AsyncTTSResult()
+
+        def _call():
+            try:
+                result._finish(value=function(*args))
+            except SystemExit:
+                result._finish(exception=RobotisOP2TTSException("TTS client exits on failure."))
+            except Exception as e:
+                self.logger.error(msg=str(e), exc_info=True)
+                result._finish(exception=e)
+
+        self._pool.apply_async(_call)
+        self.logger.debug("%s call is submitted.", function.__name__)
+        return result
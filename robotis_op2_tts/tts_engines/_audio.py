@@ -0,0 +1,84 @@
+class AudioSegmentWriter(object):
+    """
+    Audio segment writer class.
+        - Appends audio contents synthesized segment by segment to single audio file.
+        - RIFF (WAV) contents are merged into single RIFF file with common header.
+        - Other contents (MP3 frames, Ogg pages) are appended as is, players decode such streams sequentially.
+
+    * Only one segment content is kept in memory at once.
+    * RIFF segments must have the same channels number, sample width and frame rate.
+    """
+    STR_MAGIC_RIFF = "RIFF"
+
+    _file_audio = None          # output file opened for binary writing (seekable for RIFF)
+    _writer_wave = None         # wave writer (None - first segment is not appended yet or content is not RIFF)
+    _bool_is_riff = None        # whether contents are RIFF (None - first segment is not appended yet)
+
+    def __init__(self, file_audio):
+        """
+        Constructs instance of AudioSegmentWriter class.
+
+        :param file_audio: file - output file opened for binary writing.
+        """
+        self._file_audio = file_audio
+
+    def append(self, str_content_audio):
+        """
+        Appends audio content of next segment.
+
+        :raises:
+            * wave.Error - if RIFF content is malformed or has different params than previous segments.
+        :param str_content_audio: string - binary audio content.
+        :return: None (content will be written).
+        """
+        import wave
+        from StringIO import StringIO
+
+        if self._bool_is_riff is None:
+            self._bool_is_riff = str_content_audio.startswith(self.STR_MAGIC_RIFF)
+        if not self._bool_is_riff:
+            self._file_audio.write(str_content_audio)
+            return
+
+        reader_wave = wave.open(StringIO(str_content_audio), 'rb')
+        try:
+            if self._writer_wave is None:
+                self._writer_wave = wave.open(self._file_audio, 'wb')
+                self._writer_wave.setparams(reader_wave.getparams())
+            elif reader_wave.getparams()[:3] != self._writer_wave.getparams()[:3]:
+                raise wave.Error("Segment audio params differ from previous segments.")
+            self._writer_wave.writeframes(reader_wave.readframes(reader_wave.getnframes()))
+        finally:
+            reader_wave.close()
+
+    def close(self):
+        """
+        Finishes audio file.
+            - Sizes in RIFF header are patched.
+
+        * Output file is not closed.
+
+        :return: None.
+        """
+        if self._writer_wave is not None:
+            self._writer_wave.close()       # wave writer does not close file it is passed
+            self._writer_wave = None
+
+
+def join_audio_contents(list_contents_audio):
+    """
+    Joins audio contents of consecutive segments into single audio content.
+
+    :raises:
+        * wave.Error - if RIFF contents are malformed or have different params.
+    :param list_contents_audio: list - binary audio contents in order.
+    :return: str - binary audio content.
+    """
+    from StringIO import StringIO
+
+    file_audio = StringIO()
+    writer = AudioSegmentWriter(file_audio)
+    for str_content_audio in list_contents_audio:
+        writer.append(str_content_audio)
+    writer.close()
+    return file_audio.getvalue()
@@ -1,5 +1,7 @@
 from base import InterfaceTTSClient, LoggableInterface
+from _exceptions.player import AudioPlaybackInterruptedException
 from errno import EEXIST
+import tracing
 
 
 class AbstractTTSClient(InterfaceTTSClient, LoggableInterface):
@@ -10,9 +12,14 @@ class AbstractTTSClient(InterfaceTTSClient, LoggableInterface):
         - Should be used as parent of all TTS clients.
         - Supports logging feature.
     """
+    STR_NAME_ENGINE = None           # name of TTS engine, it is a part of synthesis cache key
+    INT_SIZE_SEGMENT_MAX = 1000      # max length of source file segment synthesized by one engine call, characters
+
     _config_tts = None               # configuration of specific TTS client
     _str_path_output_dir = None      # audio output directory
     _str_format_file_audio = None    # audio file format
+    _cache_index = None              # index of synthesized audio files
+    _text_normalizer = None          # canonicalizes source text before cache key and engine call
 
     def __init__(self, dict_config):
         """
@@ -34,10 +41,15 @@ class AbstractTTSClient(InterfaceTTSClient, LoggableInterface):
         if self.validate_configuration(dict_config):
             from os import makedirs
             from os.path import abspath
+            from ._cache import AudioCacheIndex
+            from text_normalization import TextNormalizer
 
             self._str_format_file_audio = dict_config['audio_file_format'].encode('ascii', 'ignore')      # audio file format configuration
             dict_config.pop('audio_file_format', None)                          # to not to duplicate data
+            dict_config_cache = dict_config.pop('cache', None)                  # cache configuration is optional
+            dict_config_normalization = dict_config.pop('text_normalization', None)     # optional as well
             self._config_tts = dict_config
+            self._text_normalizer = TextNormalizer(dict_config_normalization, self._get_language())
 
             self._str_path_output_dir = abspath(self._str_path_output_dir)      # creates audio output directory
             try:
@@ -48,23 +60,115 @@ class AbstractTTSClient(InterfaceTTSClient, LoggableInterface):
                 self.logger.debug("Output audio directory is already exists. Output directory path = %s",
                                   self._str_path_output_dir)
                 pass
+            self._cache_index = AudioCacheIndex(self._str_path_output_dir, dict_config_cache)
+
+    def get_key_cache(self, source_text):
+        """
+        Returns synthesis cache key of source_text.
+
+        Key is a hash of:
+            - canonical source text (content of file if source_text is represented as file);
+            - TTS engine name;
+            - voice and call params of TTS engine;
+            - audio file format.
+
+        * File position is restored after content is read.
+        * Large file is hashed segment by segment (see iter_text).
+
+        :param source_text: source text to synthesize speech.
+        :return: str - hex digest of cache key.
+        """
+        import hashlib
+        import json
+
+        _hash = hashlib.sha1()
+        _hash.update(str(self.STR_NAME_ENGINE))
+        _hash.update("\n")
+        _hash.update(json.dumps(self._get_params_cache(), sort_keys=True))
+        _hash.update("\n")
+        _hash.update(str(self._str_format_file_audio))
+        _hash.update("\n")
+
+        if hasattr(source_text, 'read'):            # if source_text is represented as file
+            _int_position = source_text.tell()
+        for _int_index, _str_text in enumerate(self.iter_text(source_text)):
+            if isinstance(_str_text, unicode):
+                _str_text = _str_text.encode('utf-8')
+            if _int_index:
+                _hash.update(" ")
+            _hash.update(" ".join(_str_text.split()))     # normalize whitespaces
+        if hasattr(source_text, 'read'):
+            source_text.seek(_int_position)
+
+        str_key_cache = _hash.hexdigest()
+        self.logger.debug("Cache key = %s", str_key_cache)
+        return str_key_cache
+
+    def get_text(self, source_text):
+        """
+        Returns canonical text of source.
+            - Content of file is read if source_text is represented as file.
+            - Text is canonicalized by text normalizer, so equivalent inputs map to the same cached audio.
+
+        :param source_text: source text to synthesize speech.
+        :return: str - canonical text.
+        """
+        if hasattr(source_text, 'read'):    # if source_text is represented as file
+            try:
+                source_text = source_text.read()
+            except UnicodeDecodeError as e:      # if source text file is not text file
+                self.logger.error(msg=str(e), exc_info=True)
+                exit()
+            self.logger.debug("Source text is represented as file, read content.")
+        return self._text_normalizer.normalize(source_text)
+
+    def is_source_streamed(self, source_text):
+        """
+        Checks whether source text is file too large to be synthesized by one engine call.
+
+        * File-like object without descriptor is treated as large one.
+
+        :param source_text: source text to synthesize speech.
+        :return: bool - True (file is synthesized segment by segment), False (source text is read at once).
+        """
+        from os import fstat
+
+        if not hasattr(source_text, 'read'):
+            return False
+        try:
+            return fstat(source_text.fileno()).st_size - source_text.tell() > self.INT_SIZE_SEGMENT_MAX
+        except (AttributeError, IOError, OSError, ValueError):     # file-like object without descriptor
+            return True
+
+    def iter_text(self, source_text):
+        """
+        Yields canonical text of source.
+            - Large file is read lazily and yielded by segments not longer than INT_SIZE_SEGMENT_MAX.
+            - Other source text is yielded at once (see get_text).
+
+        :param source_text: source text to synthesize speech.
+        :return: generator - canonical texts.
+        """
+        from text_processing import iter_segments
+
+        if not self.is_source_streamed(source_text):
+            yield self.get_text(source_text)
+            return
+        for str_segment in iter_segments(source_text, self.INT_SIZE_SEGMENT_MAX):
+            yield self._text_normalizer.normalize(str_segment)
 
     def get_path_file_audio(self, source_text):
         """
         Returns path to audio file with source_text pronounced.
 
+        * File name is a synthesis cache key, so the same source text with the same params maps to the same file.
+
         :param source_text: source text to synthesize speech.
         :return: str - path to audio file.
         """
-        from os.path import basename, join
-        import datetime
+        from os.path import join
 
-        # creates audio file corresponding to source text
-        if hasattr(source_text, 'read'):             # if source_text is represented as file
-            _str_name_file_audio = ".".join(basename(source_text.name).split(".")[:-1])
-        else:                                               # if source_text is represented as string
-            _str_name_file_audio = datetime.datetime.now().strftime("%Y-%m-%d.%H:%M:%S")
-        _str_name_file_audio = "%s.%s" % (_str_name_file_audio, self._str_format_file_audio)
+        _str_name_file_audio = "%s.%s" % (self.get_key_cache(source_text), self._str_format_file_audio)
         str_path_file_audio = join(self._str_path_output_dir, _str_name_file_audio)
         self.logger.debug("Audio file path = %s", str_path_file_audio)
         return str_path_file_audio
@@ -73,19 +177,197 @@ class AbstractTTSClient(InterfaceTTSClient, LoggableInterface):
         """
         Checks whether audio file already exists.
 
+        * Cache index is asked instead of filesystem.
+
         :param str_path_file_audio: string path to audio file to check.
         :return: bool - True (exists), False (does not exist).
         """
-        from os.path import exists
-        from os import stat
-
-        if exists(str_path_file_audio) and stat(str_path_file_audio).st_size > 0:
+        with tracing.span("cache.lookup") as span:
+            bool_is_cached = self._cache_index.lookup(str_path_file_audio)
+            span.set_attribute('hit', bool_is_cached)
+        if bool_is_cached:
             self.logger.debug("%s audio file already exists.", str_path_file_audio)
             return True
         else:
             self.logger.debug("%s audio file does not exist yet.", str_path_file_audio)
             return False
 
+    def register_audio_file(self, str_path_file_audio):
+        """
+        Registers synthesized audio file in cache index.
+
+        :param str_path_file_audio: string path to completely written audio file.
+        :return: None (audio file will be available as cache hit).
+        """
+        self._cache_index.register(str_path_file_audio)
+
+    def get_path_file_audio_temp(self, str_path_file_audio):
+        """
+        Returns path to temporary file audio should be synthesized to before it is published.
+
+        :param str_path_file_audio: string path to audio file.
+        :return: str - path to empty temporary file in output directory.
+        """
+        return self._cache_index.get_path_file_temp(str_path_file_audio)
+
+    def commit_audio_file(self, str_path_file_temp, str_path_file_audio):
+        """
+        Atomically renames completely written temporary file to audio file and registers it in cache index.
+
+        :param str_path_file_temp: string path to closed temporary file.
+        :param str_path_file_audio: string path to audio file.
+        :return: bool - indicator of published audio file.
+        """
+        return self._cache_index.commit(str_path_file_temp, str_path_file_audio)
+
+    def write_audio_file(self, str_path_file_audio, str_content_audio):
+        """
+        Writes audio content crash-safely.
+            - Content is written to temporary file, flushed to disk and renamed to audio file.
+
+        :param str_path_file_audio: string path to audio file.
+        :param str_content_audio: string - binary audio content.
+        :return: str - path to audio file (None if it is not written).
+        """
+        from os import fsync, remove
+
+        str_path_file_temp = self.get_path_file_audio_temp(str_path_file_audio)
+        try:
+            with open(str_path_file_temp, 'wb') as file_audio:
+                file_audio.write(str_content_audio)
+                file_audio.flush()
+                fsync(file_audio.fileno())
+        except (IOError, OSError) as e:
+            self.logger.error(msg=str(e), exc_info=True)
+            try:
+                remove(str_path_file_temp)
+            except OSError:     # file is already deleted
+                pass
+            return None
+        if self.commit_audio_file(str_path_file_temp, str_path_file_audio):
+            return str_path_file_audio
+        return None
+
+    def synthesize_audio_streamed(self, source_text, str_path_file_audio):
+        """
+        Synthesizes large source file segment by segment into single audio file.
+            - Each segment is synthesized by synthesize_audio_content and appended to temporary file in order,
+              so memory usage does not depend on file size.
+            - Several segments may be synthesized concurrently (see _iter_contents_segments).
+            - Temporary file is published as audio file after the last segment.
+
+        :param source_text: file with text to synthesize speech.
+        :param str_path_file_audio: string path to audio file (computed before file is read).
+        :return: str - path to audio file (None if synthesis of any segment fails).
+        """
+        import wave
+        from os import fsync, remove
+        from ._audio import AudioSegmentWriter
+
+        str_path_file_temp = self.get_path_file_audio_temp(str_path_file_audio)
+        bool_is_committed = False
+        iter_contents_audio = self._iter_contents_segments(source_text)
+        try:
+            with open(str_path_file_temp, 'wb') as file_audio:
+                writer = AudioSegmentWriter(file_audio)
+                for _int_index, str_content_audio in enumerate(iter_contents_audio):
+                    if not str_content_audio:
+                        self.logger.error("Synthesis of segment %s fails.", _int_index)
+                        return None
+                    writer.append(str_content_audio)
+                    self.logger.debug("Segment %s is appended to audio file.", _int_index)
+                writer.close()
+                file_audio.flush()
+                fsync(file_audio.fileno())
+            bool_is_committed = self.commit_audio_file(str_path_file_temp, str_path_file_audio)
+        except (IOError, OSError, wave.Error) as e:
+            self.logger.error(msg=str(e), exc_info=True)
+        finally:
+            iter_contents_audio.close()     # segments synthesized ahead are waited for
+            if not bool_is_committed:
+                try:
+                    remove(str_path_file_temp)
+                except OSError:     # file is already deleted or renamed
+                    pass
+        if bool_is_committed:
+            return str_path_file_audio
+        return None
+
+    def _iter_contents_segments(self, source_text):
+        """
+        Yields audio contents of large source file segments in order.
+            - File is read lazily by segments not longer than INT_SIZE_SEGMENT_MAX.
+            - If TTS client synthesizes several segments concurrently (see _get_count_workers_segments),
+              next segments are synthesized while previous ones are yielded. Number of segments ahead is bounded
+              by number of workers, so memory usage still does not depend on file size.
+
+        :param source_text: file with text to synthesize speech.
+        :return: generator - binary audio contents (None if synthesis of segment fails).
+        """
+        from collections import deque
+        from multiprocessing.pool import ThreadPool
+        from text_processing import iter_segments
+
+        iter_segments_indexed = enumerate(iter_segments(source_text, self.INT_SIZE_SEGMENT_MAX))
+        int_count_workers = self._get_count_workers_segments()
+        if int_count_workers <= 1:
+            for _int_index, str_segment in iter_segments_indexed:
+                with tracing.span("segment.synthesize", index=_int_index):
+                    str_content_audio = self.synthesize_audio_content(str_segment)
+                yield str_content_audio
+            return
+
+        span_context = tracing.get_context()
+
+        def _synthesize(tuple_index_segment):
+            _int_index, _str_segment = tuple_index_segment
+            with tracing.attach(span_context):
+                with tracing.span("segment.synthesize", index=_int_index):
+                    try:
+                        return self.synthesize_audio_content(_str_segment)
+                    except SystemExit:      # TTS clients exit on failure, it would stop pool thread silently
+                        return None
+
+        pool = ThreadPool(int_count_workers)
+        deque_results = deque()
+        try:
+            for tuple_index_segment in iter_segments_indexed:
+                deque_results.append(pool.apply_async(_synthesize, (tuple_index_segment,)))
+                if len(deque_results) >= int_count_workers:
+                    yield deque_results.popleft().get()
+            while deque_results:
+                yield deque_results.popleft().get()
+        finally:
+            pool.close()
+            pool.join()
+
+    def _get_count_workers_segments(self):
+        """
+        Returns number of large source file segments synthesized concurrently.
+            - Each particular TTS client implements its own specification.
+
+        :return: int - number of workers (1 - segments are synthesized one by one).
+        """
+        return 1
+
+    def _get_language(self):
+        """
+        Returns language of TTS client.
+            - Each particular TTS client implements its own specification.
+
+        :return: str - language (e.g. "en-GB", "russian"), None if it is unknown.
+        """
+        return None
+
+    def _get_params_cache(self):
+        """
+        Returns TTS client params that affect synthesized audio.
+            - Each particular TTS client implements its own specification.
+
+        :return: dict - voice and call params.
+        """
+        pass
+
     def _is_str_marked_up_ssml(self, str_text):
         """
         Validates if string is marked up with SSML tags.
@@ -105,9 +387,13 @@ class AbstractTTSClientDelegate(InterfaceTTSClient, LoggableInterface):
         - Should be used as parent of all TTS client delegates.
         - Supports logging feature.
     """
+    INT_COUNT_WORKERS_BATCH = 1     # default number of batch synthesis workers
+
     _config_tts = None              # configuration of specific TTS client
     _client_tts = None              # specific TTS client
-    _str_command_play_audio = None  # command to call audio player
+    _audio_file_player = None       # audio file player shared with other TTS client delegates
+    _dict_config_pipeline = None    # configuration of pipelined speech synthesis
+    _dict_config_in_memory = None   # configuration of in-memory audio mode
 
     def __init__(self, dict_config):
         """
@@ -130,6 +416,248 @@ class AbstractTTSClientDelegate(InterfaceTTSClient, LoggableInterface):
         :return: None (fields will be initialized).
         """
         if self.validate_configuration(dict_config):
-            self._str_command_play_audio = dict_config['audio_file_player']['command'].encode('ascii', 'ignore')
+            from player import get_audio_file_player
+
+            self._audio_file_player = get_audio_file_player(dict_config['audio_file_player'])
             dict_config.pop('audio_file_player')    # to not to duplicate data
+            self._dict_config_pipeline = dict_config.pop('speech_pipeline', None) or {}
+            self._dict_config_in_memory = dict_config.pop('audio_in_memory', None) or {}
             self._config_tts = dict_config
+
+    def synthesize_audio_content(self, source_text):
+        """
+        Implements corresponding method of interface parent class.
+
+        * Cached audio file is read instead of synthesis.
+        * Synthesized audio is written to cache if it is enabled in in-memory audio configuration.
+        """
+        str_path_file_audio = self._client_tts.get_path_file_audio(source_text)
+        if self._client_tts.is_audio_file_exist(str_path_file_audio):
+            self.logger.info("Audio file with synthesized speech already exists. Get it %s.", str_path_file_audio)
+            with open(str_path_file_audio, 'rb') as file_audio:
+                return file_audio.read()
+
+        self.logger.info("Speech synthesis starts. Please, wait.")
+        self.logger.debug("It redirects call to %s.", self._client_tts)
+        str_content_audio = self._client_tts.synthesize_audio_content(source_text)
+        if str_content_audio:
+            self._cache_audio_content(str_path_file_audio, str_content_audio)
+        return str_content_audio
+
+    def _is_audio_in_memory_enabled(self):
+        """
+        Checks whether in-memory audio mode is enabled in configuration.
+
+        :return: bool - True (enabled), False (disabled).
+        """
+        return bool(self._dict_config_in_memory.get('enabled', False))
+
+    def _cache_audio_content(self, str_path_file_audio, str_content_audio):
+        """
+        Writes synthesized audio content to cache if it is enabled in in-memory audio configuration.
+
+        :param str_path_file_audio: string path to audio file of source text.
+        :param str_content_audio: string - binary audio content.
+        :return: None (audio file will be written).
+        """
+        if self._dict_config_in_memory.get('cache', True):
+            self._client_tts.write_audio_file(str_path_file_audio, str_content_audio)
+
+    def _synthesize_speech_in_memory(self, source_text):
+        """
+        Speaks source text without audio file round trip.
+            - Synthesized audio is streamed to audio player.
+            - Cache is written while audio is played.
+
+        :raises:
+            * AudioPlaybackInterruptedException - if playback is interrupted by skip or stop.
+        :param source_text: source text to speak.
+        :return: bool - indicator of succeeded synthesis.
+        """
+        str_path_file_audio = self._client_tts.get_path_file_audio(source_text)    # before file source is read
+        str_content_audio = self._client_tts.synthesize_audio_content(source_text)
+        if not str_content_audio:
+            return False
+        with tracing.span("player.play", in_memory=True):
+            item = self._audio_file_player.enqueue_content(str_content_audio)
+            self._cache_audio_content(str_path_file_audio, str_content_audio)
+            bool_result = item.wait()
+        if item.bool_interrupted:
+            raise AudioPlaybackInterruptedException(item.get_name())
+        if not bool_result:
+            self.logger.error("Audio player fails to play in-memory audio.")
+        return bool_result
+
+    def _get_count_workers_batch(self, max_workers):
+        """
+        Returns number of batch synthesis workers.
+            - Configuration field "batch_workers" overrides class default.
+
+        :param max_workers: int - requested max number of workers (None - default).
+        :return: int - number of workers.
+        """
+        if max_workers is None:
+            max_workers = self._config_tts.get('batch_workers', self.INT_COUNT_WORKERS_BATCH)
+        return max(1, int(max_workers))
+
+    def synthesize_audio_batch(self, list_source_texts, max_workers=None):
+        """
+        Implements corresponding method of interface parent class.
+
+        * Source texts are synthesized by thread pool.
+        """
+        from multiprocessing.pool import ThreadPool
+
+        span_context = tracing.get_context()
+
+        def _synthesize(source_text):
+            try:
+                with tracing.attach(span_context):
+                    str_path_file_audio = self.synthesize_audio(source_text)
+            except SystemExit:      # TTS clients exit on failure
+                str_path_file_audio = None
+            except Exception as e:
+                self.logger.error(msg=str(e), exc_info=True)
+                return False, str(e)
+            if str_path_file_audio is None:
+                return False, "Audio synthesis fails."
+            return True, str_path_file_audio
+
+        int_count_workers = self._get_count_workers_batch(max_workers)
+        self.logger.info("Batch synthesis of %s source texts starts. Workers = %s.",
+                         len(list_source_texts), int_count_workers)
+        pool = ThreadPool(int_count_workers)
+        try:
+            list_results = pool.map(_synthesize, list_source_texts)
+        finally:
+            pool.close()
+            pool.join()
+        self.logger.info("Batch synthesis is finished. Succeeded = %s/%s.",
+                         len([_tuple for _tuple in list_results if _tuple[0]]), len(list_results))
+        return list_results
+
+    def is_source_streamed(self, source_text):
+        """
+        Checks whether source text is file too large to be synthesized by one engine call of TTS client.
+
+        :param source_text: source text to synthesize speech.
+        :return: bool - True (file is synthesized segment by segment), False (source text is read at once).
+        """
+        return self._client_tts.is_source_streamed(source_text)
+
+    def get_audio_file_player(self):
+        """
+        Returns audio file player of delegate.
+
+        :return: AudioFilePlayer - player instance.
+        """
+        return self._audio_file_player
+
+    def _play_audio_file(self, str_path_file_audio):
+        """
+        Plays audio file by audio player.
+
+        :raises:
+            * AudioPlaybackInterruptedException - if playback is interrupted by skip or stop.
+        :param str_path_file_audio: string path to audio file.
+        :return: bool - indicator of succeeded playback.
+        """
+        self.logger.debug("It calls audio player to play audio.")
+        with tracing.span("player.play"):
+            item = self._audio_file_player.enqueue(str_path_file_audio)
+            bool_result = item.wait()
+        if item.bool_interrupted:
+            raise AudioPlaybackInterruptedException(str_path_file_audio)
+        if not bool_result:
+            self.logger.error("Audio player fails to play %s.", str_path_file_audio)
+        return bool_result
+
+    def _is_speech_pipeline_enabled(self):
+        """
+        Checks whether pipelined speech synthesis is enabled in configuration.
+
+        :return: bool - True (enabled), False (disabled).
+        """
+        return bool(self._dict_config_pipeline.get('enabled', False))
+
+    def _synthesize_speech_streamed(self, source_text):
+        """
+        Speaks large source file while it is read.
+            - File is read lazily by segments not longer than TTS client INT_SIZE_SEGMENT_MAX.
+            - Segments are split into sentences if speech pipeline is enabled.
+            - Segments (sentences) are spoken by pipelined speech synthesis.
+
+        :param source_text: file with text to speak.
+        :return: bool - indicator of succeeded synthesis.
+        """
+        from text_processing import iter_segments, iter_sentences
+
+        self.logger.debug("Source file is spoken segment by segment.")
+        if self._is_speech_pipeline_enabled():
+            return self._synthesize_speech_pipelined(iter_sentences(source_text, self._client_tts.INT_SIZE_SEGMENT_MAX))
+        return self._synthesize_speech_pipelined(iter_segments(source_text, self._client_tts.INT_SIZE_SEGMENT_MAX))
+
+    def _synthesize_speech_pipelined(self, iter_sentences):
+        """
+        Speaks sentences one by one while next sentences are synthesized.
+            - Worker thread synthesizes audio files of sentences ahead of playback.
+            - Bounded queue limits number of sentences synthesized ahead.
+            - Playback starts as soon as first sentence is synthesized.
+
+        * Sentences may be generator, it is consumed lazily by worker thread.
+
+        :raises:
+            * AudioPlaybackInterruptedException - if playback is interrupted by skip or stop.
+        :param iter_sentences: iterable - sentences to speak.
+        :return: bool - indicator of succeeded synthesis.
+        """
+        from Queue import Queue, Full
+        from threading import Thread, Event
+
+        queue_files_audio = Queue(maxsize=int(self._dict_config_pipeline.get('queue_size', 2)))
+        event_stop = Event()
+        span_context = tracing.get_context()
+        _end = object()     # marks that all sentences are synthesized
+
+        def _put(item):
+            while not event_stop.is_set():
+                try:
+                    queue_files_audio.put(item, timeout=0.1)
+                    return
+                except Full:
+                    continue
+
+        def _synthesize():
+            try:
+                for str_sentence in iter_sentences:
+                    with tracing.attach(span_context):
+                        str_path_file_audio = self.synthesize_audio(str_sentence)
+                    _put(str_path_file_audio)
+                    if str_path_file_audio is None or event_stop.is_set():
+                        return
+            except SystemExit:      # TTS clients exit on failure
+                _put(None)
+                return
+            except Exception as e:     # e.g. source file can not be read
+                self.logger.error(msg=str(e), exc_info=True)
+                _put(None)
+                return
+            _put(_end)
+
+        thread_synthesis = Thread(target=_synthesize, name="%s-synthesis" % self.__class__.__name__)
+        thread_synthesis.daemon = True
+        thread_synthesis.start()
+        self.logger.debug("Pipelined speech synthesis starts.")
+
+        bool_result = True
+        try:
+            while True:
+                str_path_file_audio = queue_files_audio.get()
+                if str_path_file_audio is _end:
+                    break
+                if str_path_file_audio is None or not self._play_audio_file(str_path_file_audio):
+                    bool_result = False
+                    break
+        finally:
+            event_stop.set()
+        return bool_result
@@ -0,0 +1,364 @@
+from base import LoggableInterface
+from threading import Lock
+import time
+
+
+class AudioCacheIndex(LoggableInterface):
+    """
+    Audio cache index class.
+        - Persists information about synthesized audio files of TTS client output directory.
+        - Answers cache lookups by index, optionally verifies size of found audio file on disk.
+        - Evicts entries by total size (least recently used first) and by age.
+        - Publishes audio files atomically: file is written to temporary file of output directory,
+          then renamed to final path, so partially written file is never visible under final name.
+        - Supports logging feature.
+
+    * Index is stored as sqlite database inside output directory.
+    * Cache hit does not write to disk: hit time and count are buffered and written in batches
+      (and before eviction by size), so only hit statistics of last moments may be lost on crash.
+    * Instance is safe to use from several threads.
+    * Temporary files left by crashed process are deleted at startup, files of running processes
+      (e.g. daemon sharing output directory) are kept.
+    """
+    STR_NAME_FILE_INDEX = "index.sqlite"
+    STR_SUFFIX_FILE_TEMP = ".tmp"
+
+    INT_SIZE_MAX_DEFAULT = 104857600    # 100 Mbytes
+    INT_AGE_MAX_DEFAULT = 2592000       # 30 days in seconds
+    INT_COUNT_HITS_FLUSH = 64           # number of buffered hits written at once
+    FLOAT_INTERVAL_HITS_FLUSH = 300.0   # max time hits stay buffered, seconds
+    INT_AGE_FILE_TEMP_MAX = 86400       # temporary file older than it is deleted even if its process runs, seconds
+
+    _str_path_dir = None        # indexed output directory
+    _int_size_max = None        # max total size of indexed audio files, bytes
+    _int_age_max = None         # max age of indexed audio file, seconds
+    _bool_verify = False        # whether size of audio file is verified on lookup
+    _int_size_total = 0         # current total size of indexed audio files, bytes
+    _dict_hits = None           # buffered hits: key -> (time of last hit, number of hits)
+    _float_time_hits_flushed = None     # time buffered hits were written last time
+    _connection = None          # sqlite connection
+    _lock = None                # guards connection and total size
+
+    def __init__(self, str_path_dir, dict_config=None):
+        """
+        Constructs instance of AudioCacheIndex class.
+
+        Configuration dictionary keys (all are optional):
+            - size_max - max total size of cached audio files, bytes.
+            - age_max - max age of cached audio file, seconds.
+            - verify - whether size of audio file on disk is compared with indexed size on lookup.
+
+        :param str_path_dir: string path to existing output directory.
+        :param dict_config: dict - cache configuration.
+        """
+        super(AudioCacheIndex, self).__init__(name=self.__class__.__name__)
+        import sqlite3
+        from os.path import join, exists
+
+        if dict_config is None:
+            dict_config = {}
+        self._str_path_dir = str_path_dir
+        self._int_size_max = int(dict_config.get('size_max', self.INT_SIZE_MAX_DEFAULT))
+        self._int_age_max = int(dict_config.get('age_max', self.INT_AGE_MAX_DEFAULT))
+        self._bool_verify = bool(dict_config.get('verify', False))
+        self._dict_hits = {}
+        self._float_time_hits_flushed = time.time()
+        self._lock = Lock()
+
+        _str_path_file_index = join(self._str_path_dir, self.STR_NAME_FILE_INDEX)
+        _bool_is_index_new = not exists(_str_path_file_index)
+        self._connection = sqlite3.connect(_str_path_file_index, check_same_thread=False)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS entries ("
+                                 "key TEXT PRIMARY KEY, "
+                                 "size INTEGER NOT NULL, "
+                                 "time_created REAL NOT NULL, "
+                                 "time_hit_last REAL NOT NULL, "
+                                 "count_hit INTEGER NOT NULL DEFAULT 0)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS entries_time_hit_last ON entries (time_hit_last)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS entries_time_created ON entries (time_created)")
+        self._connection.commit()
+        self._remove_files_temp()
+        if _bool_is_index_new:
+            self._import_directory()
+        self._int_size_total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        self.evict()
+        self.logger.debug("Cache index is ready. Total size = %s bytes.", self._int_size_total)
+
+    def _remove_files_temp(self):
+        """
+        Removes temporary audio files left by interrupted synthesis.
+
+        * File is deleted if process that created it is not running or file is older than INT_AGE_FILE_TEMP_MAX.
+
+        :return: None (files will be deleted).
+        """
+        from os import listdir, remove, stat
+        from os.path import join
+
+        _float_time_now = time.time()
+        for _str_name_file in listdir(self._str_path_dir):
+            if not _str_name_file.endswith(self.STR_SUFFIX_FILE_TEMP):
+                continue
+            _str_path_file = join(self._str_path_dir, _str_name_file)
+            try:
+                if self._is_process_running(self._get_pid_file_temp(_str_name_file)) and \
+                        _float_time_now - stat(_str_path_file).st_mtime <= self.INT_AGE_FILE_TEMP_MAX:
+                    continue
+                remove(_str_path_file)
+                self.logger.debug("Temporary file %s is removed.", _str_name_file)
+            except OSError:     # file is already deleted
+                pass
+
+    def _get_pid_file_temp(self, str_name_file_temp):
+        """
+        Returns ID of process that created temporary file.
+            - Temporary file name is "<audio file name>.<random>.<process ID>.tmp" (see get_path_file_temp).
+
+        :param str_name_file_temp: string - temporary file name.
+        :return: int - process ID (None if file name does not contain it).
+        """
+        _list_parts = str_name_file_temp.split('.')
+        try:
+            return int(_list_parts[-2])
+        except (IndexError, ValueError):
+            return None
+
+    def _is_process_running(self, int_pid):
+        """
+        Checks whether process is running.
+
+        :param int_pid: int - process ID (None - unknown process).
+        :return: bool - True (running), False (finished or unknown).
+        """
+        import errno
+        from os import kill
+
+        if int_pid is None:
+            return False
+        try:
+            kill(int_pid, 0)
+        except OSError as e:
+            return e.errno == errno.EPERM       # process of another user
+        return True
+
+    def _import_directory(self):
+        """
+        Imports audio files that were synthesized before index creation.
+
+        :return: None (entries will be inserted).
+        """
+        from os import listdir, stat
+        from os.path import join, isfile
+
+        for _str_name_file in listdir(self._str_path_dir):
+            _str_path_file = join(self._str_path_dir, _str_name_file)
+            if _str_name_file.startswith(self.STR_NAME_FILE_INDEX) or not isfile(_str_path_file):
+                continue
+            _stat = stat(_str_path_file)
+            if _stat.st_size > 0:
+                self._connection.execute("INSERT OR REPLACE INTO entries (key, size, time_created, time_hit_last) "
+                                         "VALUES (?, ?, ?, ?)",
+                                         (_str_name_file, _stat.st_size, _stat.st_mtime, _stat.st_mtime))
+        self._connection.commit()
+        self.logger.debug("Existing audio files are imported to cache index.")
+
+    def _get_key(self, str_path_file_audio):
+        """
+        Returns index key of audio file.
+
+        :param str_path_file_audio: string path to audio file.
+        :return: str - audio file name.
+        """
+        from os.path import basename
+
+        return basename(str_path_file_audio)
+
+    def lookup(self, str_path_file_audio):
+        """
+        Checks whether audio file is cached.
+            - Buffers last hit time and hit count of found entry (see _flush_hits).
+
+        * Expired entry is evicted and reported as absent.
+        * If verification is enabled, entry which file is missing or has size other than indexed one
+          is evicted and reported as absent.
+
+        :param str_path_file_audio: string path to audio file.
+        :return: bool - True (cached), False (is not cached).
+        """
+        _str_key = self._get_key(str_path_file_audio)
+        _float_time_now = time.time()
+        with self._lock:
+            _row = self._connection.execute("SELECT time_created, size FROM entries WHERE key = ?",
+                                            (_str_key,)).fetchone()
+            if _row is None:
+                return False
+            if _float_time_now - _row[0] > self._int_age_max:
+                self._remove(_str_key)
+                self._connection.commit()
+                return False
+            if self._bool_verify and not self._is_file_complete(str_path_file_audio, _row[1]):
+                self.logger.warn("%s audio file is incomplete. It is evicted.", _str_key)
+                self._remove(_str_key)
+                self._connection.commit()
+                return False
+            self._dict_hits[_str_key] = (_float_time_now, self._dict_hits.get(_str_key, (None, 0))[1] + 1)
+            if len(self._dict_hits) >= self.INT_COUNT_HITS_FLUSH or \
+                    _float_time_now - self._float_time_hits_flushed >= self.FLOAT_INTERVAL_HITS_FLUSH:
+                self._flush_hits()
+                self._connection.commit()
+        return True
+
+    def _flush_hits(self):
+        """
+        Writes buffered hits to index.
+
+        * Caller must hold the lock and commit changes.
+
+        :return: None (entries will be updated).
+        """
+        if self._dict_hits:
+            self._connection.executemany("UPDATE entries SET time_hit_last = ?, count_hit = count_hit + ? "
+                                         "WHERE key = ?",
+                                         [(_float_time_hit, _int_count, _str_key)
+                                          for _str_key, (_float_time_hit, _int_count) in self._dict_hits.items()])
+            self._dict_hits = {}
+        self._float_time_hits_flushed = time.time()
+
+    def flush(self):
+        """
+        Writes buffered hits to index.
+
+        :return: None (entries will be updated).
+        """
+        with self._lock:
+            self._flush_hits()
+            self._connection.commit()
+
+    def _is_file_complete(self, str_path_file_audio, int_size):
+        """
+        Checks whether audio file on disk has indexed size.
+
+        :param str_path_file_audio: string path to audio file.
+        :param int_size: int - indexed size of audio file, bytes.
+        :return: bool - True (complete), False (missing or truncated).
+        """
+        from os import stat
+
+        try:
+            return stat(str_path_file_audio).st_size == int_size
+        except OSError:     # file is deleted
+            return False
+
+    def get_path_file_temp(self, str_path_file_audio):
+        """
+        Creates empty temporary file for audio file.
+
+        * Temporary file is placed into output directory, so rename to final path is atomic.
+
+        :param str_path_file_audio: string path to audio file.
+        :return: str - path to temporary file.
+        """
+        from os import close, getpid
+        from os.path import basename
+        from tempfile import mkstemp
+
+        # process ID in name keeps file from removal by other processes sharing output directory
+        _int_descriptor, str_path_file_temp = mkstemp(suffix=".%s%s" % (getpid(), self.STR_SUFFIX_FILE_TEMP),
+                                                      prefix=basename(str_path_file_audio) + ".",
+                                                      dir=self._str_path_dir)
+        close(_int_descriptor)
+        return str_path_file_temp
+
+    def commit(self, str_path_file_temp, str_path_file_audio):
+        """
+        Publishes completely written temporary file as audio file and registers it.
+
+        * Empty temporary file is treated as failed synthesis and deleted.
+
+        :param str_path_file_temp: string path to closed temporary file.
+        :param str_path_file_audio: string path to audio file.
+        :return: bool - True (published), False (temporary file is empty or can not be renamed).
+        """
+        from os import stat, rename, remove
+
+        try:
+            if stat(str_path_file_temp).st_size == 0:
+                self.logger.warn("Synthesized audio file is empty, it is not cached.")
+                remove(str_path_file_temp)
+                return False
+            rename(str_path_file_temp, str_path_file_audio)
+        except OSError as e:
+            self.logger.error(msg=str(e), exc_info=True)
+            return False
+        self.register(str_path_file_audio)
+        return True
+
+    def register(self, str_path_file_audio):
+        """
+        Registers synthesized audio file in index.
+            - Evicts entries if cache limits are exceeded.
+
+        :param str_path_file_audio: string path to completely written audio file.
+        :return: None (entry will be inserted).
+        """
+        from os import stat
+
+        _str_key = self._get_key(str_path_file_audio)
+        _int_size = stat(str_path_file_audio).st_size
+        _float_time_now = time.time()
+        with self._lock:
+            self._remove(_str_key, bool_delete_file=False)     # file could be overwritten
+            self._connection.execute("INSERT INTO entries (key, size, time_created, time_hit_last) "
+                                     "VALUES (?, ?, ?, ?)", (_str_key, _int_size, _float_time_now, _float_time_now))
+            self._int_size_total += _int_size
+            self._connection.commit()
+        self.logger.debug("%s is registered in cache index.", _str_key)
+        self.evict()
+
+    def evict(self):
+        """
+        Evicts entries older than max age and least recently used entries until total size fits max size.
+
+        :return: None (entries and corresponding audio files will be deleted).
+        """
+        _float_time_min = time.time() - self._int_age_max
+        with self._lock:
+            for (_str_key,) in self._connection.execute("SELECT key FROM entries WHERE time_created < ?",
+                                                        (_float_time_min,)).fetchall():
+                self._remove(_str_key)
+                self.logger.debug("%s is evicted by age.", _str_key)
+            if self._int_size_total > self._int_size_max:
+                self._flush_hits()      # least recently used entry is chosen by actual hit times
+            while self._int_size_total > self._int_size_max:
+                _row = self._connection.execute("SELECT key FROM entries "
+                                                "ORDER BY time_hit_last ASC LIMIT 1").fetchone()
+                if _row is None:
+                    break
+                self._remove(_row[0])
+                self.logger.debug("%s is evicted by size.", _row[0])
+            self._connection.commit()
+
+    def _remove(self, str_key, bool_delete_file=True):
+        """
+        Removes entry from index.
+
+        * Caller must hold the lock and commit changes.
+
+        :param str_key: index key of audio file.
+        :param bool_delete_file: bool - whether audio file should be deleted.
+        :return: None (entry will be deleted).
+        """
+        from os import remove
+        from os.path import join
+
+        self._dict_hits.pop(str_key, None)
+        _row = self._connection.execute("SELECT size FROM entries WHERE key = ?", (str_key,)).fetchone()
+        if _row is None:
+            return
+        self._connection.execute("DELETE FROM entries WHERE key = ?", (str_key,))
+        self._int_size_total -= _row[0]
+        if bool_delete_file:
+            try:
+                remove(join(self._str_path_dir, str_key))
+            except OSError:     # file is already deleted
+                pass
@@ -17,3 +17,21 @@ class InterfaceTTSCloudClient(InterfaceTTSClient):
         :return: bool - indicator of succeeded validation.
         """
         pass
+
+    def get_voices(self, str_language_code=None, bool_refresh=False):
+        """
+        Returns voices available in TTS cloud service.
+
+        :param str_language_code: string - language code voices should support (None - all voices).
+        :param bool_refresh: bool - whether voice list is fetched from service regardless of local catalogue.
+        :return: list - voice dictionaries sorted by name (None if voices are not available).
+        """
+        pass
+
+    def get_channel_stats(self):
+        """
+        Returns statistics of connection to TTS cloud service.
+
+        :return: dict - connection statistics (None if TTS cloud client does not track connection).
+        """
+        pass
@@ -0,0 +1,187 @@
+from base import LoggableInterface
+from threading import Lock
+import time
+import os
+
+
+class GoogleChannel(LoggableInterface):
+    """
+    Google Cloud TTS channel class.
+        - Keeps single gRPC channel with keepalive and TextToSpeechClient over it.
+        - Is shared by all Google Cloud TTS clients of process with the same credentials (see get_channel).
+        - Warms channel up (TLS handshake, auth token fetch) with cheap call before first synthesis.
+        - Tracks channel connectivity state and number of reconnects.
+        - Supports logging feature.
+
+    Channel statistics dictionary keys:
+        - state - connectivity state name (e.g. "READY", None if channel is not created yet).
+        - reconnects - number of times channel became ready again after first connection.
+        - failures - number of transient failures of channel.
+        - warmed_up - whether warm-up call succeeded.
+        - time_warm_up - duration of warm-up call, seconds (None if warm-up is not performed).
+
+    * Channel is created on first demand, so heavy google.cloud and grpc modules are not imported at startup.
+    """
+    STR_ADDRESS = "texttospeech.googleapis.com:443"
+    TUPLE_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
+    INT_KEEPALIVE_DEFAULT = 30              # interval between keepalive pings, seconds
+    INT_KEEPALIVE_TIMEOUT_DEFAULT = 10      # time to wait for keepalive ping ack, seconds
+    FLOAT_TIMEOUT_WARM_UP_DEFAULT = 10.0    # timeout of warm-up call, seconds
+
+    _str_path_credentials = None    # path to service account key (None - default credentials)
+    _int_keepalive = None           # interval between keepalive pings, seconds
+    _int_keepalive_timeout = None   # time to wait for keepalive ping ack, seconds
+    _channel = None                 # gRPC channel (created on first use)
+    _client_tts = None              # TextToSpeechClient over channel (created on first use)
+
+    _str_state = None               # last connectivity state name
+    _int_count_ready = 0            # number of transitions to ready state
+    _int_count_failures = 0         # number of transitions to transient failure state
+    _bool_warmed_up = False         # whether warm-up call succeeded
+    _float_time_warm_up = None      # duration of warm-up call, seconds
+    _thread_warm_up = None          # background warm-up thread
+    _lock = None                    # guards creation of channel
+    _lock_stats = None              # guards statistics (connectivity callback may be called under channel lock)
+
+    def __init__(self, str_path_credentials, dict_config=None):
+        """
+        Constructs instance of GoogleChannel class.
+
+        Configuration dictionary keys (all are optional):
+            - keepalive - interval between keepalive pings, seconds.
+            - keepalive_timeout - time to wait for keepalive ping ack, seconds.
+
+        :param str_path_credentials: string path to service account key (None - default credentials).
+        :param dict_config: dict - channel configuration.
+        """
+        super(GoogleChannel, self).__init__(name=self.__class__.__name__)
+        if dict_config is None:
+            dict_config = {}
+        self._str_path_credentials = str_path_credentials
+        self._int_keepalive = int(dict_config.get('keepalive', self.INT_KEEPALIVE_DEFAULT))
+        self._int_keepalive_timeout = int(dict_config.get('keepalive_timeout', self.INT_KEEPALIVE_TIMEOUT_DEFAULT))
+        self._lock = Lock()
+        self._lock_stats = Lock()
+
+    def get_client(self):
+        """
+        Returns TextToSpeechClient over shared channel.
+
+        * google.cloud.texttospeech (and grpc under it) is imported, channel and client are created on first call.
+
+        :return: texttospeech.TextToSpeechClient - Google Cloud TTS client.
+        """
+        with self._lock:
+            if self._client_tts is None:
+                from google.api_core import grpc_helpers
+                from google.cloud import texttospeech
+                from google.cloud.texttospeech_v1.gapic.transports.text_to_speech_grpc_transport import \
+                    TextToSpeechGrpcTransport
+
+                _float_time_start = time.time()
+                self._channel = grpc_helpers.create_channel(
+                    self.STR_ADDRESS,
+                    scopes=self.TUPLE_SCOPES,
+                    options=[('grpc.keepalive_time_ms', self._int_keepalive * 1000),
+                             ('grpc.keepalive_timeout_ms', self._int_keepalive_timeout * 1000),
+                             ('grpc.keepalive_permit_without_calls', 1),
+                             ('grpc.http2.max_pings_without_data', 0)])
+                self._channel.subscribe(self._on_connectivity_changed)
+                self._client_tts = texttospeech.TextToSpeechClient(
+                    transport=TextToSpeechGrpcTransport(channel=self._channel))
+                self.logger.debug("Channel is created in %.3f seconds.", time.time() - _float_time_start)
+            return self._client_tts
+
+    def _on_connectivity_changed(self, connectivity):
+        """
+        Tracks channel connectivity.
+
+        * Is called by gRPC in its own thread.
+
+        :param connectivity: grpc.ChannelConnectivity - new connectivity state.
+        :return: None (statistics will be updated).
+        """
+        with self._lock_stats:
+            self._str_state = connectivity.name
+            if self._str_state == 'READY':
+                self._int_count_ready += 1
+                if self._int_count_ready > 1:
+                    self.logger.info("Channel is reconnected. Reconnects = %s.", self._int_count_ready - 1)
+            elif self._str_state == 'TRANSIENT_FAILURE':
+                self._int_count_failures += 1
+                self.logger.warn("Channel fails transiently. Failures = %s.", self._int_count_failures)
+        self.logger.debug("Channel state = %s.", connectivity.name)
+
+    def warm_up(self, str_language_code=None, float_timeout=FLOAT_TIMEOUT_WARM_UP_DEFAULT):
+        """
+        Performs cheap call, so connection setup is not paid by first synthesis.
+            - Voice list of single language is requested.
+
+        :param str_language_code: string - language code to list voices of.
+        :param float_timeout: float - timeout of warm-up call, seconds.
+        :return: bool - True (channel is warmed up), False (call fails).
+        """
+        _float_time_start = time.time()
+        try:
+            self.get_client().list_voices(language_code=str_language_code, retry=None, timeout=float_timeout)
+        except Exception as e:      # any failure of service or transport
+            self.logger.warn("Channel warm-up fails: %s", e)
+            return False
+        with self._lock_stats:
+            self._bool_warmed_up = True
+            self._float_time_warm_up = time.time() - _float_time_start
+        self.logger.info("Channel is warmed up in %.3f seconds.", self._float_time_warm_up)
+        return True
+
+    def start_warm_up(self, str_language_code=None, float_timeout=FLOAT_TIMEOUT_WARM_UP_DEFAULT):
+        """
+        Warms channel up in background thread.
+
+        * Call is ignored if channel is already warmed up or warm-up is in progress.
+
+        :param str_language_code: string - language code to list voices of.
+        :param float_timeout: float - timeout of warm-up call, seconds.
+        :return: None (warm-up thread will be started).
+        """
+        from threading import Thread
+
+        with self._lock_stats:
+            if self._bool_warmed_up or (self._thread_warm_up is not None and self._thread_warm_up.is_alive()):
+                return
+            self._thread_warm_up = Thread(target=self.warm_up, args=(str_language_code, float_timeout),
+                                          name="GoogleChannelWarmUp")
+            self._thread_warm_up.daemon = True
+            self._thread_warm_up.start()
+
+    def get_stats(self):
+        """
+        Returns channel statistics.
+
+        :return: dict - channel statistics (see class description).
+        """
+        with self._lock_stats:
+            return {'state': self._str_state,
+                    'reconnects': max(0, self._int_count_ready - 1),
+                    'failures': self._int_count_failures,
+                    'warmed_up': self._bool_warmed_up,
+                    'time_warm_up': self._float_time_warm_up}
+
+
+_dict_channels = {}         # channels shared by Google Cloud TTS clients, by path to service account key
+_lock_channels = Lock()
+
+
+def get_channel(dict_config=None):
+    """
+    Returns channel shared by Google Cloud TTS clients with current credentials.
+
+    * Channel is keyed by GOOGLE_APPLICATION_CREDENTIALS, configuration of the first caller is applied.
+
+    :param dict_config: dict - channel configuration (see GoogleChannel).
+    :return: GoogleChannel - channel instance.
+    """
+    str_path_credentials = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
+    with _lock_channels:
+        if str_path_credentials not in _dict_channels:
+            _dict_channels[str_path_credentials] = GoogleChannel(str_path_credentials, dict_config)
+        return _dict_channels[str_path_credentials]
@@ -1,12 +1,14 @@
 from tts_engines._base import AbstractTTSClient
 from .._base import InterfaceTTSCloudClient
+from ..network_monitor import get_network_monitor
+from ..retry import RetryPolicy
+from .voice_catalogue import VoiceCatalogue
+from .channel import get_channel
 from _exceptions.tts_engines.cloud.google_cloud import *
+import tracing
 
 import os
 
-from google.cloud import texttospeech
-from google.api_core.exceptions import GoogleAPICallError
-
 
 class TTSGoogleCloudClient(AbstractTTSClient, InterfaceTTSCloudClient):
     """
@@ -15,29 +17,73 @@ class TTSGoogleCloudClient(AbstractTTSClient, InterfaceTTSCloudClient):
         - Has structure like AbstractTTSClient.
         - Behaves like InterfaceTTSCloudClient.
         - Support SSML for source text.
+        - Splits text larger than request size limit into chunks synthesized concurrently.
+        - Synthesizes segments of large source file concurrently while file is read.
+        - Retries transient failures of synthesis within time budget, then reports failure for fallback.
+
+    Optional configuration fields:
+        - chunk_workers - max number of chunks (or large source file segments) synthesized concurrently.
+        - voice_catalogue - configuration of locally cached voice list (see VoiceCatalogue).
+        - channel - configuration of gRPC channel shared by clients of process (see GoogleChannel),
+          "warm_up": true additionally creates engine and warms channel up in background at startup
+          (first synthesis is faster, but google and grpc modules are imported at every startup).
+        - retry - deadlines and backoff of synthesis calls (see RetryPolicy),
+          "codes" lists retryable gRPC status codes.
     """
+    STR_NAME_ENGINE = 'google_cloud_tts'
+
     # required params to call Google Cloud TTS
     LIST_CALL_PARAMS_REQUIRED = ['language_code', 'name', 'speaking_rate', 'pitch', 'effects_profile_id']
     # required params to check network for Google Cloud TTS
     LIST_NETWORK_PARAMS_REQUIRED = ['test_ping_destination', 'test_download_destination']
 
+    # request limits
+    INT_SIZE_REQUEST_MAX = 5000         # max size of text or SSML input, bytes
+    INT_COUNT_WORKERS_CHUNKS = 4        # default number of chunks synthesized concurrently
+
+    FLOAT_TIMEOUT_LIST_VOICES = 5.0     # timeout of voice list request, seconds
+    # gRPC status codes of transient failures
+    LIST_CODES_RETRYABLE_DEFAULT = ['UNAVAILABLE', 'DEADLINE_EXCEEDED']
+
     # network connection limits
     FLOAT_LATENCY_MAX = 2000.0          # 2 seconds
     FLOAT_SPEED_DOWNLOAD_MIN = 40960    # 5 Kbytes/s * 1024 * 8 -> bits/sec
 
-    _client_tts = None                                          # Google Cloud TTS client
-    _speed_test = None  # instance of speed test validator
+    _channel = None             # gRPC channel with Google Cloud TTS client, shared by clients of process
+    _network_monitor = None     # background network health monitor (shared by clients with the same network params)
+    _voice_catalogue = None     # locally cached list of available voices
+    _retry_policy = None        # deadlines and backoff of synthesis calls
+    _list_codes_retryable = None    # gRPC status codes of transient failures
 
     def set_configuration(self, dict_config):
         """
         Overrides corresponding method of abstract parent class.
 
         Extends:
-            - Creates instance of TextToSpeechClient and sets it as _client_tts.
+            - Attaches to channel shared by Google Cloud TTS clients of process (see get_channel).
+            - Attaches to network monitor shared by clients with the same network params (see get_network_monitor).
+            - Starts background warm-up of channel if it is enabled.
         """
         self._str_path_output_dir = "./data/cloud/google_cloud/audio"
+        self._channel = get_channel(dict_config.get('channel'))     # voice validation already calls service
         super(TTSGoogleCloudClient, self).set_configuration(dict_config)
-        self._client_tts = texttospeech.TextToSpeechClient()
+        self._network_monitor = get_network_monitor(self._config_tts['network_params'])
+        dict_config_retry = self._config_tts.get('retry') or {}
+        self._retry_policy = RetryPolicy(dict_config_retry)
+        self._list_codes_retryable = [_str_code.upper() for _str_code in
+                                      dict_config_retry.get('codes', self.LIST_CODES_RETRYABLE_DEFAULT)]
+        if self._config_tts.get('channel', {}).get('warm_up', False):
+            self._channel.start_warm_up(self._config_tts['call_params']['language_code'])
+
+    def _get_client_tts(self):
+        """
+        Returns instance of TextToSpeechClient.
+
+        * Client and its channel are shared by Google Cloud TTS clients of process, see GoogleChannel.
+
+        :return: texttospeech.TextToSpeechClient - Google Cloud TTS client.
+        """
+        return self._channel.get_client()
 
     def _str_to_audioencoding(self, str_format_file_audio):
         """
@@ -46,6 +92,8 @@ class TTSGoogleCloudClient(AbstractTTSClient, InterfaceTTSCloudClient):
         :param str_format_file_audio: string - audio file format.
         :return: texttospeech.enums.AudioEncoding value.
         """
+        from google.cloud import texttospeech
+
         enum_audio_encoding = None
         if str_format_file_audio == 'mp3':
             enum_audio_encoding = texttospeech.enums.AudioEncoding.MP3
@@ -56,10 +104,88 @@ class TTSGoogleCloudClient(AbstractTTSClient, InterfaceTTSCloudClient):
         self.logger.debug("Convert result: '%s' to '%s'", str_format_file_audio, enum_audio_encoding)
         return enum_audio_encoding
 
+    def _fetch_voices(self):
+        """
+        Fetches list of available voices from Google Cloud TTS.
+
+        * Is called by voice catalogue only if catalogue is missing or expired.
+
+        :return: list - voice dictionaries (see VoiceCatalogue).
+        """
+        from google.cloud import texttospeech
+
+        dict_names_genders = dict((getattr(texttospeech.enums.SsmlVoiceGender, _str_name), _str_name)
+                                  for _str_name in dir(texttospeech.enums.SsmlVoiceGender) if _str_name.isupper())
+        response = self._get_client_tts().list_voices(retry=None, timeout=self.FLOAT_TIMEOUT_LIST_VOICES)
+        return [{'name': voice.name,
+                 'language_codes': list(voice.language_codes),
+                 'ssml_gender': dict_names_genders.get(voice.ssml_gender, str(voice.ssml_gender)),
+                 'natural_sample_rate_hertz': voice.natural_sample_rate_hertz} for voice in response.voices]
+
+    def get_voices(self, str_language_code=None, bool_refresh=False):
+        """
+        Implements corresponding method of interface parent class.
+
+        * Voices are read from local voice catalogue, service is called only if catalogue is missing or expired.
+        """
+        list_voices = self._voice_catalogue.get_voices(bool_refresh)
+        if list_voices is None:
+            return None
+        if str_language_code:
+            list_voices = [dict_voice for dict_voice in list_voices
+                           if str_language_code.lower() in [_str_code.lower() for _str_code in dict_voice['language_codes']]]
+        return sorted(list_voices, key=lambda dict_voice: dict_voice['name'])
+
+    def get_channel_stats(self):
+        """
+        Implements corresponding method of interface parent class.
+        """
+        return self._channel.get_stats()
+
+    def _get_language(self):
+        """
+        Implements corresponding method of abstract parent class.
+        """
+        return self._config_tts['call_params']['language_code']
+
+    def _get_params_cache(self):
+        """
+        Implements corresponding method of abstract parent class.
+
+        * All call params affect synthesized audio.
+        """
+        return self._config_tts['call_params']
+
     def synthesize_audio(self, source_text):
         """
         Implements corresponding method of interface parent class.
 
+        * Audio content is requested by synthesize_audio_content and written to file atomically.
+        * Large source file is synthesized segment by segment (see synthesize_audio_streamed),
+          "chunk_workers" segments are synthesized concurrently.
+        """
+        # generate output file path and name
+        str_path_file_audio = self.get_path_file_audio(source_text)
+        self.logger.debug("Speech will be written to %s.", str_path_file_audio)
+
+        if self.is_source_streamed(source_text):
+            return self.synthesize_audio_streamed(source_text, str_path_file_audio)
+
+        str_content_audio = self.synthesize_audio_content(source_text)
+        if str_content_audio is None:
+            return None
+
+        # write the response to the output file atomically
+        with tracing.span("file.write", size=len(str_content_audio)):
+            str_path_file_audio = self.write_audio_file(str_path_file_audio, str_content_audio)
+        if str_path_file_audio is not None:
+            self.logger.debug("Response is writen to file.")
+        return str_path_file_audio
+
+    def synthesize_audio_content(self, source_text):
+        """
+        Implements corresponding method of interface parent class.
+
         Google Cloud TTS input params:
             Logical params:
                 - language_code: language tag from BCP-47.
@@ -71,32 +197,70 @@ class TTSGoogleCloudClient(AbstractTTSClient, InterfaceTTSCloudClient):
                 - pitch: voice pitch value.
                 - effects_profile_id: audio effect profile.
                 * Description: https://cloud.google.com/text-to-speech/docs/reference/rpc/google.cloud.texttospeech.v1beta1#audioconfig
+
+        * Calls fail with deadline, transient failures are retried until time budget of request is exhausted,
+          then None is returned, so caller falls back to another TTS engine.
+        * Each chunk request has own time budget, so long text does not fail only because of number of chunks.
         """
         import urllib3
+        from google.api_core.exceptions import GoogleAPICallError
+        from text_processing import split_chunks, split_chunks_ssml
         urllib3.disable_warnings()
 
-        # generate output file path and name
-        str_path_file_audio = self.get_path_file_audio(source_text)
-
-        # creates audio file corresponding to source text
-        file_audio = open(str_path_file_audio, 'wb')
-        self.logger.debug("Speech will be written to %s.", str_path_file_audio)
-
-        if hasattr(source_text, 'read'):  # if source_text is represented as file
-            try:
-                source_text = source_text.read().strip()
-            except UnicodeDecodeError as e:      # if source text file is not text file
-                self.logger.error(msg=str(e), exc_info=True)
-                exit()
-            self.logger.debug("Source text is represented as file, read content.")
+        source_text = self.get_text(source_text)     # canonical text of string or file
 
         # check if source text is marked up with SSML
         bool_is_ssml = self._is_str_marked_up_ssml(source_text)
+        # split source text which is larger than request size limit, SSML chunks stay well-formed
+        if bool_is_ssml:
+            list_chunks = split_chunks_ssml(source_text, self.INT_SIZE_REQUEST_MAX)
+        else:
+            list_chunks = split_chunks(source_text, self.INT_SIZE_REQUEST_MAX)
+        list_chunks = list_chunks or [source_text]     # empty text is passed to service as is
+
+        try:
+            if len(list_chunks) == 1:
+                str_content_audio = self._synthesize_chunk(list_chunks[0], bool_is_ssml)
+            else:
+                str_content_audio = self._synthesize_chunks(list_chunks, bool_is_ssml)
+        except GoogleAPICallError as e:
+            self.logger.error(msg=str(e), exc_info=True)
+            return None
+
+        self.logger.debug("Response is gotten.")
+        return str_content_audio
+
+    def _is_error_retryable(self, e):
+        """
+        Checks whether failed call should be retried.
+
+        :param e: Exception - error of call.
+        :return: bool - True (transient failure), False (permanent failure).
+        """
+        from google.api_core.exceptions import GoogleAPICallError
+
+        code_status = getattr(e, 'grpc_status_code', None)
+        return isinstance(e, GoogleAPICallError) and code_status is not None and \
+            code_status.name in self._list_codes_retryable
+
+    def _synthesize_chunk(self, str_text, bool_is_ssml):
+        """
+        Performs single Google Cloud TTS request.
+            - Transient failures are retried within time budget of request started now (see RetryPolicy).
+
+        :raises:
+            * GoogleAPICallError - if request fails permanently or time budget is exhausted.
+        :param str_text: string - text or SSML not larger than INT_SIZE_REQUEST_MAX.
+        :param bool_is_ssml: bool - whether text is marked up with SSML.
+        :return: str - binary audio content.
+        """
+        from google.cloud import texttospeech
+
         # set the text input to be synthesized
         if bool_is_ssml:
-            synthesis_input = texttospeech.types.SynthesisInput(ssml=source_text)
+            synthesis_input = texttospeech.types.SynthesisInput(ssml=str_text)
         else:
-            synthesis_input = texttospeech.types.SynthesisInput(text=source_text)
+            synthesis_input = texttospeech.types.SynthesisInput(text=str_text)
 
         # select voice params
         voice = texttospeech.types.VoiceSelectionParams(
@@ -114,19 +278,62 @@ class TTSGoogleCloudClient(AbstractTTSClient, InterfaceTTSCloudClient):
 
         # perform the text-to-speech request on the text input with the selected voice parameters and audio file type
         # the response's audio_content is binary
-        try:
-            response = self._client_tts.synthesize_speech(synthesis_input, voice, audio_config)
-        except GoogleAPICallError as e:
-            self.logger.error(msg=str(e), exc_info=True)
-            exit()
+        # retries of client library are disabled, retry policy bounds them by time budget
+        def _synthesize(int_attempt, float_timeout):
+            with tracing.span("google.rpc", ssml=bool_is_ssml, attempt=int_attempt):
+                return self._get_client_tts().synthesize_speech(synthesis_input, voice, audio_config,
+                                                                retry=None, timeout=float_timeout)
 
-        self.logger.debug("Response is gotten.")
+        response = self._retry_policy.call(_synthesize, self._is_error_retryable)
+        return response.audio_content
 
-        # write the response to the output file
-        file_audio.write(response.audio_content)
-        self.logger.debug("Response is writen to file.")
+    def _synthesize_chunks(self, list_chunks, bool_is_ssml):
+        """
+        Synthesizes chunks concurrently and joins their audio contents in order.
+            - Number of concurrent requests is bounded by "chunk_workers" configuration field.
+            - Time budget of each chunk request starts when request is sent, not when chunk is queued.
 
-        return str_path_file_audio
+        :raises:
+            * GoogleAPICallError - if request of any chunk fails.
+        :param list_chunks: list - texts or SSML documents not larger than INT_SIZE_REQUEST_MAX in order.
+        :param bool_is_ssml: bool - whether chunks are marked up with SSML.
+        :return: str - binary audio content.
+        """
+        from multiprocessing.pool import ThreadPool
+        from google.api_core.exceptions import GoogleAPICallError
+        from tts_engines._audio import join_audio_contents
+
+        span_context = tracing.get_context()
+
+        def _synthesize(tuple_index_chunk):
+            _int_index, _str_chunk = tuple_index_chunk
+            with tracing.attach(span_context):
+                with tracing.span("google.chunk", index=_int_index, size=len(_str_chunk)):
+                    try:
+                        return self._synthesize_chunk(_str_chunk, bool_is_ssml)
+                    except GoogleAPICallError as e:     # is raised in caller thread
+                        return e
+
+        int_count_workers = min(len(list_chunks), self._get_count_workers_segments())
+        self.logger.info("Source text is split into %s chunks. Workers = %s.", len(list_chunks), int_count_workers)
+        pool = ThreadPool(int_count_workers)
+        try:
+            list_contents_audio = pool.map(_synthesize, enumerate(list_chunks))
+        finally:
+            pool.close()
+            pool.join()
+        for _content_audio in list_contents_audio:
+            if isinstance(_content_audio, GoogleAPICallError):
+                raise _content_audio
+        return join_audio_contents(list_contents_audio)
+
+    def _get_count_workers_segments(self):
+        """
+        Overrides corresponding method of abstract parent class.
+
+        * Segments are synthesized concurrently like chunks of large text, see "chunk_workers" configuration field.
+        """
+        return max(1, int(self._config_tts.get('chunk_workers', self.INT_COUNT_WORKERS_CHUNKS)))
 
     def synthesize_speech(self, source_text):
         """
@@ -175,6 +382,36 @@ class TTSGoogleCloudClient(AbstractTTSClient, InterfaceTTSCloudClient):
         self.logger.debug("Required call params are valid.")
         return True
 
+    def _validate_voice(self, dict_config):
+        """
+        Validates voice name and language code against voice catalogue.
+
+        * Voice catalogue is fetched on the first startup only, later startups make no network calls
+          while catalogue is fresh.
+        * Validation is skipped if voice catalogue is not available (e.g. first startup is offline).
+
+        :raises:
+            * VoiceNotFoundException - if voice is not available.
+            * VoiceLanguageNotSupportedException - if voice does not support language code.
+        :param dict_config: configuration of Google Cloud TTS.
+        :return: bool - true (valid) / false (invalid).
+        """
+        self._voice_catalogue = VoiceCatalogue(self._fetch_voices, dict_config.get('voice_catalogue'))
+        if self._voice_catalogue.get_voices() is None:
+            self.logger.warn("Voice catalogue is not available, voice validation is skipped.")
+            return True
+
+        str_name_voice = dict_config['call_params']['name']
+        str_language_code = dict_config['call_params']['language_code']
+        dict_voice = self._voice_catalogue.find_voice(str_name_voice)
+        if dict_voice is None:
+            raise VoiceNotFoundException(str_name_voice)
+        if str_language_code.lower() not in [_str_code.lower() for _str_code in dict_voice['language_codes']]:
+            raise VoiceLanguageNotSupportedException(str_name_voice, str_language_code, dict_voice['language_codes'])
+
+        self.logger.debug("Voice is valid.")
+        return True
+
     def _validate_network_params(self, dict_config):
         """
         Validates network params.
@@ -208,11 +445,13 @@ class TTSGoogleCloudClient(AbstractTTSClient, InterfaceTTSCloudClient):
             - Environment variable GOOGLE_APPLICATION_CREDENTIALS is set.
             - Call params are provided.
             - Network params are provided.
+            - Voice is available and supports language code (by local voice catalogue).
         """
         try:
             bool_result = self._validate_enviroment_variable(dict_config) and \
                    self._validate_call_params(dict_config) and \
-                   self._validate_network_params(dict_config)
+                   self._validate_network_params(dict_config) and \
+                   self._validate_voice(dict_config)
             if bool_result:
                 self.logger.info("Specific validation of configuration succeeds.")
             else:
@@ -230,30 +469,30 @@ class TTSGoogleCloudClient(AbstractTTSClient, InterfaceTTSCloudClient):
             - Raises exceptions if validation was failed.
         Checks:
             - Internet access.
-            - Download speed.
+            - Latency.
+            - Download speed (if download test is enabled in network params).
+        * Network state is read from background network monitor, so call does not block on network tests.
         :raises:
             * NetworkNotAccessibleException - if network connection is not set.
             * NetworkSpeedNotApplicableException - if network speed is too low.
         """
-        from pyspeedtest import SpeedTest, init_logging
-
-        if self._speed_test is None:
-            init_logging()
-            self._speed_test = SpeedTest(host=self._config_tts['network_params']['test_download_destination'], runs=2)
-
-        self.logger.debug("SpeedTest instance is ready.")
+        dict_state = self._network_monitor.get_state()
         try:
-            # returns latency in ms
-            float_latency = self._speed_test.ping(self._config_tts['network_params']['test_ping_destination'])
-            if float_latency > self.FLOAT_LATENCY_MAX:
+            if not dict_state['bool_reachable']:
                 raise NetworkNotAccessibleException()
-            self.logger.debug("Ping latency = %s, ms", float_latency)
 
-            # returns download speed in bits/sec
-            float_download_speed = self._speed_test.download()
-            if float_download_speed < self.FLOAT_SPEED_DOWNLOAD_MIN:
-                raise NetworkSpeedNotApplicableException()
-            self.logger.debug("Download speed = %s, bits/sec", float_download_speed)
+            # latency in ms
+            float_latency = dict_state['float_latency']
+            if float_latency > self.FLOAT_LATENCY_MAX:
+                raise NetworkNotAccessibleException()
+            self.logger.debug("Connect latency = %s, ms", float_latency)
+
+            # download speed in bits/sec
+            float_download_speed = dict_state['float_download_speed']
+            if float_download_speed is not None:
+                if float_download_speed < self.FLOAT_SPEED_DOWNLOAD_MIN:
+                    raise NetworkSpeedNotApplicableException()
+                self.logger.debug("Download speed = %s, bits/sec", float_download_speed)
         except TTSGoogleCloudException as e:  # connection to Internet is not established
             self.logger.warn("No access to Internet.")
             return False
@@ -0,0 +1,157 @@
+from base import LoggableInterface
+from threading import Lock
+import time
+import os
+
+
+class VoiceCatalogue(LoggableInterface):
+    """
+    Google Cloud TTS voice catalogue class.
+        - Keeps list of available voices in small JSON file with time to live.
+        - Voice list is fetched from service only if catalogue file is missing or expired,
+          so startup validation of voice makes no network calls while catalogue is fresh.
+        - Supports logging feature.
+
+    Voice dictionary keys:
+        - name - voice name (e.g. "en-GB-Wavenet-A").
+        - language_codes - list of BCP-47 language codes supported by voice.
+        - ssml_gender - voice gender (e.g. "FEMALE").
+        - natural_sample_rate_hertz - natural sample rate of voice.
+
+    * Expired catalogue is still used if voice list can not be fetched.
+    """
+    STR_PATH_FILE_CATALOGUE_DEFAULT = "./data/cloud/google_cloud/voices.json"
+    INT_TTL_DEFAULT = 604800            # 7 days in seconds
+
+    _str_path_file_catalogue = None     # catalogue file
+    _int_ttl = None                     # time while catalogue is considered fresh, seconds
+    _fetch_voices = None                # callable that fetches voice list from service
+    _list_voices = None                 # voices (None - catalogue is not loaded yet)
+    _float_time_fetched = None          # time voice list was fetched, seconds since epoch
+    _bool_is_fetched = False            # whether voice list is fetched by this instance
+    _lock = None                        # guards voices and catalogue file
+
+    def __init__(self, fetch_voices, dict_config=None):
+        """
+        Constructs instance of VoiceCatalogue class.
+
+        Configuration dictionary keys (all are optional):
+            - path - path to catalogue file.
+            - ttl - time while catalogue is considered fresh, seconds.
+
+        :param fetch_voices: callable - takes no arguments, returns list of voice dictionaries (makes network call).
+        :param dict_config: dict - catalogue configuration.
+        """
+        super(VoiceCatalogue, self).__init__(name=self.__class__.__name__)
+        if dict_config is None:
+            dict_config = {}
+        self._str_path_file_catalogue = os.path.abspath(dict_config.get('path', self.STR_PATH_FILE_CATALOGUE_DEFAULT))
+        self._int_ttl = int(dict_config.get('ttl', self.INT_TTL_DEFAULT))
+        self._fetch_voices = fetch_voices
+        self._lock = Lock()
+
+    def _load(self):
+        """
+        Loads catalogue file.
+
+        * Missing or corrupted catalogue file is treated as empty catalogue.
+
+        :return: None (voices and fetch time will be set if file is valid).
+        """
+        import json
+
+        try:
+            with open(self._str_path_file_catalogue, 'r') as file_catalogue:
+                dict_catalogue = json.load(file_catalogue)
+            self._list_voices = list(dict_catalogue['voices'])
+            self._float_time_fetched = float(dict_catalogue['time_fetched'])
+            self.logger.debug("Voice catalogue is loaded. Voices = %s.", len(self._list_voices))
+        except (IOError, ValueError, KeyError, TypeError) as e:
+            self.logger.debug("Voice catalogue is not loaded: %s", e)
+
+    def _save(self):
+        """
+        Saves catalogue file atomically.
+
+        * Caller must hold the lock.
+
+        :return: None (catalogue file will be replaced).
+        """
+        import json
+
+        str_path_file_tmp = "%s.%s.tmp" % (self._str_path_file_catalogue, os.getpid())
+        try:
+            if not os.path.isdir(os.path.dirname(self._str_path_file_catalogue)):
+                os.makedirs(os.path.dirname(self._str_path_file_catalogue))
+            with open(str_path_file_tmp, 'w') as file_catalogue:
+                json.dump({'time_fetched': self._float_time_fetched, 'voices': self._list_voices},
+                          file_catalogue, indent=2, sort_keys=True)
+            os.rename(str_path_file_tmp, self._str_path_file_catalogue)
+        except (IOError, OSError) as e:
+            self.logger.warn("Voice catalogue is not saved: %s", e)
+
+    def is_fresh(self):
+        """
+        Checks whether voice list is fetched not earlier than time to live ago.
+
+        :return: bool - True (fresh), False (missing or expired).
+        """
+        return self._float_time_fetched is not None and time.time() - self._float_time_fetched <= self._int_ttl
+
+    def get_voices(self, bool_refresh=False):
+        """
+        Returns available voices.
+
+        * Voice list is fetched if catalogue is missing, expired or refresh is requested.
+
+        :param bool_refresh: bool - whether voice list is fetched regardless of catalogue freshness.
+        :return: list - voice dictionaries (None if catalogue is missing and voice list can not be fetched).
+        """
+        with self._lock:
+            if self._list_voices is None:
+                self._load()
+            if bool_refresh or not self.is_fresh():
+                try:
+                    _float_time_start = time.time()
+                    self._list_voices = self._fetch_voices()
+                    self._float_time_fetched = time.time()
+                    self._bool_is_fetched = True
+                    self.logger.info("Voice list is fetched in %.3f seconds. Voices = %s.",
+                                     self._float_time_fetched - _float_time_start, len(self._list_voices))
+                    self._save()
+                except Exception as e:      # any failure of service or transport
+                    if self._list_voices is None:
+                        self.logger.warn("Voice list is not fetched: %s", e)
+                    else:
+                        self.logger.warn("Voice list is not fetched, expired catalogue is used: %s", e)
+            return self._list_voices
+
+    def find_voice(self, str_name_voice, bool_refresh_missing=True):
+        """
+        Returns voice by name.
+
+        * Voice absent in catalogue loaded from file is looked up in freshly fetched voice list,
+          since service may add voices during catalogue time to live.
+
+        :param str_name_voice: string - voice name.
+        :param bool_refresh_missing: bool - whether voice list is fetched if voice is absent in loaded catalogue.
+        :return: dict - voice (None if voice is not found or catalogue is not available).
+        """
+        dict_voice = self._get_voice(self.get_voices(), str_name_voice)
+        if dict_voice is None and bool_refresh_missing and not self._bool_is_fetched:
+            self.logger.debug("Voice %s is absent in catalogue, voice list is fetched.", str_name_voice)
+            dict_voice = self._get_voice(self.get_voices(bool_refresh=True), str_name_voice)
+        return dict_voice
+
+    def _get_voice(self, list_voices, str_name_voice):
+        """
+        Returns voice by name from voice list.
+
+        :param list_voices: list - voice dictionaries (None - catalogue is not available).
+        :param str_name_voice: string - voice name.
+        :return: dict - voice (None if voice is not found).
+        """
+        for dict_voice in list_voices or []:
+            if dict_voice.get('name') == str_name_voice:
+                return dict_voice
+        return None
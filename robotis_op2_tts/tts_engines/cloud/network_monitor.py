@@ -0,0 +1,206 @@
+from base import LoggableInterface
+from threading import Thread, Event, Lock
+import time
+
+
+class NetworkMonitor(LoggableInterface):
+    """
+    Network health monitor class.
+        - Probes network in background thread on interval.
+        - Keeps cached network state, so cloud TTS clients read it without blocking.
+        - Supports logging feature.
+
+    Network state dictionary keys:
+        - bool_reachable - whether probe destination accepts TCP connection.
+        - float_latency - TCP connect time, ms (None if not reachable).
+        - float_download_speed - download speed, bits/sec (None if download test is disabled or failed).
+        - float_time_checked - time of last probe, seconds since epoch.
+
+    * Probe is a TCP connect to ping destination, full download test is optional.
+    * Monitor is shared by cloud TTS clients of process with the same network params (see get_network_monitor).
+    """
+    INT_PROBE_PORT_DEFAULT = 443
+    FLOAT_PROBE_INTERVAL_DEFAULT = 10.0     # seconds
+    FLOAT_PROBE_TTL_DEFAULT = 30.0          # seconds
+    FLOAT_PROBE_TIMEOUT_DEFAULT = 2.0       # seconds
+
+    _str_host_ping = None           # TCP probe destination
+    _str_host_download = None       # download test destination
+    _int_port = None                # TCP probe port
+    _float_interval = None          # interval between probes, seconds
+    _float_ttl = None               # time while probe result is considered fresh, seconds
+    _float_timeout = None           # TCP connect timeout, seconds
+    _bool_test_download = False     # whether download test is performed
+    _speed_test = None              # instance of speed test validator
+
+    _dict_state = None              # last network state
+    _lock = None                    # guards network state
+    _event_stop = None              # signals monitor thread to stop
+    _thread = None                  # monitor thread
+
+    def __init__(self, dict_network_params):
+        """
+        Constructs instance of NetworkMonitor class.
+
+        Network params dictionary keys:
+            - test_ping_destination - host to probe with TCP connect.
+            - test_download_destination - host to test download speed.
+            - probe_port - TCP probe port (optional).
+            - probe_interval - interval between probes, seconds (optional).
+            - probe_ttl - time while probe result is considered fresh, seconds (optional).
+            - probe_timeout - TCP connect timeout, seconds (optional).
+            - test_download - whether full download test is performed, bool (optional).
+
+        :param dict_network_params: dict - network params of cloud TTS client.
+        """
+        super(NetworkMonitor, self).__init__(name=self.__class__.__name__)
+        self._str_host_ping = str(dict_network_params['test_ping_destination'])
+        self._str_host_download = str(dict_network_params['test_download_destination'])
+        self._int_port = int(dict_network_params.get('probe_port', self.INT_PROBE_PORT_DEFAULT))
+        self._float_interval = float(dict_network_params.get('probe_interval', self.FLOAT_PROBE_INTERVAL_DEFAULT))
+        self._float_ttl = float(dict_network_params.get('probe_ttl', self.FLOAT_PROBE_TTL_DEFAULT))
+        self._float_timeout = float(dict_network_params.get('probe_timeout', self.FLOAT_PROBE_TIMEOUT_DEFAULT))
+        self._bool_test_download = bool(dict_network_params.get('test_download', False))
+        self._lock = Lock()
+        self._event_stop = Event()
+
+    def start(self):
+        """
+        Starts background monitor thread.
+
+        :return: None (thread will be started).
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._event_stop.clear()
+        self._thread = Thread(target=self._run, name=self.__class__.__name__)
+        self._thread.daemon = True
+        self._thread.start()
+        self.logger.debug("Network monitor is started.")
+
+    def stop(self, float_timeout=None):
+        """
+        Stops background monitor thread.
+
+        :param float_timeout: float - max time to wait until thread is finished, seconds (None - do not wait).
+        :return: None (thread will be stopped after current probe).
+        """
+        self._event_stop.set()
+        if float_timeout is not None and self._thread is not None:
+            self._thread.join(float_timeout)
+        self.logger.debug("Network monitor is stopped.")
+
+    def _run(self):
+        """
+        Monitor thread loop.
+
+        :return: None.
+        """
+        while not self._event_stop.is_set():
+            self.probe()
+            self._event_stop.wait(self._float_interval)
+
+    def probe(self):
+        """
+        Probes network and updates cached network state.
+
+        :return: dict - new network state.
+        """
+        import socket
+
+        float_latency = None
+        float_download_speed = None
+        _float_time_start = time.time()
+        try:
+            _socket = socket.create_connection((self._str_host_ping, self._int_port), self._float_timeout)
+            _socket.close()
+            float_latency = (time.time() - _float_time_start) * 1000.0
+            bool_reachable = True
+        except (socket.error, socket.timeout) as e:
+            self.logger.debug("TCP probe of %s fails: %s", self._str_host_ping, e)
+            bool_reachable = False
+
+        if bool_reachable and self._bool_test_download:
+            float_download_speed = self._test_download()
+
+        dict_state = {
+            'bool_reachable': bool_reachable,
+            'float_latency': float_latency,
+            'float_download_speed': float_download_speed,
+            'float_time_checked': time.time()
+        }
+        with self._lock:
+            self._dict_state = dict_state
+        self.logger.debug("Network state = %s", dict_state)
+        return dict_state
+
+    def _test_download(self):
+        """
+        Performs full download speed test.
+
+        :return: float - download speed, bits/sec (None if test fails).
+        """
+        from pyspeedtest import SpeedTest, init_logging
+
+        if self._speed_test is None:
+            init_logging()
+            self._speed_test = SpeedTest(host=self._str_host_download, runs=2)
+        try:
+            return self._speed_test.download()
+        except Exception as e:
+            self.logger.debug("Download test fails: %s", e)
+            return None
+
+    def get_state(self):
+        """
+        Returns cached network state.
+
+        * If there is no fresh state (monitor has not probed yet or is stuck) then single TCP probe is performed,
+          so call is bounded by probe timeout.
+
+        :return: dict - network state.
+        """
+        with self._lock:
+            dict_state = self._dict_state
+        if dict_state is None or time.time() - dict_state['float_time_checked'] > self._float_ttl:
+            self.logger.debug("There is no fresh network state, it probes network now.")
+            dict_state = self.probe()
+        return dict_state
+
+
+_dict_monitors = {}         # network monitors shared by cloud TTS clients, by network params
+_lock_monitors = Lock()
+
+
+def _stop_network_monitors():
+    """
+    Stops all shared network monitors, so their threads do not run while interpreter shuts down.
+
+    :return: None.
+    """
+    with _lock_monitors:
+        list_monitors = list(_dict_monitors.values())
+    for _monitor in list_monitors:
+        _monitor.stop(_monitor._float_timeout + 1.0)
+
+
+def get_network_monitor(dict_network_params):
+    """
+    Returns started network monitor shared by cloud TTS clients with the same network params.
+
+    * Monitors are stopped at interpreter exit.
+
+    :param dict_network_params: dict - network params of cloud TTS client (see NetworkMonitor).
+    :return: NetworkMonitor - monitor instance.
+    """
+    import atexit
+    import json
+
+    str_key = json.dumps(dict_network_params, sort_keys=True)
+    with _lock_monitors:
+        if not _dict_monitors:
+            atexit.register(_stop_network_monitors)
+        if str_key not in _dict_monitors:
+            _dict_monitors[str_key] = NetworkMonitor(dict_network_params)
+            _dict_monitors[str_key].start()
+        return _dict_monitors[str_key]
@@ -0,0 +1,93 @@
+from base import LoggableInterface
+import random
+import time
+
+
+class RetryPolicy(LoggableInterface):
+    """
+    Retry policy class of cloud TTS calls.
+        - Bounds every attempt by per-call deadline.
+        - Retries failed attempt after jittered exponential backoff if failure is retryable.
+        - Bounds all attempts and backoff delays of one request by total time budget,
+          so caller falls back to another TTS engine within bounded time.
+        - Supports logging feature.
+
+    * Backoff delay is random value between zero and exponentially growing limit ("full jitter"),
+      so clients failed at the same time do not retry at the same time.
+    """
+    FLOAT_DEADLINE_DEFAULT = 5.0            # deadline of single attempt, seconds
+    FLOAT_BUDGET_DEFAULT = 10.0             # total time of request with retries, seconds
+    FLOAT_DELAY_INITIAL_DEFAULT = 0.2       # limit of first backoff delay, seconds
+    FLOAT_DELAY_MAX_DEFAULT = 2.0           # max limit of backoff delay, seconds
+    FLOAT_MULTIPLIER_DEFAULT = 2.0          # growth of backoff delay limit per attempt
+    FLOAT_TIMEOUT_MIN = 0.05                # attempt is not started if less time is left, seconds
+
+    _float_deadline = None          # deadline of single attempt, seconds
+    _float_budget = None            # total time of request with retries, seconds
+    _float_delay_initial = None     # limit of first backoff delay, seconds
+    _float_delay_max = None         # max limit of backoff delay, seconds
+    _float_multiplier = None        # growth of backoff delay limit per attempt
+
+    def __init__(self, dict_config=None):
+        """
+        Constructs instance of RetryPolicy class.
+
+        Configuration dictionary keys (all are optional):
+            - deadline - deadline of single attempt, seconds.
+            - budget - total time of request with retries, seconds.
+            - initial_delay - limit of first backoff delay, seconds.
+            - max_delay - max limit of backoff delay, seconds.
+            - multiplier - growth of backoff delay limit per attempt.
+
+        :param dict_config: dict - retry configuration.
+        """
+        super(RetryPolicy, self).__init__(name=self.__class__.__name__)
+        if dict_config is None:
+            dict_config = {}
+        self._float_deadline = float(dict_config.get('deadline', self.FLOAT_DEADLINE_DEFAULT))
+        self._float_budget = float(dict_config.get('budget', self.FLOAT_BUDGET_DEFAULT))
+        self._float_delay_initial = float(dict_config.get('initial_delay', self.FLOAT_DELAY_INITIAL_DEFAULT))
+        self._float_delay_max = float(dict_config.get('max_delay', self.FLOAT_DELAY_MAX_DEFAULT))
+        self._float_multiplier = float(dict_config.get('multiplier', self.FLOAT_MULTIPLIER_DEFAULT))
+
+    def get_time_end(self):
+        """
+        Returns end of total time budget of request started now.
+            - May be passed to several calls which should share one budget.
+
+        :return: float - seconds since epoch.
+        """
+        return time.time() + self._float_budget
+
+    def call(self, function, is_retryable, float_time_end=None):
+        """
+        Calls function until it succeeds, fails with not retryable error or time budget is exhausted.
+
+        :raises:
+            * Exception - last error of function if it is not retryable or time budget is exhausted.
+        :param function: callable - takes int attempt number and float timeout of attempt (seconds),
+            returns result of call.
+        :param is_retryable: callable - takes error, returns bool whether call should be retried.
+        :param float_time_end: float - end of time budget, seconds since epoch (None - budget starts now).
+        :return: result of function.
+        """
+        if float_time_end is None:
+            float_time_end = self.get_time_end()
+
+        int_attempt = 0
+        float_delay_limit = self._float_delay_initial
+        while True:
+            int_attempt += 1
+            float_timeout = min(self._float_deadline, float_time_end - time.time())
+            try:
+                return function(int_attempt, max(float_timeout, self.FLOAT_TIMEOUT_MIN))
+            except Exception as e:      # failure is classified by predicate of caller
+                if not is_retryable(e):
+                    raise
+                float_delay = random.uniform(0.0, float_delay_limit)
+                if time.time() + float_delay + self.FLOAT_TIMEOUT_MIN >= float_time_end:
+                    self.logger.warn("Retry budget is exhausted after %s attempts: %s", int_attempt, e)
+                    raise
+                self.logger.warn("Attempt %s fails, it is retried in %.3f seconds: %s", int_attempt, float_delay, e)
+                time.sleep(float_delay)
+                float_delay_limit = min(float_delay_limit * self._float_multiplier, self._float_delay_max)
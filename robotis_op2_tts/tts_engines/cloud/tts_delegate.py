@@ -1,7 +1,7 @@
 from tts_engines._base import AbstractTTSClientDelegate
 from ._base import InterfaceTTSCloudClient
 from .google_cloud.tts_client import TTSGoogleCloudClient
-import subprocess
+import tracing
 
 
 class TTSCloudClientDelegate(AbstractTTSClientDelegate, InterfaceTTSCloudClient):
@@ -12,6 +12,8 @@ class TTSCloudClientDelegate(AbstractTTSClientDelegate, InterfaceTTSCloudClient)
         - Has structure like AbstractTTSClientDelegate.
         - Behaves like InterfaceTTSCloudClient.
     """
+    INT_COUNT_WORKERS_BATCH = 8     # cloud synthesis mostly waits for network
+
     def set_configuration(self, dict_config):
         """
         Overrides corresponding method of abstract parent class.
@@ -25,6 +27,8 @@ class TTSCloudClientDelegate(AbstractTTSClientDelegate, InterfaceTTSCloudClient)
             if str_name_tts == 'google_cloud_tts':
                 dict_config_tts_copy = dict_config_tts.copy()
                 dict_config_tts_copy['audio_file_format'] = self._config_tts['audio_file_format']
+                dict_config_tts_copy['cache'] = self._config_tts.get('cache')
+                dict_config_tts_copy['text_normalization'] = self._config_tts.get('text_normalization')
                 self._client_tts = TTSGoogleCloudClient(dict_config_tts_copy)
             elif False:
                 pass        # fill for another cloud tts engines
@@ -32,6 +36,8 @@ class TTSCloudClientDelegate(AbstractTTSClientDelegate, InterfaceTTSCloudClient)
                 continue    # skip information not about TTS clients
 
         self._config_tts.pop('audio_file_format', None)  # to not to duplicate data
+        self._config_tts.pop('cache', None)
+        self._config_tts.pop('text_normalization', None)
 
     def synthesize_audio(self, source_text):
         """
@@ -44,7 +50,9 @@ class TTSCloudClientDelegate(AbstractTTSClientDelegate, InterfaceTTSCloudClient)
             self.logger.info("Audio file with synthesized speech already exists. Get it %s.", _str_path_file_audio)
             return _str_path_file_audio
         else:
-            if self.validate_network():
+            with tracing.span("network.validate"):
+                bool_is_network_valid = self.validate_network()
+            if bool_is_network_valid:
                 self.logger.info("Speech synthesis starts. Please, wait.")
                 self.logger.debug("It redirects call to %s.", self._client_tts)
                 str_file_audio = self._client_tts.synthesize_audio(source_text)
@@ -52,10 +60,35 @@ class TTSCloudClientDelegate(AbstractTTSClientDelegate, InterfaceTTSCloudClient)
             else:
                 return None
 
+    def synthesize_audio_content(self, source_text):
+        """
+        Overrides corresponding method of abstract parent class.
+
+        Extends:
+            - Network is validated before synthesis.
+        """
+        if not self.validate_network():
+            return None
+        return super(TTSCloudClientDelegate, self).synthesize_audio_content(source_text)
+
     def synthesize_speech(self, source_text):
         """
         Implements corresponding method of interface parent class.
+
+        * If speech pipeline is enabled then text is spoken sentence by sentence.
+        * Large source file is spoken segment by segment while it is read.
+        * If in-memory audio mode is enabled then not cached audio is streamed to audio player.
         """
+        from text_processing import read_source_text, split_sentences
+
+        if self._client_tts.is_source_streamed(source_text):    # large file is spoken while it is read
+            return self._synthesize_speech_streamed(source_text)
+        if self._is_speech_pipeline_enabled():
+            list_sentences = split_sentences(read_source_text(source_text))
+            if len(list_sentences) > 1:
+                return self._synthesize_speech_pipelined(list_sentences)
+            source_text = " ".join(list_sentences)
+
         str_path_file_audio = self._client_tts.get_path_file_audio(source_text)
 
         # check if audio file is already synthesized
@@ -65,24 +98,16 @@ class TTSCloudClientDelegate(AbstractTTSClientDelegate, InterfaceTTSCloudClient)
             if self.validate_network():
                 self.logger.info("Speech synthesis starts. Please, wait.")
                 self.logger.debug("It redirects call to %s.", self._client_tts)
+                if self._is_audio_in_memory_enabled():
+                    return self._synthesize_speech_in_memory(source_text)
                 str_path_file_audio = self._client_tts.synthesize_audio(source_text)
             else:
                 return False
 
         if str_path_file_audio:
-            str_command_play_audio = self._str_command_play_audio.replace("{file}", str_path_file_audio)
-            self.logger.debug("It calls audio player to play audio.")
-
-            try:
-                str_output_command_play_audio = subprocess.check_output(str_command_play_audio.split(' '),
-                                                                        stderr=subprocess.STDOUT).decode('utf-8')
-                self.logger.debug("\n" + str_output_command_play_audio)
-            except subprocess.CalledProcessError as e:
-                self.logger.error(msg=str(e), exc_info=True)
-                exit()
+            return self._play_audio_file(str_path_file_audio)
         else:
             return False
-        return True
 
     def validate_configuration(self, dict_config):
         """
@@ -109,3 +134,17 @@ class TTSCloudClientDelegate(AbstractTTSClientDelegate, InterfaceTTSCloudClient)
         else:
             self.logger.info("Network configuration is not applicable.")
         return bool_result
+
+    def get_voices(self, str_language_code=None, bool_refresh=False):
+        """
+        Implements corresponding method of interface parent class.
+        """
+        self.logger.debug("It redirects call to %s", self._client_tts)
+        return self._client_tts.get_voices(str_language_code, bool_refresh)
+
+    def get_channel_stats(self):
+        """
+        Implements corresponding method of interface parent class.
+        """
+        self.logger.debug("It redirects call to %s", self._client_tts)
+        return self._client_tts.get_channel_stats()
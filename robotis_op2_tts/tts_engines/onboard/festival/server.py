@@ -0,0 +1,265 @@
+from base import LoggableInterface
+from _exceptions.tts_engines.onboard.festival import FestivalServerException
+from threading import Lock
+import socket
+import time
+
+
+class FestivalServer(LoggableInterface):
+    """
+    Festival TTS server class.
+        - Starts single `festival --server` process and keeps connection to it.
+        - Loads voice once when connection is opened.
+        - Sends utterances over Festival socket protocol and fetches waveforms back.
+        - Restarts server if it dies or does not reply in time.
+        - Supports logging feature.
+
+    Festival server protocol:
+        - client sends s-expressions;
+        - server replies with sequence of chunks:
+            WV\\n<waveform>ft_StUfF_key - waveform sent to client;
+            LP\\n<s-expression>ft_StUfF_key - result of evaluation;
+            OK\\n - request is processed;
+            ER\\n - request failed.
+        * Details: http://www.cstr.ed.ac.uk/projects/festival/manual/festival_28.html
+
+    * Instance is safe to use from several threads, requests are serialized.
+    """
+    STR_KEY_END = "ft_StUfF_key"            # end of WV/LP chunk
+    STR_HOST_DEFAULT = "localhost"
+    INT_PORT_DEFAULT = 1314
+    FLOAT_STARTUP_TIMEOUT_DEFAULT = 30.0    # seconds
+    FLOAT_TIMEOUT_DEFAULT = 60.0            # max time of socket operation, seconds (SayText replies after speech)
+
+    _str_command = None             # command to start server
+    _str_host = None                # server host
+    _int_port = None                # server port
+    _float_startup_timeout = None   # max time to wait server start, seconds
+    _float_timeout = None           # max time of socket operation, seconds
+    _str_expression = None          # s-expression to evaluate when connection is opened (e.g. voice selection)
+
+    _process = None                 # server process
+    _file_null = None               # null device server output is redirected to
+    _socket = None                  # connection to server
+    _str_buffer = ""                # received but not processed data
+    _lock = None                    # serializes requests
+
+    def __init__(self, dict_config, str_call_params, str_expression):
+        """
+        Constructs instance of FestivalServer class.
+
+        Server configuration dictionary keys:
+            - command - command to start server. Mark place were call params should be passed as "{call_params}".
+            - host - server host (optional).
+            - port - server port (optional).
+            - startup_timeout - max time to wait server start, seconds (optional).
+            - timeout - max time of socket operation (e.g. waiting for reply), seconds (optional).
+
+        :param dict_config: dict - Festival server configuration.
+        :param str_call_params: string - Festival call params (e.g. language).
+        :param str_expression: string - s-expression to evaluate when connection is opened.
+        """
+        super(FestivalServer, self).__init__(name=self.__class__.__name__)
+        self._str_command = dict_config['command'].encode('ascii', 'ignore').replace("{call_params}", str_call_params)
+        self._str_host = str(dict_config.get('host', self.STR_HOST_DEFAULT))
+        self._int_port = int(dict_config.get('port', self.INT_PORT_DEFAULT))
+        self._float_startup_timeout = float(dict_config.get('startup_timeout', self.FLOAT_STARTUP_TIMEOUT_DEFAULT))
+        self._float_timeout = float(dict_config.get('timeout', self.FLOAT_TIMEOUT_DEFAULT))
+        self._str_expression = str_expression
+        self._lock = Lock()
+
+    def start(self):
+        """
+        Starts server process and opens connection to it.
+            - Server is not started if another one already listens to configured port.
+
+        :raises:
+            * FestivalServerException - if server is not started in time.
+        :return: None (server will be ready to synthesize).
+        """
+        import subprocess
+        import shlex
+        import os
+
+        self.stop()
+        if not self._is_listening():
+            self._file_null = open(os.devnull, 'w')
+            self._process = subprocess.Popen(shlex.split(self._str_command),
+                                             stdout=self._file_null, stderr=subprocess.STDOUT)
+            self.logger.debug("Festival server process is started. PID = %s", self._process.pid)
+
+        _float_time_deadline = time.time() + self._float_startup_timeout
+        while not self._is_listening():
+            if self._process is not None and self._process.poll() is not None:
+                raise FestivalServerException("server process exited with code %s" % self._process.returncode)
+            if time.time() > _float_time_deadline:
+                raise FestivalServerException("server is not started in %s seconds" % self._float_startup_timeout)
+            time.sleep(0.1)
+
+        self._socket = socket.create_connection((self._str_host, self._int_port), self._float_timeout)
+        self._str_buffer = ""
+        if self._str_expression:
+            self._request(self._str_expression)     # voice is loaded once per connection
+        self.logger.info("Festival server is ready at %s:%s.", self._str_host, self._int_port)
+
+    def stop(self):
+        """
+        Closes connection and stops server process.
+
+        :return: None (server will be stopped).
+        """
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except socket.error:
+                pass
+            self._socket = None
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.terminate()
+                self._process.wait()
+            self._process = None
+        if self._file_null is not None:
+            self._file_null.close()
+            self._file_null = None
+
+    def _is_listening(self):
+        """
+        Checks whether server accepts connections.
+
+        :return: bool - True (accepts), False (does not accept).
+        """
+        try:
+            socket.create_connection((self._str_host, self._int_port), 1.0).close()
+            return True
+        except socket.error:
+            return False
+
+    def _is_alive(self):
+        """
+        Checks whether server process is alive and connection is opened.
+
+        :return: bool - True (alive), False (dead).
+        """
+        if self._socket is None:
+            return False
+        if self._process is not None and self._process.poll() is not None:
+            return False
+        return True
+
+    def _receive(self):
+        """
+        Receives next portion of data from server.
+
+        :raises:
+            * socket.error - if connection is closed by server.
+            * socket.timeout - if server does not send data in time.
+        :return: None (data will be appended to buffer).
+        """
+        _str_data = self._socket.recv(65536)
+        if not _str_data:
+            raise socket.error("connection is closed by server")
+        self._str_buffer += _str_data
+
+    def _read_header(self):
+        """
+        Reads reply chunk header.
+
+        :return: str - chunk header (WV, LP, OK or ER).
+        """
+        while len(self._str_buffer) < 3:
+            self._receive()
+        str_header = self._str_buffer[:2]
+        self._str_buffer = self._str_buffer[3:]
+        return str_header
+
+    def _read_chunk(self):
+        """
+        Reads reply chunk data until end key.
+
+        :return: str - chunk data.
+        """
+        while self.STR_KEY_END not in self._str_buffer:
+            self._receive()
+        str_data, self._str_buffer = self._str_buffer.split(self.STR_KEY_END, 1)
+        return str_data
+
+    def _request(self, str_expression):
+        """
+        Sends s-expression and reads reply.
+
+        * Caller must hold the lock.
+
+        :raises:
+            * FestivalServerException - if server fails to evaluate s-expression.
+        :param str_expression: string - s-expression to evaluate.
+        :return: list - waveforms sent by server.
+        """
+        self._socket.sendall(str_expression + "\n")
+        list_waveforms = []
+        while True:
+            _str_header = self._read_header()
+            if _str_header == "WV":
+                list_waveforms.append(self._read_chunk())
+            elif _str_header == "LP":
+                self._read_chunk()
+            elif _str_header == "OK":
+                return list_waveforms
+            elif _str_header == "ER":
+                raise FestivalServerException("evaluation of %s fails" % str_expression)
+            else:
+                raise FestivalServerException("unknown reply %r" % _str_header)
+
+    def _request_with_restart(self, str_expression):
+        """
+        Sends s-expression, restarts server and repeats request once if server has died or hung.
+
+        * Timed out request is treated as lost connection (socket.timeout is socket.error).
+
+        :param str_expression: string - s-expression to evaluate.
+        :return: list - waveforms sent by server.
+        """
+        with self._lock:
+            if not self._is_alive():
+                self.logger.warn("Festival server is not alive. It restarts server.")
+                self.start()
+            try:
+                return self._request(str_expression)
+            except socket.error as e:     # including socket.timeout
+                self.logger.warn("Festival server connection is lost or times out (%s). It restarts server.", e)
+                self.start()
+                return self._request(str_expression)
+
+    def _escape(self, str_text):
+        """
+        Escapes text to be passed as s-expression string.
+
+        :param str_text: string - text.
+        :return: str - escaped text.
+        """
+        if isinstance(str_text, unicode):
+            str_text = str_text.encode('utf-8')
+        return str_text.replace("\\", "\\\\").replace("\"", "\\\"")
+
+    def synthesize_wave(self, str_text):
+        """
+        Synthesizes text and fetches waveform back.
+
+        :param str_text: string - text to synthesize.
+        :return: str - RIFF waveform data.
+        """
+        list_waveforms = self._request_with_restart(
+            "(begin (Parameter.set 'Wavefiletype 'riff) "
+            "(utt.send.wave.client (utt.synth (Utterance Text \"%s\"))))" % self._escape(str_text))
+        if not list_waveforms:
+            raise FestivalServerException("no waveform is sent")
+        return list_waveforms[0]
+
+    def say(self, str_text):
+        """
+        Speaks text by server audio output.
+
+        :param str_text: string - text to speak.
+        :return: None (speech will be played).
+        """
+        self._request_with_restart("(SayText \"%s\")" % self._escape(str_text))
@@ -1,6 +1,7 @@
 from tts_engines._base import AbstractTTSClient
 from .._base import InterfaceTTSOnboardClient
 from _exceptions.tts_engines.onboard.festival import *
+import tracing
 
 
 class TTSFestivalClient(AbstractTTSClient, InterfaceTTSOnboardClient):
@@ -9,7 +10,12 @@ class TTSFestivalClient(AbstractTTSClient, InterfaceTTSOnboardClient):
         - Festival TTS specification of InterfaceTTSOnboardClient.
         - Has structure like AbstractTTSClient.
         - Behaves like InterfaceTTSOnboardClient.
+
+    * If "server" section is provided in configuration then synthesis is performed by persistent Festival server
+      instead of spawning Festival process per call.
     """
+    STR_NAME_ENGINE = 'festival'
+
     # required params to play speech
     LIST_PLAY_SPEECH_CALL_PARAMS_REQUIRED = ['--language']
     # required params to save speech
@@ -17,6 +23,7 @@ class TTSFestivalClient(AbstractTTSClient, InterfaceTTSOnboardClient):
 
     _str_command_play_speech = None     # command to play speech in real time
     _str_command_save_speech = None     # command to save speech as file
+    _festival_server = None             # persistent Festival server (server mode only)
 
     def set_configuration(self, dict_config):
         """
@@ -42,54 +49,138 @@ class TTSFestivalClient(AbstractTTSClient, InterfaceTTSOnboardClient):
         self._str_command_save_speech = _str_command_save_speech\
             .replace("{expression}", str(self._config_tts['save']['expression']))
 
+        # start Festival server
+        if 'server' in self._config_tts:
+            from .server import FestivalServer
+
+            self._festival_server = FestivalServer(self._config_tts['server'],
+                                                   " ".join(_list_param_call),
+                                                   str(self._config_tts['save']['expression']).strip("'\""))
+            try:
+                self._festival_server.start()
+            except RobotisOP2TTSException as e:
+                self.logger.error(msg=str(e), exc_info=True)
+                exit()
+
+    def _get_language(self):
+        """
+        Implements corresponding method of abstract parent class.
+        """
+        return self._config_tts['play']['call_params'].get('--language')
+
+    def _escape_shell(self, str_text):
+        """
+        Escapes characters which are special inside double quotes of shell command.
+
+        * Canonical text contains ASCII quotes, they would break "echo \"{text}\"" command otherwise.
+
+        :param str_text: string - text to escape.
+        :return: str - escaped text.
+        """
+        for _str_character in ("\\", "\"", "$", "`"):
+            str_text = str_text.replace(_str_character, "\\" + _str_character)
+        return str_text
+
+    def _get_params_cache(self):
+        """
+        Implements corresponding method of abstract parent class.
+
+        * Play call params and save expression select language and voice.
+        """
+        return {
+            'play': self._config_tts['play']['call_params'],
+            'save': self._config_tts['save']['expression']
+        }
+
     def synthesize_audio(self, source_text):
         """
         Implements corresponding method of interface parent class.
 
+        * Large source file is synthesized segment by segment (see synthesize_audio_streamed).
+
         Festival TTS save command input params:
             - expression - file or lisp s-expression to be evaluated before synthesis.
                 * It is enough to set '(language_related_voice)'.
                 * Details: http://www.linuxcertif.com/man/1/text2wave/
         """
         import subprocess
+        from os import remove
 
         # generate output file path and name
-        str_path_file_audio = self._get_path_file_audio(source_text)
+        str_path_file_audio = self.get_path_file_audio(source_text)
 
         # check if audio file is already synthesized
-        if self._is_audio_file_exist(str_path_file_audio):
+        if self.is_audio_file_exist(str_path_file_audio):
             self.logger.info("Audio file with synthesized speech already exists. Get it %s.", str_path_file_audio)
             return str_path_file_audio
         else:
             self.logger.debug("Speech will be written to %s.", str_path_file_audio)
 
-            if hasattr(source_text, 'read'):     # if source_text is represented as file
-                try:
-                    source_text = source_text.read().strip()
-                except UnicodeDecodeError as e:         # if source text file is not text file
-                    self.logger.error(msg=str(e), exc_info=True)
-                    exit()
-                self.logger.debug("Source text is represented as file, read content.")
+            if self.is_source_streamed(source_text):
+                return self.synthesize_audio_streamed(source_text, str_path_file_audio)
+
+            source_text = self.get_text(source_text)     # canonical text of string or file
 
+            if self._festival_server is not None:
+                return self._synthesize_audio_server(source_text, str_path_file_audio)
+
+            _str_path_file_temp = self.get_path_file_audio_temp(str_path_file_audio)
             try:
-                _str_command_save_speech = self._str_command_save_speech.replace("{text}", source_text)
-                _str_command_save_speech = _str_command_save_speech.replace("{file}", str_path_file_audio)
-                _int_code_result = subprocess.check_call(
-                    _str_command_save_speech,
-                    stderr=subprocess.STDOUT,
-                    shell=True      # security hazard
-                )
+                _str_command_save_speech = self._str_command_save_speech.replace("{text}", self._escape_shell(source_text))
+                _str_command_save_speech = _str_command_save_speech.replace("{file}", _str_path_file_temp)
+                with tracing.span("festival.subprocess"):
+                    _int_code_result = subprocess.check_call(
+                        _str_command_save_speech,
+                        stderr=subprocess.STDOUT,
+                        shell=True      # security hazard
+                    )
             except subprocess.CalledProcessError as e:
                 self.logger.error(msg=str(e), exc_info=True)
+                remove(_str_path_file_temp)
                 exit()
 
-            if _int_code_result == 0:   # success
+            if _int_code_result == 0 and self.commit_audio_file(_str_path_file_temp, str_path_file_audio):   # success
                 self.logger.debug("Synthesized speech is written to file.")
                 return str_path_file_audio
             else:
                 self.logger.debug("Speech is not synthesized to file.")
                 return None
 
+    def synthesize_audio_content(self, source_text):
+        """
+        Implements corresponding method of interface parent class.
+
+        * Waveform is fetched from Festival server or read from stdout of save command ("{file}" is replaced by "-").
+        """
+        import subprocess
+
+        source_text = self.get_text(source_text)     # canonical text of string or file
+
+        if self._festival_server is not None:
+            try:
+                with tracing.span("festival.server"):
+                    return self._festival_server.synthesize_wave(source_text)
+            except RobotisOP2TTSException as e:
+                self.logger.error(msg=str(e), exc_info=True)
+                return None
+
+        try:
+            _str_command_save_speech = self._str_command_save_speech.replace("{text}", self._escape_shell(source_text))
+            _str_command_save_speech = _str_command_save_speech.replace("{file}", "-")
+            with tracing.span("festival.subprocess"):
+                str_content_audio = subprocess.check_output(_str_command_save_speech,
+                                                            shell=True)     # security hazard
+        except subprocess.CalledProcessError as e:
+            self.logger.error(msg=str(e), exc_info=True)
+            exit()
+
+        if str_content_audio:
+            self.logger.debug("Speech is synthesized to memory.")
+            return str_content_audio
+        else:
+            self.logger.debug("Speech is not synthesized to memory.")
+            return None
+
     def synthesize_speech(self, source_text):
         """
         Implements corresponding method of interface parent class.
@@ -98,20 +189,26 @@ class TTSFestivalClient(AbstractTTSClient, InterfaceTTSOnboardClient):
             - language - input text / output speech language.
                 * Festival TTS must support this language.
                 * Details: https://linux.die.net/man/1/festival
+
+        * Large source file is spoken segment by segment, so command line length does not depend on file size.
         """
         import subprocess
+        from text_processing import iter_segments
 
-        if hasattr(source_text, 'read'):  # if source_text is represented as file
-            try:
-                source_text = source_text.read().strip()
-            except UnicodeDecodeError as e:      # if source text file is not text file
-                self.logger.error(msg=str(e), exc_info=True)
-                exit()
-            self.logger.debug("Source text is represented as file, read content.")
+        if self.is_source_streamed(source_text):
+            for str_segment in iter_segments(source_text, self.INT_SIZE_SEGMENT_MAX):
+                if not self.synthesize_speech(str_segment):
+                    return False
+            return True
+
+        source_text = self.get_text(source_text)     # canonical text of string or file
+
+        if self._festival_server is not None:
+            return self._synthesize_speech_server(source_text)
 
         try:
             _int_code_result = subprocess.check_call(
-                self._str_command_play_speech.replace("{text}", source_text),
+                self._str_command_play_speech.replace("{text}", self._escape_shell(source_text)),
                 stderr=subprocess.STDOUT,
                 shell=True      # security hazard
             )
@@ -126,22 +223,68 @@ class TTSFestivalClient(AbstractTTSClient, InterfaceTTSOnboardClient):
             self.logger.debug("Speech is not synthesized.")
             return False
 
+    def _synthesize_audio_server(self, str_text, str_path_file_audio):
+        """
+        Synthesizes audio file by Festival server.
+
+        :param str_text: string - text to synthesize.
+        :param str_path_file_audio: string path to output audio file.
+        :return: str - path to synthesized file (None if synthesis fails).
+        """
+        try:
+            with tracing.span("festival.server"):
+                str_waveform = self._festival_server.synthesize_wave(str_text)
+        except RobotisOP2TTSException as e:
+            self.logger.error(msg=str(e), exc_info=True)
+            return None
+
+        with tracing.span("file.write", size=len(str_waveform)):
+            str_path_file_audio = self.write_audio_file(str_path_file_audio, str_waveform)
+        if str_path_file_audio is not None:
+            self.logger.debug("Synthesized speech is written to file.")
+        return str_path_file_audio
+
+    def _synthesize_speech_server(self, str_text):
+        """
+        Speaks text by Festival server.
+
+        :param str_text: string - text to synthesize.
+        :return: bool - indicator of succeeded synthesis.
+        """
+        try:
+            self._festival_server.say(str_text)
+        except RobotisOP2TTSException as e:
+            self.logger.error(msg=str(e), exc_info=True)
+            self.logger.debug("Speech is not synthesized.")
+            return False
+        self.logger.debug("Speech is synthesized.")
+        return True
+
     def _validate_availability(self, dict_config):
         """
         Validates Festival installation.
 
+        * Succeeded check is cached until PATH or Festival binary is changed.
+
         :raises:
             * FestivalNotInstalledException - if Festival is not installed.
         :param dict_config: Festival TTS configuration.
         :return: bool - true (valid), false (invalid).
         """
         import subprocess
+        from validation_cache import get_validation_cache, ValidationCache
 
+        validation_cache = get_validation_cache()
+        if validation_cache.lookup("festival:availability", {}):
+            self.logger.debug("Festival is available (cached).")
+            return True
         try:
-            _str_output = subprocess.check_output(["which", "festival"])
+            _str_output = subprocess.check_output(["which", "festival"]).strip()
             if len(_str_output) == 0:
                 raise FestivalNotAvailableException()
             self.logger.debug("Festival is available at %s.", _str_output)
+            validation_cache.store("festival:availability", {},
+                                   ValidationCache.get_paths_dirs_path() + [_str_output])
             return True
         except subprocess.CalledProcessError as e:
             self.logger.error(msg=str(e), exc_info=True)
@@ -154,19 +297,28 @@ class TTSFestivalClient(AbstractTTSClient, InterfaceTTSOnboardClient):
         Checks:
             - Festival language file is not empty.
                 * Location of language settings may vary between versions of Festival.
+        * Succeeded check is cached until language or language files are changed.
         :raises:
             * LanguageNotSupportedException - if Festival dose not support language.
         :param dict_config: Festival TTS configuration.
         :return: bool - true (valid), false (invalid).
         """
         from os import stat, listdir
+        from validation_cache import get_validation_cache
 
         try:
             _str_name_language = dict_config['play']['call_params']['--language']
+            validation_cache = get_validation_cache()
+            dict_params = {'language': _str_name_language}
+            if validation_cache.lookup("festival:language", dict_params):
+                self.logger.debug("%s language is supported (cached).", _str_name_language)
+                return True
+            _str_path_dir_share_festival_languages = '/usr/share/festival/languages/'
+            _str_path_file_share_festival_languages = '/usr/share/festival/languages.scm'
+            list_paths_files = [_str_path_dir_share_festival_languages, _str_path_file_share_festival_languages]
 
             # for current configuration of Festival
             try:
-                _str_path_dir_share_festival_languages = '/usr/share/festival/languages/'
                 for _str_name_file in listdir(_str_path_dir_share_festival_languages):
                     if _str_name_language in _str_name_file:        # check all files that corresponds to language
                         _str_path_file_language = _str_path_dir_share_festival_languages + _str_name_file
@@ -174,6 +326,8 @@ class TTSFestivalClient(AbstractTTSClient, InterfaceTTSOnboardClient):
                             self.logger.debug("%s language settings file = %s.",
                                               _str_name_language, _str_path_file_language)
                             self.logger.debug("%s language is supported.", _str_name_language)
+                            validation_cache.store("festival:language", dict_params,
+                                                   list_paths_files + [_str_path_file_language])
                             return True     # does not check other configurations if one exists
                         else:   # it is possible that language directory contains several configurations
                             pass
@@ -183,12 +337,12 @@ class TTSFestivalClient(AbstractTTSClient, InterfaceTTSOnboardClient):
             # for Robotis OP2 configuration of Festival
             import re
             try:
-                _str_path_file_share_festival_languages = '/usr/share/festival/languages.scm'
                 _str_keyword = r'\(?define \(language_\w*%s\)' % _str_name_language    # language definition line pattern
                 regex_language = re.compile(_str_keyword)
                 _file_languages = open(_str_path_file_share_festival_languages, 'r')
                 for _str_line in _file_languages:
                     if regex_language.match(_str_line):
+                        validation_cache.store("festival:language", dict_params, list_paths_files)
                         return True
                 _file_languages.close()
             except OSError as e:    # no languages file
@@ -11,6 +11,8 @@ class TTSOnboardClientDelegate(AbstractTTSClientDelegate, InterfaceTTSOnboardCli
         - Has structure like AbstractTTSClientDelegate.
         - Behaves like InterfaceTTSOnboardClient.
     """
+    INT_COUNT_WORKERS_BATCH = 1     # onboard synthesis is bound by robot CPU
+
     def set_configuration(self, dict_config):
         """
         Overrides corresponding method of abstract parent class.
@@ -24,6 +26,8 @@ class TTSOnboardClientDelegate(AbstractTTSClientDelegate, InterfaceTTSOnboardCli
             if str_name_tts == 'festival':
                 dict_config_tts_copy = dict_config_tts.copy()
                 dict_config_tts_copy['audio_file_format'] = self._config_tts['audio_file_format']
+                dict_config_tts_copy['cache'] = self._config_tts.get('cache')
+                dict_config_tts_copy['text_normalization'] = self._config_tts.get('text_normalization')
                 self._client_tts = TTSFestivalClient(dict_config_tts_copy)
             elif False:
                 pass  # fill for another onboard TTS clients
@@ -38,10 +42,35 @@ class TTSOnboardClientDelegate(AbstractTTSClientDelegate, InterfaceTTSOnboardCli
         self.logger.debug("It redirects call to %s.", self._client_tts)
         return self._client_tts.synthesize_audio(source_text)
 
+    def _get_count_workers_batch(self, max_workers):
+        """
+        Overrides corresponding method of abstract parent class.
+
+        * Onboard worker budget is not exceeded by requested max number of workers.
+        """
+        int_count_workers_budget = super(TTSOnboardClientDelegate, self)._get_count_workers_batch(None)
+        if max_workers is None:
+            return int_count_workers_budget
+        return max(1, min(int(max_workers), int_count_workers_budget))
+
     def synthesize_speech(self, source_text):
         """
         Implements corresponding method of interface parent class.
+
+        * If speech pipeline is enabled then text is spoken sentence by sentence.
+        * Large source file is spoken segment by segment while it is read.
+            - Audio files of sentences are played by audio player of onboard TTS configuration.
         """
+        from text_processing import read_source_text, split_sentences
+
+        if self._client_tts.is_source_streamed(source_text):    # large file is spoken while it is read
+            return self._synthesize_speech_streamed(source_text)
+        if self._is_speech_pipeline_enabled():
+            list_sentences = split_sentences(read_source_text(source_text))
+            if len(list_sentences) > 1:
+                return self._synthesize_speech_pipelined(list_sentences)
+            source_text = " ".join(list_sentences)
+
         self.logger.info("Speech synthesis starts. Please, wait.")
         self.logger.debug("It redirects call to %s.", self._client_tts)
         return self._client_tts.synthesize_speech(source_text)
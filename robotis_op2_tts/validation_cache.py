@@ -0,0 +1,164 @@
+from base import LoggableInterface
+from threading import Lock
+import os
+
+
+class ValidationCache(LoggableInterface):
+    """
+    Startup validation cache class.
+        - Persists succeeded validation results to small JSON file.
+        - Each result is keyed by validation name and guarded by environment fingerprint.
+        - Supports logging feature.
+
+    Environment fingerprint is a hash of:
+        - PATH environment variable;
+        - mtimes and sizes of files and directories the validation depends on
+          (e.g. PATH directories, found binary, language files);
+        - configuration params the validation depends on.
+
+    * Only succeeded validations are cached, failed ones stop the program anyway.
+    * Validation is repeated if any part of its fingerprint is changed, other validations stay cached.
+    """
+    STR_PATH_FILE_CACHE_DEFAULT = "./data/validation_cache.json"
+
+    _str_path_file_cache = None     # cache file
+    _dict_entries = None            # validation name -> {"files": [...], "fingerprint": "<value>"}
+    _lock = None                    # guards entries and cache file
+
+    def __init__(self, str_path_file_cache=STR_PATH_FILE_CACHE_DEFAULT):
+        """
+        Constructs instance of ValidationCache class.
+
+        :param str_path_file_cache: string path to cache file.
+        """
+        super(ValidationCache, self).__init__(name=self.__class__.__name__)
+        self._str_path_file_cache = os.path.abspath(str_path_file_cache)
+        self._lock = Lock()
+        self._dict_entries = self._load()
+
+    def _load(self):
+        """
+        Loads cache file.
+
+        * Missing or corrupted cache file is treated as empty cache.
+
+        :return: dict - cached entries.
+        """
+        import json
+
+        try:
+            with open(self._str_path_file_cache, 'r') as file_cache:
+                dict_entries = json.load(file_cache)
+            if isinstance(dict_entries, dict):
+                return dict_entries
+        except (IOError, ValueError) as e:
+            self.logger.debug("Validation cache is not loaded: %s", e)
+        return {}
+
+    def _save(self):
+        """
+        Saves cache file atomically.
+
+        * Caller must hold the lock.
+
+        :return: None (cache file will be replaced).
+        """
+        import json
+
+        str_path_file_tmp = "%s.%s.tmp" % (self._str_path_file_cache, os.getpid())
+        try:
+            if not os.path.isdir(os.path.dirname(self._str_path_file_cache)):
+                os.makedirs(os.path.dirname(self._str_path_file_cache))
+            with open(str_path_file_tmp, 'w') as file_cache:
+                json.dump(self._dict_entries, file_cache, indent=2, sort_keys=True)
+            os.rename(str_path_file_tmp, self._str_path_file_cache)
+        except (IOError, OSError) as e:
+            self.logger.warn("Validation cache is not saved: %s", e)
+
+    @staticmethod
+    def get_paths_dirs_path():
+        """
+        Returns directories of PATH environment variable.
+
+        * Mtime of directory changes when program is installed to or removed from it.
+
+        :return: list - directory paths.
+        """
+        return [_str_path_dir for _str_path_dir in os.environ.get('PATH', '').split(os.pathsep) if _str_path_dir]
+
+    def _get_fingerprint(self, list_paths_files, dict_params):
+        """
+        Returns environment fingerprint.
+
+        :param list_paths_files: list - paths of files and directories validation depends on.
+        :param dict_params: dict - configuration params validation depends on.
+        :return: str - hex digest of fingerprint.
+        """
+        import hashlib
+        import json
+
+        _hash = hashlib.sha1()
+        _hash.update(os.environ.get('PATH', ''))
+        _hash.update("\n")
+        _hash.update(json.dumps(dict_params, sort_keys=True))
+        for _str_path_file in list_paths_files:
+            try:
+                _stat = os.stat(_str_path_file)
+                _str_state = "%s:%s" % (_stat.st_mtime, _stat.st_size)
+            except OSError:
+                _str_state = "missing"
+            _hash.update("\n%s=%s" % (_str_path_file, _str_state))
+        return _hash.hexdigest()
+
+    def lookup(self, str_name_validation, dict_params):
+        """
+        Checks whether validation already succeeded in unchanged environment.
+
+        :param str_name_validation: string - validation name.
+        :param dict_params: dict - configuration params validation depends on.
+        :return: bool - True (validation can be skipped), False (validation should be performed).
+        """
+        with self._lock:
+            dict_entry = self._dict_entries.get(str_name_validation)
+        if dict_entry is None:
+            return False
+        if dict_entry.get('fingerprint') != self._get_fingerprint(dict_entry.get('files', []), dict_params):
+            self.logger.debug("Environment of %s validation is changed.", str_name_validation)
+            return False
+        self.logger.debug("%s validation is cached.", str_name_validation)
+        return True
+
+    def store(self, str_name_validation, dict_params, list_paths_files):
+        """
+        Stores succeeded validation.
+
+        :param str_name_validation: string - validation name.
+        :param dict_params: dict - configuration params validation depends on.
+        :param list_paths_files: list - paths of files and directories validation depends on.
+        :return: None (cache file will be updated).
+        """
+        list_paths_files = [str(_str_path_file) for _str_path_file in list_paths_files]
+        dict_entry = {'files': list_paths_files,
+                      'fingerprint': self._get_fingerprint(list_paths_files, dict_params)}
+        with self._lock:
+            self._dict_entries[str_name_validation] = dict_entry
+            self._save()
+        self.logger.debug("%s validation is stored in cache.", str_name_validation)
+
+
+_validation_cache = None        # validation cache shared by all validators
+_lock_validation_cache = Lock()
+
+
+def get_validation_cache():
+    """
+    Returns validation cache shared by all validators.
+
+    :return: ValidationCache - cache instance.
+    """
+    global _validation_cache
+
+    with _lock_validation_cache:
+        if _validation_cache is None:
+            _validation_cache = ValidationCache()
+        return _validation_cache